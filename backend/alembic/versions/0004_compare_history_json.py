@@ -0,0 +1,39 @@
+"""Rewrite legacy compare history results as JSON
+
+Revision ID: 0004_compare_history_json
+Revises: 0003_add_pdf_storage
+Create Date: 2026-10-15 10:00:00.000000
+
+"""
+import ast
+from alembic import op
+import orjson
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '0004'
+down_revision = '0003'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    """Convert result_json rows written with str(dict) to real JSON"""
+    conn = op.get_bind()
+    rows = conn.execute(sa.text(
+        "SELECT id, result_json FROM compare_history WHERE result_json NOT LIKE '{\"%' AND result_json <> '{}'"
+    )).fetchall()
+    for row_id, result_json in rows:
+        try:
+            result = ast.literal_eval(result_json)
+            converted = orjson.dumps(result, option=orjson.OPT_NON_STR_KEYS).decode() if isinstance(result, dict) else "{}"
+        except (ValueError, SyntaxError, TypeError, orjson.JSONEncodeError):
+            # Reprs of non-literal values (datetimes, objects) cannot be recovered
+            converted = "{}"
+        conn.execute(
+            sa.text("UPDATE compare_history SET result_json = :result_json WHERE id = :id"),
+            {"result_json": converted, "id": row_id},
+        )
+
+def downgrade():
+    """The original repr text is not kept; JSON rows read fine on older code"""
+    pass
@@ -5,6 +5,10 @@ import os
 import json
 import secrets
 import hashlib
+import hmac
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 from pathlib import Path
@@ -17,14 +21,23 @@ logger = logging.getLogger(__name__)
 class APIKeyManager:
     """Secure API key rotation and management"""
     
-    def __init__(self, storage_path: str = "api_keys.enc"):
+    def __init__(self, storage_path: str = "api_keys.enc", key_path: str = "api_key_encryption.key",
+                 validation_cache_size: int = 1024):
         self.storage_path = Path(storage_path)
+        self.key_path = Path(key_path)
         self.encryption_key = self._get_or_create_encryption_key()
         self.fernet = Fernet(self.encryption_key)
+        # Successful validations by HMAC of the key: (monotonic time, key hash, metadata)
+        self._validation_cache: "OrderedDict[bytes, Tuple[float, str, Dict]]" = OrderedDict()
+        self._validation_cache_size = validation_cache_size
+        self._cache_salt = secrets.token_bytes(32)
+        # Usage counted on cache hits and not yet written: key hash -> (count, last used)
+        self._unsaved_usage: Dict[str, Tuple[int, str]] = {}
+        self._cache_lock = threading.Lock()
         
     def _get_or_create_encryption_key(self) -> bytes:
         """Get or create encryption key for API key storage"""
-        key_file = Path("api_key_encryption.key")
+        key_file = self.key_path
         
         if key_file.exists():
             with open(key_file, "rb") as f:
@@ -48,10 +61,17 @@ class APIKeyManager:
                 encrypted_data = f.read()
             
             decrypted_data = self.fernet.decrypt(encrypted_data)
-            return json.loads(decrypted_data.decode())
+            keys = json.loads(decrypted_data.decode())
         except Exception as e:
             logger.error(f"Failed to load API keys: {e}")
             return {}
+        
+        with self._cache_lock:
+            for key_hash, (count, last_used) in self._unsaved_usage.items():
+                if key_hash in keys:
+                    keys[key_hash]["usage_count"] = keys[key_hash].get("usage_count", 0) + count
+                    keys[key_hash]["last_used"] = last_used
+        return keys
     
     def _save_keys(self, keys: Dict) -> None:
         """Save encrypted API keys to storage"""
@@ -67,6 +87,42 @@ class APIKeyManager:
         except Exception as e:
             logger.error(f"Failed to save API keys: {e}")
             raise
+        
+        # The saved keys came from _load_keys, which folded in the unsaved usage
+        with self._cache_lock:
+            self._unsaved_usage.clear()
+    
+    def _cache_digest(self, api_key: str) -> bytes:
+        return hmac.new(self._cache_salt, api_key.encode(), hashlib.sha256).digest()
+    
+    def _cached_validation(self, digest: bytes) -> Optional[Dict]:
+        """Metadata of a recently validated, unexpired key with this use counted, or None"""
+        with self._cache_lock:
+            cached = self._validation_cache.get(digest)
+            if cached is None:
+                return None
+            validated_at, key_hash, key_data = cached
+            if time.monotonic() - validated_at >= settings.API_KEY_CACHE_TTL:
+                del self._validation_cache[digest]
+                return None
+            now = datetime.utcnow()
+            if now > datetime.fromisoformat(key_data["expires_at"]):
+                # Let the uncached path record the expiry
+                del self._validation_cache[digest]
+                return None
+            self._validation_cache.move_to_end(digest)
+            key_data["usage_count"] = key_data.get("usage_count", 0) + 1
+            key_data["last_used"] = now.isoformat()
+            count, _ = self._unsaved_usage.get(key_hash, (0, None))
+            self._unsaved_usage[key_hash] = (count + 1, key_data["last_used"])
+            return dict(key_data)
+    
+    def _remember_validation(self, digest: bytes, key_hash: str, key_data: Dict) -> None:
+        with self._cache_lock:
+            self._validation_cache[digest] = (time.monotonic(), key_hash, dict(key_data))
+            self._validation_cache.move_to_end(digest)
+            while len(self._validation_cache) > self._validation_cache_size:
+                self._validation_cache.popitem(last=False)
     
     def generate_api_key(self, service_name: str, expires_days: int = 90) -> str:
         """
@@ -137,6 +193,9 @@ class APIKeyManager:
         Returns:
             True if key was found and deactivated
         """
+        with self._cache_lock:
+            self._validation_cache.pop(self._cache_digest(api_key), None)
+        
         keys = self._load_keys()
         key_hash = hashlib.sha256(api_key.encode()).hexdigest()[:16]
         
@@ -159,6 +218,12 @@ class APIKeyManager:
         Returns:
             Tuple of (is_valid, key_metadata)
         """
+        digest = self._cache_digest(api_key)
+        if settings.API_KEY_CACHE_TTL > 0:
+            cached = self._cached_validation(digest)
+            if cached is not None:
+                return True, cached
+        
         keys = self._load_keys()
         key_hash = hashlib.sha256(api_key.encode()).hexdigest()[:16]
         
@@ -187,6 +252,8 @@ class APIKeyManager:
         keys[key_hash] = key_data
         self._save_keys(keys)
         
+        if settings.API_KEY_CACHE_TTL > 0:
+            self._remember_validation(digest, key_hash, key_data)
         return True, key_data
     
     def list_keys(self, service_name: Optional[str] = None) -> List[Dict]:
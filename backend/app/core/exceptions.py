@@ -60,6 +60,24 @@ class ErrorCode(Enum):
     SERVICE_UNAVAILABLE = "SYS_002"
     CONFIGURATION_ERROR = "SYS_003"
 
+# User-facing text per error code, built once rather than per exception
+_USER_MESSAGES = {
+    ErrorCode.AUTHENTICATION_FAILED: "Authentication failed. Please check your credentials.",
+    ErrorCode.INSUFFICIENT_PERMISSIONS: "You don't have permission to perform this action.",
+    ErrorCode.INVALID_TOKEN: "Your session has expired. Please log in again.",
+    ErrorCode.TOKEN_EXPIRED: "Your session has expired. Please log in again.",
+    ErrorCode.INVALID_INPUT: "The provided input is invalid. Please check your data.",
+    ErrorCode.MISSING_REQUIRED_FIELD: "Required information is missing. Please complete all fields.",
+    ErrorCode.INVALID_FILE_TYPE: "File type not supported. Please upload a valid file.",
+    ErrorCode.FILE_TOO_LARGE: "File is too large. Please upload a smaller file.",
+    ErrorCode.RECORD_NOT_FOUND: "The requested item could not be found.",
+    ErrorCode.DUPLICATE_RECORD: "This item already exists.",
+    ErrorCode.PDF_PROCESSING_ERROR: "Failed to process the PDF file. Please try again.",
+    ErrorCode.OPENAI_API_ERROR: "AI service temporarily unavailable. Please try again later.",
+    ErrorCode.RATE_LIMIT_EXCEEDED: "Too many requests. Please wait a moment and try again.",
+    ErrorCode.INTERNAL_SERVER_ERROR: "An internal error occurred. Please try again later.",
+}
+
 class InsuraIQException(Exception):
     """Base exception class for InsuraIQ application"""
     
@@ -82,23 +100,7 @@ class InsuraIQException(Exception):
     
     def _get_user_friendly_message(self) -> str:
         """Get user-friendly error message based on error code"""
-        user_messages = {
-            ErrorCode.AUTHENTICATION_FAILED: "Authentication failed. Please check your credentials.",
-            ErrorCode.INSUFFICIENT_PERMISSIONS: "You don't have permission to perform this action.",
-            ErrorCode.INVALID_TOKEN: "Your session has expired. Please log in again.",
-            ErrorCode.TOKEN_EXPIRED: "Your session has expired. Please log in again.",
-            ErrorCode.INVALID_INPUT: "The provided input is invalid. Please check your data.",
-            ErrorCode.MISSING_REQUIRED_FIELD: "Required information is missing. Please complete all fields.",
-            ErrorCode.INVALID_FILE_TYPE: "File type not supported. Please upload a valid file.",
-            ErrorCode.FILE_TOO_LARGE: "File is too large. Please upload a smaller file.",
-            ErrorCode.RECORD_NOT_FOUND: "The requested item could not be found.",
-            ErrorCode.DUPLICATE_RECORD: "This item already exists.",
-            ErrorCode.PDF_PROCESSING_ERROR: "Failed to process the PDF file. Please try again.",
-            ErrorCode.OPENAI_API_ERROR: "AI service temporarily unavailable. Please try again later.",
-            ErrorCode.RATE_LIMIT_EXCEEDED: "Too many requests. Please wait a moment and try again.",
-            ErrorCode.INTERNAL_SERVER_ERROR: "An internal error occurred. Please try again later.",
-        }
-        return user_messages.get(self.error_code, "An unexpected error occurred.")
+        return _USER_MESSAGES.get(self.error_code, "An unexpected error occurred.")
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert exception to dictionary for API response"""
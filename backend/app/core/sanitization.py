@@ -6,6 +6,7 @@ import html
 import unicodedata
 from typing import Optional, Any
 import logging
+from ..services.regex_engine import RE2_AVAILABLE, PatternSet, compile_pattern
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +31,26 @@ class InputSanitizer:
         r'\bDELETE\s+FROM\b',
         r'--\s*$',      # SQL comments
     ]
+    # Compiled once, on re2 where the pattern translates, so hostile input
+    # cannot make the tag and URL patterns backtrack. Clean text is screened
+    # in a single pass and skips the per-pattern loop entirely: by a re2 set
+    # when available, otherwise by one merged alternation
+    _DANGEROUS_RES = [compile_pattern(pattern, re.IGNORECASE | re.DOTALL) for pattern in DANGEROUS_PATTERNS]
+    _DANGEROUS_SET = PatternSet(DANGEROUS_PATTERNS, re.IGNORECASE | re.DOTALL)
+    _ANY_DANGEROUS_RE = re.compile(
+        '|'.join(f'(?:{pattern})' for pattern in DANGEROUS_PATTERNS), re.IGNORECASE | re.DOTALL
+    )
+    
+    # Characters replaced in filenames: shell/Windows-reserved ones and C0 controls
+    _FILENAME_TABLE = str.maketrans(dict.fromkeys('<>:"|?*' + ''.join(map(chr, range(0x20))), '_'))
+    
+    @classmethod
+    def _has_dangerous_pattern(cls, text: str) -> bool:
+        if RE2_AVAILABLE:
+            # The set reports re2 hits and every pattern it could not take
+            # (\b, $); those few are confirmed one by one
+            return any(cls._DANGEROUS_RES[index].search(text) for index in sorted(cls._DANGEROUS_SET.matching(text)))
+        return cls._ANY_DANGEROUS_RE.search(text) is not None
     
     @classmethod
     def sanitize_text(cls, text: Optional[str], max_length: int = 1000, allow_html: bool = False) -> str:
@@ -58,11 +79,13 @@ class InputSanitizer:
             text = text[:max_length]
             logger.warning(f"Text truncated to {max_length} characters")
         
-        # Check for dangerous patterns
-        for pattern in cls.DANGEROUS_PATTERNS:
-            if re.search(pattern, text, re.IGNORECASE | re.DOTALL):
-                logger.warning(f"Dangerous pattern detected and removed: {pattern}")
-                text = re.sub(pattern, '', text, flags=re.IGNORECASE | re.DOTALL)
+        # Check for dangerous patterns; removing one can expose the next, so
+        # they are still applied one after another once anything is found
+        if cls._has_dangerous_pattern(text):
+            for pattern, compiled in zip(cls.DANGEROUS_PATTERNS, cls._DANGEROUS_RES):
+                if compiled.search(text):
+                    logger.warning(f"Dangerous pattern detected and removed: {pattern}")
+                    text = compiled.sub('', text)
         
         # HTML escape if not allowing HTML
         if not allow_html:
@@ -96,7 +119,7 @@ class InputSanitizer:
         filename = filename.split('/')[-1].split('\\')[-1]
         
         # Remove dangerous characters
-        filename = re.sub(r'[<>:"|?*\x00-\x1f]', '_', filename)
+        filename = filename.translate(cls._FILENAME_TABLE)
         
         # Remove dots at the beginning (hidden files) and end
         filename = filename.strip('. ')
@@ -15,6 +15,7 @@ class Settings(BaseSettings):
     # Security settings
     MAX_FILE_SIZE_MB: int = Field(default=10, description="Maximum file upload size in MB")
     ALLOWED_ORIGINS: str = Field(default="http://localhost:5173", description="Comma-separated list of allowed CORS origins")
+    API_KEY_CACHE_TTL: int = Field(default=60, description="Seconds a successful API key validation is reused; 0 disables the cache")
     
     # Database configuration
     SQLALCHEMY_DATABASE_URL: str = Field(default="postgresql+psycopg2://postgres:postgres@db:5432/insurance")
@@ -23,6 +24,17 @@ class Settings(BaseSettings):
     INSURER_API_BASE: str = Field(default="", description="Optional external insurer aggregator base URL")
     INSURER_API_KEY: str = Field(default="", description="Optional API key")
     OPENAI_API_KEY: str = Field(default="", description="OpenAI API key for AI analysis")
+    OPENAI_CACHE_MODE: str = Field(default="disabled", description="OpenAI response cache: enabled, replay, write_only or disabled; entries hold unencrypted policy data")
+    OPENAI_CACHE_PATH: str = Field(default="openai_cache.db", description="SQLite file holding cached OpenAI responses")
+    OPENAI_SEMANTIC_CACHE: bool = Field(default=False, description="Reuse AI results for near-duplicate documents via embeddings")
+    OPENAI_SEMANTIC_THRESHOLD: float = Field(default=0.98, description="Minimum embedding cosine similarity for a semantic cache hit")
+    OPENAI_SEMANTIC_MAX_ENTRIES: int = Field(default=2000, description="Newest documents kept per scope in the semantic cache")
+    OPENAI_MAX_CONCURRENCY: int = Field(default=32, description="Maximum in-flight OpenAI requests")
+    OPENAI_RPM: int = Field(default=500, description="OpenAI requests-per-minute limit")
+    OPENAI_TPM: int = Field(default=200000, description="OpenAI tokens-per-minute limit")
+    NLP_REGEX_WORKERS: int = Field(default=0, description="Processes for regex policy extraction; 0 means one per CPU")
+    NLP_EXTRACTOR_THREADS: int = Field(default=0, description="Threads per regex process for section extractors; 0 splits the CPUs between the regex processes")
+    PDF_EXTRACT_WORKERS: int = Field(default=0, description="Processes for PDF text extraction and OCR; 0 means one per CPU, at most 8")
     
     # Development mode
     LOCAL_DEV: bool = Field(default=False, description="If true, relax auth and allow SQLite DB override")
@@ -1,3 +1,4 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.exceptions import RequestValidationError
@@ -15,6 +16,7 @@ from .core.exceptions import (
     InsuraIQException
 )
 from .core.settings import settings
+from .services.worker_pool import shutdown_worker_pools
 
 # Initialize colorama for proper Windows console colors
 colorama.init(autoreset=True)
@@ -70,8 +72,14 @@ def setup_logging():
 # Setup logging
 setup_logging()
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Worker pools start on first use; stop their processes with the server
+    yield
+    shutdown_worker_pools()
+
 # Alembic is used for migrations, do not call Base.metadata.create_all here in production
-app = FastAPI(title="Insurance Advisor V6", root_path=settings.BASE_PATH)
+app = FastAPI(title="Insurance Advisor V6", root_path=settings.BASE_PATH, lifespan=lifespan)
 
 # Add exception handlers
 app.add_exception_handler(InsuraIQException, insuraiq_exception_handler)
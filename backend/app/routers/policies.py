@@ -1,15 +1,18 @@
 from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, Path
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse, Response
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from typing import List, Optional, Dict, Any
+import io
 import os
 import re
+import orjson
 import tempfile
 import shutil
 import logging
 import uuid
 from datetime import datetime
+from itertools import islice
 from pathlib import Path as PathLib
 from ..database import get_db
 from .. import models, schemas
@@ -30,6 +33,8 @@ from ..services.compare import comparison_service
 # Security constants
 MAX_FILE_SIZE = settings.MAX_FILE_SIZE_MB * 1024 * 1024
 ALLOWED_FILE_EXTENSIONS = {'.pdf', '.csv'}
+# Policies flushed to the database per round-trip during CSV import
+CSV_INSERT_BATCH_SIZE = 500
 
 def validate_file_upload(file: UploadFile) -> None:
     """Validate uploaded file for security"""
@@ -109,10 +114,13 @@ async def create_policy(
 async def list_policies(
     db: Session = Depends(get_db), 
     user: Dict[str, Any] = Depends(require_auth)
-) -> List[models.Policy]:
+) -> Response:
     """List all policies for the authenticated user"""
     try:
-        return db.query(models.Policy).filter(models.Policy.user_id == user['id']).all()
+        rows = db.query(models.Policy).filter(models.Policy.user_id == user['id']).all()
+        # Serialize the whole list at once instead of one model per row
+        policies = schemas.POLICY_OUT_LIST.validate_python(rows, from_attributes=True)
+        return Response(content=schemas.POLICY_OUT_LIST.dump_json(policies), media_type="application/json")
     except SQLAlchemyError as e:
         raise DatabaseException("Failed to retrieve policies", operation="list_policies")
 
@@ -140,14 +148,19 @@ async def upload_policies(file: UploadFile = File(...), db: Session = Depends(ge
     if not file.filename.endswith(".csv"):
         raise HTTPException(status_code=400, detail="Please upload a CSV file")
     
-    content = (await file.read()).decode("utf-8").splitlines()
-    check_file_size(content.encode())
+    payload = await file.read()
+    check_file_size(payload)
     
-    rows = nlp.parse_csv(content)
+    # Rows are parsed as they are read and inserted in batches, one transaction for the file
+    rows = nlp.parse_csv(io.StringIO(payload.decode("utf-8"), newline=""))
     created = []
-    for r in rows:
-        p = models.Policy(**r, user_id=user['id'])
-        db.add(p); db.commit(); db.refresh(p); created.append(p.id)
+    while True:
+        batch = [models.Policy(**r, user_id=user['id']) for r in islice(rows, CSV_INSERT_BATCH_SIZE)]
+        if not batch:
+            break
+        db.add_all(batch); db.flush()
+        created.extend(p.id for p in batch)
+    db.commit()
     return {"created_ids": created}
 
 @router.post("/import/pdf")
@@ -187,8 +200,8 @@ async def import_pdf(file: UploadFile = File(...), db: Session = Depends(get_db)
         
         # Extract data from PDF
         logger.info("Extracting data from PDF...")
-        data = pdf_import.parse_pdf_to_policy_fields(tmp_path, payload, file.filename)
-        logger.info(f"Data extracted: {data}")
+        data = await pdf_import.parse_pdf_to_policy_fields(tmp_path, payload, file.filename)
+        logger.info("Data extracted: %s", data)
         
         # Validate that we extracted some useful data
         if not any([data.get('owner_name'), data.get('insurer'), data.get('policy_number')]):
@@ -306,7 +319,7 @@ async def get_policy_pdf(policy_id: int, db: Session = Depends(get_db), user=Dep
         filename=policy.original_filename or f"policy_{policy_id}.pdf"
     )
 
-@router.post("/compare")
+@router.post("/compare", response_class=ORJSONResponse)
 async def compare_policies(policy_ids: List[int], db: Session = Depends(get_db), user=Depends(require_auth)):
     """Compare multiple policies with AI-powered analysis"""
     import logging
@@ -325,13 +338,14 @@ async def compare_policies(policy_ids: List[int], db: Session = Depends(get_db),
         history_record = models.CompareHistory(
             user_id=user['id'],
             policy_ids_csv=','.join(map(str, policy_ids)),
-            result_json=str(comparison_result)
+            result_json=orjson.dumps(comparison_result, option=orjson.OPT_NON_STR_KEYS).decode()
         )
         db.add(history_record)
         db.commit()
         
         logger.info(f"Comparison completed successfully for policies: {policy_ids}")
-        return comparison_result
+        # The service already returns plain JSON-ready data, skip jsonable_encoder
+        return ORJSONResponse(comparison_result)
         
     except ValueError as e:
         logger.error(f"Comparison validation error: {str(e)}")
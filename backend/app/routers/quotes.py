@@ -1,5 +1,8 @@
-import json
+import logging
+import orjson
+from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse, Response
 from sqlalchemy.orm import Session
 from ..database import get_db
 from .. import models, schemas
@@ -8,9 +11,23 @@ from ..services.recommendations import recommend
 from ..services.insurer_api import fetch_sample_quotes
 from ..core.auth_security import require_auth
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/advisor", tags=["advisor"])
 
-@router.post("/compare", response_model=schemas.CompareResult)
+def _stored_result_json(history_id: int, result_json: Optional[str]) -> bytes:
+    """Stored compare result JSON, spliced into the response without decoding.
+
+    Results are written with orjson.dumps of a dict; rows from before that are
+    converted by migration 0004, so anything else is reported as empty.
+    """
+    if not result_json or not result_json.startswith(('{"', '{}')):
+        if result_json:
+            logger.warning("Compare history %s does not hold a JSON object; returning it empty", history_id)
+        return b"{}"
+    return result_json.encode()
+
+@router.post("/compare", response_model=schemas.CompareResult, response_class=ORJSONResponse)
 def compare(req: schemas.CompareRequest, db: Session = Depends(get_db), user=Depends(require_auth)):
     ids = req.policy_ids
     rows = db.query(models.Policy).filter(models.Policy.id.in_(ids), models.Policy.user_id==user['id']).all()
@@ -22,9 +39,10 @@ def compare(req: schemas.CompareRequest, db: Session = Depends(get_db), user=Dep
     } for r in rows]
     result = compare_policies(data)
     # store history
-    hist = models.CompareHistory(user_id=user['id'], policy_ids_csv=",".join(map(str, ids)), result_json=json.dumps(result))
+    hist = models.CompareHistory(user_id=user['id'], policy_ids_csv=",".join(map(str, ids)), result_json=orjson.dumps(result).decode())
     db.add(hist); db.commit()
-    return {"summary": result["summary"], "table": result["table"]}
+    # Returned as a response directly so the result is not re-validated against CompareResult
+    return ORJSONResponse({"summary": result["summary"], "table": result["table"]})
 
 @router.get("/recommendations")
 def recommendations(db: Session = Depends(get_db), user=Depends(require_auth)):
@@ -40,15 +58,16 @@ def recommendations(db: Session = Depends(get_db), user=Depends(require_auth)):
 @router.get("/compare_history", response_model=list[schemas.CompareHistoryItem])
 def compare_history(db: Session = Depends(get_db), user=Depends(require_auth)):
     items = db.query(models.CompareHistory).filter(models.CompareHistory.user_id==user['id']).order_by(models.CompareHistory.created_at.desc()).limit(50).all()
+    # Results are stored as JSON already, splice them in without decoding
     out = []
     for it in items:
-        out.append({
+        head = orjson.dumps({
             "id": it.id,
             "policy_ids": [int(x) for x in it.policy_ids_csv.split(",") if x],
-            "result": json.loads(it.result_json or "{}"),
             "created_at": it.created_at
         })
-    return out
+        out.append(head[:-1] + b',"result":' + _stored_result_json(it.id, it.result_json) + b"}")
+    return Response(content=b"[" + b",".join(out) + b"]", media_type="application/json")
 
 @router.get("/quotes_demo")
 async def quotes_demo(product_type: str = Query(...), coverage_limit: float = Query(...), deductible: float = Query(0)):
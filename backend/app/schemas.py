@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 from typing import Optional, List, Any
 from datetime import datetime
 
@@ -59,8 +59,10 @@ class PolicyOut(PolicyBase):
     updated_at: Optional[datetime] = None
     pdf_file_path: Optional[str] = None
     pdf_file_size: Optional[int] = None
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+# Validates and serializes a whole list of policies in one pydantic-core call
+POLICY_OUT_LIST = TypeAdapter(List[PolicyOut])
 
 class CompareRequest(BaseModel):
     policy_ids: List[int]
@@ -4,13 +4,66 @@ Provides intelligent comparison between multiple insurance policies
 """
 
 import json
-from typing import List, Dict, Any, Optional
+import math
+from dataclasses import dataclass, field
+from operator import attrgetter
+from typing import List, Dict, Any, Optional, Set, Tuple
 from sqlalchemy.orm import Session
 from ..models import Policy
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Attributes read by _compare_basic_info, fetched in one call per policy
+_BASIC_INFO_FIELDS = attrgetter(
+    "owner_name", "insurer", "product_type", "policy_number",
+    "start_date", "end_date", "policy_language"
+)
+
+# Attributes read when building ComparisonAggregates
+_AGGREGATE_FIELDS = attrgetter("product_type", "insurer", "policy_language", "premium_monthly")
+
+@dataclass
+class ComparisonAggregates:
+    """Aggregates shared by the comparison matrix, summary and recommendations"""
+    product_types: Set[str] = field(default_factory=set)
+    insurers: Set[str] = field(default_factory=set)
+    languages: Set[str] = field(default_factory=set)
+    monthly_premiums: List[float] = field(default_factory=list)
+    lowest_monthly: float = 0
+    highest_monthly: float = 0
+    
+    @classmethod
+    def from_policies(cls, policies: List[Policy]) -> "ComparisonAggregates":
+        """Collect all aggregates in a single pass over the policies"""
+        aggregates = cls()
+        for product_type, insurer, language, premium in map(_AGGREGATE_FIELDS, policies):
+            aggregates.product_types.add(product_type)
+            aggregates.insurers.add(insurer)
+            aggregates.languages.add(language or "en")
+            aggregates.monthly_premiums.append(premium or 0)
+            # Premium range only considers policies with a premium set
+            if premium:
+                if not aggregates.lowest_monthly or premium < aggregates.lowest_monthly:
+                    aggregates.lowest_monthly = premium
+                if premium > aggregates.highest_monthly:
+                    aggregates.highest_monthly = premium
+        return aggregates
+
+def _min_max_any(values: List[float]) -> Tuple[float, float, bool]:
+    """Return min, max and whether any value is non-zero in a single pass (0, 0 when all are zero)"""
+    lowest, highest, has_value = math.inf, -math.inf, False
+    for value in values:
+        if value:
+            has_value = True
+        if value < lowest:
+            lowest = value
+        if value > highest:
+            highest = value
+    if not has_value:
+        return 0, 0, False
+    return lowest, highest, True
+
 class PolicyComparisonService:
     """Service for comparing multiple insurance policies"""
     
@@ -48,12 +101,14 @@ class PolicyComparisonService:
             if len(policies) < 2:
                 raise ValueError("At least 2 policies are required for comparison")
             
+            aggregates = ComparisonAggregates.from_policies(policies)
+            
             # Create comparison structure
             comparison = {
                 "policies": [self._serialize_policy_for_comparison(p) for p in policies],
-                "comparison_matrix": self._create_comparison_matrix(policies),
-                "summary": self._create_comparison_summary(policies),
-                "recommendations": self._generate_recommendations(policies)
+                "comparison_matrix": self._create_comparison_matrix(policies, aggregates),
+                "summary": self._create_comparison_summary(policies, aggregates),
+                "recommendations": self._generate_recommendations(aggregates)
             }
             
             return comparison
@@ -89,7 +144,7 @@ class PolicyComparisonService:
             "original_filename": policy.original_filename
         }
     
-    def _create_comparison_matrix(self, policies: List[Policy]) -> Dict[str, Any]:
+    def _create_comparison_matrix(self, policies: List[Policy], aggregates: ComparisonAggregates) -> Dict[str, Any]:
         """Create detailed comparison matrix"""
         matrix = {}
         
@@ -97,7 +152,7 @@ class PolicyComparisonService:
         matrix["basic_information"] = self._compare_basic_info(policies)
         
         # Financial comparison
-        matrix["financial_terms"] = self._compare_financial_terms(policies)
+        matrix["financial_terms"] = self._compare_financial_terms(policies, aggregates)
         
         # Coverage comparison
         matrix["coverage_comparison"] = self._compare_coverage_details(policies)
@@ -109,16 +164,24 @@ class PolicyComparisonService:
     
     def _compare_basic_info(self, policies: List[Policy]) -> Dict[str, Any]:
         """Compare basic policy information"""
+        owners, insurers, types, numbers, periods, languages = [], [], [], [], [], []
+        
+        # Single pass over the policies, fetching all attributes at once
+        for owner, insurer, product_type, number, start, end, language in map(_BASIC_INFO_FIELDS, policies):
+            owners.append(owner)
+            insurers.append(insurer)
+            types.append(product_type)
+            numbers.append(number)
+            periods.append(f"{start} to {end}" if start and end else "Not specified")
+            languages.append(language or "en")
+        
         comparison = {
-            "policy_holders": [p.owner_name for p in policies],
-            "insurers": [p.insurer for p in policies],
-            "policy_types": [p.product_type for p in policies],
-            "policy_numbers": [p.policy_number for p in policies],
-            "coverage_periods": [
-                f"{p.start_date} to {p.end_date}" if p.start_date and p.end_date 
-                else "Not specified" for p in policies
-            ],
-            "languages": [p.policy_language or "en" for p in policies]
+            "policy_holders": owners,
+            "insurers": insurers,
+            "policy_types": types,
+            "policy_numbers": numbers,
+            "coverage_periods": periods,
+            "languages": languages
         }
         
         # Add analysis
@@ -130,22 +193,25 @@ class PolicyComparisonService:
         
         return comparison
     
-    def _compare_financial_terms(self, policies: List[Policy]) -> Dict[str, Any]:
+    def _compare_financial_terms(self, policies: List[Policy], aggregates: ComparisonAggregates) -> Dict[str, Any]:
         """Compare financial aspects of policies"""
         comparison = {
-            "monthly_premiums": [p.premium_monthly or 0 for p in policies],
+            "monthly_premiums": aggregates.monthly_premiums,
             "annual_premiums": [p.premium_annual or 0 for p in policies], 
             "deductibles": [p.deductible or 0 for p in policies],
             "coverage_limits": [p.coverage_limit or 0 for p in policies]
         }
         
         # Add financial analysis
+        cheapest_monthly, most_expensive_monthly, _ = _min_max_any(comparison["monthly_premiums"])
+        lowest_deductible, _, _ = _min_max_any(comparison["deductibles"])
+        _, highest_coverage_limit, _ = _min_max_any(comparison["coverage_limits"])
         comparison["analysis"] = {
-            "cheapest_monthly": min(comparison["monthly_premiums"]) if any(comparison["monthly_premiums"]) else 0,
-            "most_expensive_monthly": max(comparison["monthly_premiums"]) if any(comparison["monthly_premiums"]) else 0,
-            "lowest_deductible": min(comparison["deductibles"]) if any(comparison["deductibles"]) else 0,
-            "highest_coverage_limit": max(comparison["coverage_limits"]) if any(comparison["coverage_limits"]) else 0,
-            "cost_difference_monthly": max(comparison["monthly_premiums"]) - min(comparison["monthly_premiums"]) if any(comparison["monthly_premiums"]) else 0
+            "cheapest_monthly": cheapest_monthly,
+            "most_expensive_monthly": most_expensive_monthly,
+            "lowest_deductible": lowest_deductible,
+            "highest_coverage_limit": highest_coverage_limit,
+            "cost_difference_monthly": most_expensive_monthly - cheapest_monthly
         }
         
         return comparison
@@ -279,32 +345,31 @@ class PolicyComparisonService:
         
         return unique
     
-    def _create_comparison_summary(self, policies: List[Policy]) -> Dict[str, Any]:
+    def _create_comparison_summary(self, policies: List[Policy], aggregates: ComparisonAggregates) -> Dict[str, Any]:
         """Create high-level comparison summary"""
         return {
             "total_policies": len(policies),
-            "policy_types": list(set(p.product_type for p in policies)),
-            "insurers": list(set(p.insurer for p in policies)),
-            "languages": list(set(p.policy_language or "en" for p in policies)),
+            "policy_types": list(aggregates.product_types),
+            "insurers": list(aggregates.insurers),
+            "languages": list(aggregates.languages),
             "date_range": {
                 "earliest_start": min((p.start_date for p in policies if p.start_date), default=None),
                 "latest_end": max((p.end_date for p in policies if p.end_date), default=None)
             },
             "premium_range": {
-                "lowest_monthly": min((p.premium_monthly for p in policies if p.premium_monthly), default=0),
-                "highest_monthly": max((p.premium_monthly for p in policies if p.premium_monthly), default=0)
+                "lowest_monthly": aggregates.lowest_monthly,
+                "highest_monthly": aggregates.highest_monthly
             }
         }
     
-    def _generate_recommendations(self, policies: List[Policy]) -> List[str]:
+    def _generate_recommendations(self, aggregates: ComparisonAggregates) -> List[str]:
         """Generate comparison recommendations"""
         recommendations = []
         
         # Premium comparison
-        monthly_premiums = [p.premium_monthly for p in policies if p.premium_monthly]
-        if monthly_premiums:
-            min_premium = min(monthly_premiums)
-            max_premium = max(monthly_premiums)
+        if aggregates.highest_monthly:
+            min_premium = aggregates.lowest_monthly
+            max_premium = aggregates.highest_monthly
             if max_premium > min_premium * 1.5:  # More than 50% difference
                 recommendations.append(f"Significant premium difference detected: ${min_premium:.2f} vs ${max_premium:.2f} monthly")
         
@@ -312,13 +377,11 @@ class PolicyComparisonService:
         recommendations.append("Review coverage details for gaps and overlaps")
         
         # Language considerations
-        languages = set(p.policy_language or "en" for p in policies)
-        if len(languages) > 1:
+        if len(aggregates.languages) > 1:
             recommendations.append("Policies are in different languages - ensure you understand all terms")
         
         # Insurer diversity
-        insurers = set(p.insurer for p in policies)
-        if len(insurers) == 1:
+        if len(aggregates.insurers) == 1:
             recommendations.append("All policies are with the same insurer - consider diversifying for risk management")
         
         return recommendations
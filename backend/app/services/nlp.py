@@ -1,18 +1,772 @@
+import asyncio
+import copy
 import csv
-import json
+import hashlib
+import os
 import re
-from typing import List, Dict, Optional, Any
+import string
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Dict, FrozenSet, Iterator, Optional, Any, Match, Pattern, Sequence, Tuple
 from datetime import datetime
 import logging
-import openai
+import orjson
 from ..core.settings import settings
+from .openai_cache import openai_cache, semantic_cache
+from .token_bucket import TokenBucket
+from .worker_pool import WorkerPool
+from .regex_engine import RE2_AVAILABLE as _RE2_AVAILABLE, compile_pattern, re2, re2_syntax
+try:
+    import ahocorasick  # type: ignore  # optional keyword prefilter (pyahocorasick)
+    _AHOCORASICK_AVAILABLE = True
+except Exception:
+    _AHOCORASICK_AVAILABLE = False
 
-# Configure OpenAI client
-openai.api_key = settings.OPENAI_API_KEY
 logger = logging.getLogger(__name__)
 
+# Anchor keywords per compiled pattern: a match must contain one of them.
+# None means the pattern has no literal anchor and always has to run.
+_PATTERN_KEYWORDS: Dict[Any, Optional[FrozenSet[str]]] = {}
+# Python-syntax source of each compiled pattern; re2 objects report their translated form
+_PATTERN_SOURCE: Dict[Any, str] = {}
+# Characters that re.IGNORECASE folds onto ASCII letters but str.lower() does not
+_KEYWORD_FOLD = str.maketrans({'İ': 'i', 'ı': 'i', 'ſ': 's'})
+# Script a pattern's match must contain ('hebrew' or 'latin'), None when either may match
+_PATTERN_SCRIPT: Dict[Any, Optional[str]] = {}
+_SCRIPT_SETS = tuple(frozenset(s) for s in ((), ('hebrew',), ('latin',), ('hebrew', 'latin')))
+# Fused alternation -> {scripts present in the text: variant to run, None if nothing can match}
+_FUSED_VARIANTS: Dict[Any, Dict[FrozenSet[str], Optional[Pattern]]] = {}
+_HEBREW_CHAR_RE = re.compile(r'[\u0590-\u05FF]')
+_LATIN_CHAR_RE = re.compile(r'[a-zA-Z]')
+
+def _anchor_keywords(pattern: str) -> Optional[FrozenSet[str]]:
+    """Longest required literal word of each alternative in the pattern's leading group"""
+    body = re.sub(r'^\(\?[a-z]+\)', '', pattern)
+    if body.startswith('(?:'):
+        depth, index = 0, 0
+        while index < len(body):
+            char = body[index]
+            if char == '\\':
+                index += 1
+            elif char == '(':
+                depth += 1
+            elif char == ')':
+                depth -= 1
+                if depth == 0:
+                    break
+            index += 1
+        if body[index + 1:index + 2] in ('?', '*', '{'):
+            return None
+        lead = body[3:index]
+    elif body[:1].isalpha():
+        lead = re.split(r'[(\[|]', body, maxsplit=1)[0]
+        if '|' in body:
+            return None
+    else:
+        return None
+
+    keywords = set()
+    for alternative in _split_top_level(lead):
+        literal = re.sub(r'\(\?:[^()]*\)|\[[^\]]*\]|\\.', ' ', alternative)
+        literal = re.sub(r'[^\W\d_][?*]', ' ', literal)
+        words = re.findall(r'[^\W\d_]+', literal)
+        if not words:
+            return None
+        keywords.add(max(words, key=len).translate(_KEYWORD_FOLD).lower())
+    return frozenset(keywords)
+
+def _split_top_level(group: str) -> List[str]:
+    """Split a regex group body on '|' outside nested groups"""
+    parts, depth, start, index = [], 0, 0, 0
+    while index < len(group):
+        char = group[index]
+        if char == '\\':
+            index += 1
+        elif char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        elif char == '|' and depth == 0:
+            parts.append(group[start:index])
+            start = index + 1
+        index += 1
+    parts.append(group[start:])
+    return parts
+
+def _fold_pattern(pattern: str) -> str:
+    """Lowercase a pattern's ASCII letters, leaving escapes such as \\S and \\D alone"""
+    return re.sub(r'\\.|[A-Z]', lambda m: m.group() if len(m.group()) > 1 else m.group().lower(), pattern)
+
+def _compile_pattern(pattern: str, flags: str = '') -> Pattern:
+    """Compile with re2 when installed; patterns re2 cannot match identically fall back to re"""
+    keywords = _anchor_keywords(pattern)
+    if flags:
+        pattern = f'(?{flags}){pattern}'
+    compiled = compile_pattern(pattern)
+    _PATTERN_SOURCE[compiled] = pattern
+    _PATTERN_KEYWORDS[compiled] = keywords
+    _PATTERN_SCRIPT[compiled] = _keyword_script(keywords)
+    return compiled
+
+def _keyword_script(keywords: Optional[FrozenSet[str]]) -> Optional[str]:
+    """Script shared by every anchor keyword, so any match needs a letter of it"""
+    if not keywords:
+        return None
+    if all(_HEBREW_CHAR_RE.search(keyword) for keyword in keywords):
+        return 'hebrew'
+    if all(_LATIN_CHAR_RE.search(keyword) for keyword in keywords):
+        return 'latin'
+    return None
+
+def _compile(*patterns: str) -> Tuple[Pattern, ...]:
+    """Compile patterns once at import time; they run against _fold(text)"""
+    return tuple(_compile_pattern(_fold_pattern(pattern)) for pattern in patterns)
+
+def _compile_fields(*entries: Tuple[Any, ...]) -> Tuple[Tuple[Any, ...], ...]:
+    """Compile (pattern, field, ...) entries; field is the key a match is stored under"""
+    return tuple((_compile_pattern(_fold_pattern(pattern)), *rest) for pattern, *rest in entries)
+
+def _fuse(patterns: Sequence[Pattern]) -> Pattern:
+    """Join patterns built by _compile into one alternation; group g<i> marks patterns[i].
+
+    Variants leaving out the members that need a script missing from the text
+    are compiled alongside, keyed by the set of scripts the text contains.
+    """
+    fused = _compile_pattern(_alternation(patterns, range(len(patterns))))
+    variants = {}
+    for scripts in _SCRIPT_SETS:
+        kept = [index for index, pattern in enumerate(patterns) if _script_present(pattern, scripts)]
+        if len(kept) == len(patterns):
+            variants[scripts] = fused
+        elif kept:
+            variants[scripts] = _compile_pattern(_alternation(patterns, kept))
+        else:
+            variants[scripts] = None
+    _FUSED_VARIANTS[fused] = variants
+    return fused
+
+def _alternation(patterns: Sequence[Pattern], indexes: Sequence[int]) -> str:
+    return '|'.join(f'(?P<g{index}>{_PATTERN_SOURCE[patterns[index]]})' for index in indexes)
+
+def _script_present(pattern: Pattern, scripts: FrozenSet[str]) -> bool:
+    script = _PATTERN_SCRIPT[pattern]
+    return script is None or script in scripts
+
+def _search_by_priority(fused: Pattern, patterns: Sequence[Pattern], text: str) -> Optional[Tuple[int, Match]]:
+    """Return (index, match) for the first of patterns that matches anywhere in text.
+
+    A single pass of the fused alternation finds the best-ranked candidate.
+    Patterns ranked above it are still checked on their own, since an
+    overlapping lower-ranked match can hide them from the fused scan.
+    """
+    scripts = _scripts_in(text)
+    fused = _FUSED_VARIANTS[fused][scripts]
+    if fused is None:
+        return None
+    best = None
+    for match in fused.finditer(_fold(text)):
+        index = int(match.lastgroup[1:])
+        if best is None or index < best:
+            best = index
+            if best == 0:
+                break
+    if best is None:
+        return None
+    for index in range(best + 1):
+        if not _script_present(patterns[index], scripts):
+            continue
+        match = _search(patterns[index], text)
+        if match:
+            return index, match
+    return None
+
+# Basic information
+_POLICY_NUMBER_PATTERNS = _compile(
+    r'(?:Policy\s*(?:Number|No\.?|#)):\s*([A-Z0-9\-]+)',
+    r'(?:פוליסה\s*(?:מספר|מס\.?)):\s*([A-Z0-9\-]+)',
+    r'(?:Certificate\s*(?:Number|No\.?)):\s*([A-Z0-9\-]+)',
+    r'(?:Contract\s*(?:Number|No\.?)):\s*([A-Z0-9\-]+)',
+    r'(?:Policy\s*ID):\s*([A-Z0-9\-]+)',
+    r'(?:Reference\s*(?:Number|No\.?)):\s*([A-Z0-9\-]+)',
+    r'([A-Z]{2,4}[\-]?[0-9]{6,12})',  # Pattern like ABC-123456789
+    r'([0-9]{8,15})',  # Numeric policy numbers
+)
+
+_INSURER_PATTERNS = _compile(
+    # Major US insurers
+    r'(State Farm|Geico|Progressive|Allstate|Farmers|USAA|Liberty Mutual|Nationwide)',
+    r'(American Family|Auto-Owners|Amica|Erie|Travelers|Hartford|Chubb)',
+    # Major Israeli insurers
+    r'(הפניקס|פניקס|Phoenix|הראל|Harel|כלל|Clal|מנורה מבטחים|Menorah|ביטוח ישיר|Bituach Yashir)',
+    r'(מגדל|Migdal|אי.די.איי|IDB|שומרה|Shomera|איילון|Ayalon|הכשרה|Hachshara)',
+    # International insurers
+    r'(AXA|Allianz|Zurich|MetLife|Prudential|AIG|Munich Re|Swiss Re)',
+    r'(Aviva|RSA|Admiral|Direct Line|Churchill|Hastings|More Than)',
+    # Generic patterns
+    r'([A-Z][a-z]+\s+Insurance\s+(?:Company|Corp|Group|Inc)?)',
+    r'([A-Z][a-z]+\s+Assurance\s+(?:Company|Corp|Group)?)',
+    r'(חברת\s+[א-ת\s]+(?:לביטוח|ביטוח))',
+)
+
+_HOLDER_PATTERNS = _compile(
+    r'(?:Policy\s*Holder|Named\s*Insured|Insured\s*Person):\s*([^\n\r]{3,50})',
+    r'(?:Policyholder|Policy\s*Owner):\s*([^\n\r]{3,50})',
+    r'(?:בעל\s*הפוליסה|מבוטח|בעל\s*הביטוח):\s*([^\n\r]{3,50})',
+    r'(?:Customer\s*Name|Client\s*Name):\s*([^\n\r]{3,50})',
+    r'(?:Insured\s*Name|Member\s*Name):\s*([^\n\r]{3,50})',
+    r'(?:First\s*Named\s*Insured):\s*([^\n\r]{3,50})',
+)
+
+_AGENT_PATTERNS = _compile(
+    r'(?:Agent|Broker|Producer):\s*([^\n\r]{3,50})',
+    r'(?:סוכן|מתווך):\s*([^\n\r]{3,50})',
+    r'(?:Agent\s*Name|Broker\s*Name):\s*([^\n\r]{3,50})',
+    r'(?:Licensed\s*Agent):\s*([^\n\r]{3,50})',
+)
+
+_PRODUCT_TYPE_PATTERNS = {
+    'auto': _compile(
+        r'(?:Auto|Vehicle|Car|Motor|Automobile)\s*(?:Insurance|Policy|Coverage)',
+        r'(?:ביטוח\s*רכב|רכב\s*ביטוח)',
+        r'Personal\s*Auto\s*Policy',
+        r'Commercial\s*Auto\s*Policy',
+    ),
+    'home': _compile(
+        r'(?:Home|House|Property|Dwelling)\s*(?:Insurance|Policy|Coverage)',
+        r'(?:ביטוח\s*בית|בית\s*ביטוח|ביטוח\s*דירה)',
+        r'Homeowners\s*Policy',
+        r'Renters\s*Insurance',
+    ),
+    'health': _compile(
+        r'(?:Health|Medical|Healthcare)\s*(?:Insurance|Policy|Coverage)',
+        r'(?:ביטוח\s*בריאות|בריאות\s*ביטוח)',
+        r'Major\s*Medical',
+        r'Group\s*Health',
+    ),
+    'life': _compile(
+        r'(?:Life|Term\s*Life|Whole\s*Life)\s*(?:Insurance|Policy)',
+        r'(?:ביטוח\s*חיים|חיים\s*ביטוח)',
+        r'Universal\s*Life',
+        r'Variable\s*Life',
+    ),
+    'business': _compile(
+        r'(?:Business|Commercial|General\s*Liability)\s*(?:Insurance|Policy)',
+        r'(?:ביטוח\s*עסקי|עסקי\s*ביטוח)',
+        r'Professional\s*Liability',
+        r'Workers\s*Compensation',
+    ),
+}
+_PRODUCT_TYPES = tuple(t for t, patterns in _PRODUCT_TYPE_PATTERNS.items() for _ in patterns)
+_ALL_PRODUCT_TYPE_PATTERNS = tuple(p for patterns in _PRODUCT_TYPE_PATTERNS.values() for p in patterns)
+
+# Financial information (multiple currencies and formats)
+_PREMIUM_PATTERNS = _compile_fields(
+    (r'(?:Annual\s*Premium|Yearly\s*Premium):\s*[$₪€£¥]?([\d,]+\.?\d*)', 'annual'),
+    (r'(?:Monthly\s*Premium|Monthly\s*Payment):\s*[$₪€£¥]?([\d,]+\.?\d*)', 'monthly'),
+    (r'(?:Total\s*Premium|Premium\s*Amount):\s*[$₪€£¥]?([\d,]+\.?\d*)', 'total'),
+    (r'(?:פרמיה\s*שנתית|פרמיה\s*חודשית):\s*[$₪€£¥]?([\d,]+\.?\d*)', 'annual'),
+    (r'(?:Premium\s*Due):\s*[$₪€£¥]?([\d,]+\.?\d*)', 'total'),
+    (r'(?:Policy\s*Premium):\s*[$₪€£¥]?([\d,]+\.?\d*)', 'total'),
+)
+
+_DEDUCTIBLE_PATTERNS = _compile_fields(
+    (r'(?:Deductible|Deductible\s*Amount):\s*[$₪€£¥]?([\d,]+\.?\d*)', 'deductible'),
+    (r'(?:Self\s*Insured\s*Retention):\s*[$₪€£¥]?([\d,]+\.?\d*)', 'deductible'),
+    (r'(?:השתתפות\s*עצמית):\s*[$₪€£¥]?([\d,]+\.?\d*)', 'deductible'),
+    (r'(?:Collision\s*Deductible):\s*[$₪€£¥]?([\d,]+\.?\d*)', 'collision_deductible'),
+    (r'(?:Comprehensive\s*Deductible):\s*[$₪€£¥]?([\d,]+\.?\d*)', 'comprehensive_deductible'),
+)
+
+_LIMIT_PATTERNS = _compile_fields(
+    (r'(?:Coverage\s*Limit|Policy\s*Limit|Maximum\s*Coverage):\s*[$₪€£¥]?([\d,]+\.?\d*)', 'coverage_limit'),
+    (r'(?:Liability\s*Limit|Per\s*Occurrence\s*Limit):\s*[$₪€£¥]?([\d,]+\.?\d*)', 'liability_limit'),
+    (r'(?:Aggregate\s*Limit|Annual\s*Aggregate):\s*[$₪€£¥]?([\d,]+\.?\d*)', 'aggregate_limit'),
+    (r'(?:Sum\s*Insured|Insured\s*Amount):\s*[$₪€£¥]?([\d,]+\.?\d*)', 'coverage_limit'),
+    (r'(?:סכום\s*ביטוח|גבול\s*כיסוי):\s*[$₪€£¥]?([\d,]+\.?\d*)', 'coverage_limit'),
+)
+
+# Coverage details
+_GENERAL_COVERAGE_PATTERNS = _compile(
+    r'([A-Za-z\s]+(?:Coverage|Protection|Benefit)):\s*[$₪€£¥]?([\d,]+\.?\d*)',
+    r'([A-Za-z\s]+(?:Limit|Maximum)):\s*[$₪€£¥]?([\d,]+\.?\d*)',
+    r'([א-ת\s]+(?:כיסוי|הגנה|הטבה)):\s*[$₪€£¥]?([\d,]+\.?\d*)',
+)
+
+# (pattern, key, split): a second captured amount stores <split>_per_person and <split>_per_accident instead
+_AUTO_COVERAGE_PATTERNS = _compile_fields(
+    (r'(?:Bodily\s*Injury\s*Liability):\s*[$₪€£¥]?([\d,]+\.?\d*)(?:/[$₪€£¥]?([\d,]+\.?\d*))?', 'bodily_injury_liability', 'bodily_injury'),
+    (r'(?:Property\s*Damage\s*Liability):\s*[$₪€£¥]?([\d,]+\.?\d*)', 'property_damage_liability', None),
+    (r'(?:Collision\s*Coverage):\s*[$₪€£¥]?([\d,]+\.?\d*)', 'collision_coverage', None),
+    (r'(?:Comprehensive\s*Coverage):\s*[$₪€£¥]?([\d,]+\.?\d*)', 'comprehensive_coverage', None),
+    (r'(?:Uninsured\s*Motorist):\s*[$₪€£¥]?([\d,]+\.?\d*)', 'uninsured_motorist', None),
+    (r'(?:Personal\s*Injury\s*Protection|PIP):\s*[$₪€£¥]?([\d,]+\.?\d*)', 'personal_injury_protection', None),
+    (r'(?:Medical\s*Payments):\s*[$₪€£¥]?([\d,]+\.?\d*)', 'medical_payments', None),
+    (r'(?:Rental\s*Reimbursement):\s*[$₪€£¥]?([\d,]+\.?\d*)', 'rental_reimbursement', None),
+    (r'(?:Towing\s*and\s*Labor):\s*[$₪€£¥]?([\d,]+\.?\d*)', 'towing_and_labor', None),
+)
+
+_HOME_COVERAGE_PATTERNS = _compile_fields(
+    (r'(?:Dwelling\s*Coverage|Coverage\s*A):\s*[$₪€£¥]?([\d,]+\.?\d*)', 'dwelling_coverage'),
+    (r'(?:Other\s*Structures|Coverage\s*B):\s*[$₪€£¥]?([\d,]+\.?\d*)', 'other_structures'),
+    (r'(?:Personal\s*Property|Coverage\s*C):\s*[$₪€£¥]?([\d,]+\.?\d*)', 'personal_property'),
+    (r'(?:Loss\s*of\s*Use|Coverage\s*D):\s*[$₪€£¥]?([\d,]+\.?\d*)', 'loss_of_use'),
+    (r'(?:Personal\s*Liability|Coverage\s*E):\s*[$₪€£¥]?([\d,]+\.?\d*)', 'personal_liability'),
+    (r'(?:Medical\s*Payments|Coverage\s*F):\s*[$₪€£¥]?([\d,]+\.?\d*)', 'medical_payments'),
+    (r'(?:Water\s*Damage|Flood\s*Coverage):\s*[$₪€£¥]?([\d,]+\.?\d*)', 'water_damage'),
+    (r'(?:Fire\s*Coverage|Fire\s*Damage):\s*[$₪€£¥]?([\d,]+\.?\d*)', 'fire_coverage'),
+    (r'(?:Theft\s*Coverage|Burglary\s*Coverage):\s*[$₪€£¥]?([\d,]+\.?\d*)', 'theft_coverage'),
+)
+
+# Policy terms
+_PERIOD_PATTERNS = _compile_fields(
+    (r'(?:Policy\s*Period|Coverage\s*Period|Term):\s*([0-9/\-\.]{8,12})\s*(?:to|through|[\-–])\s*([0-9/\-\.]{8,12})', 'range'),
+    (r'(?:Effective\s*Date):\s*([0-9/\-\.]{8,12})', 'start_date'),
+    (r'(?:Expiration\s*Date|Expires):\s*([0-9/\-\.]{8,12})', 'end_date'),
+    (r'(?:תקופת\s*הביטוח):\s*([0-9/\-\.]{8,12})\s*(?:עד|ל)\s*([0-9/\-\.]{8,12})', 'range'),
+)
+
+_RENEWAL_PATTERNS = _compile_fields(
+    (r'(?:Renewal|Auto[\-\s]*Renewal):\s*([^\n\r]{5,50})', 'renewal_terms'),
+    (r'(?:Cancellation\s*Notice):\s*([^\n\r]{5,50})', 'cancellation_notice'),
+    (r'(?:חידוש):\s*([^\n\r]{5,50})', 'renewal_terms'),
+)
+
+_BENEFICIARY_PATTERNS = _compile_fields(
+    (r'(?:Primary\s*Beneficiary|Beneficiary):\s*([^\n\r]{3,50})', 'primary_beneficiary'),
+    (r'(?:Secondary\s*Beneficiary|Contingent\s*Beneficiary):\s*([^\n\r]{3,50})', 'secondary_beneficiary'),
+    (r'(?:מוטב|מוטב\s*ראשי):\s*([^\n\r]{3,50})', None),
+    (r'(?:Spouse|Partner):\s*([^\n\r]{3,50})', 'spouse'),
+    (r'(?:Children|Dependents):\s*([^\n\r]{3,100})', 'children'),
+)
+
+_EXCLUSION_PATTERNS = _compile(
+    r'(?:Exclusions?|Not Covered|Excluded):\s*([^\n]+)',
+    r'(?:אינו מכוסה|החרגות):\s*([^\n]+)',  # Hebrew
+)
+
+_CLAIMS_PATTERNS = _compile(
+    r'(?:Claims?\s*(?:Phone|Number|Hotline)):\s*([0-9\-\(\)\s\+]+)',
+    r'(?:Report\s*a\s*Claim):\s*([0-9\-\(\)\s\+]+)',
+    r'(?:24\s*Hour\s*Claims?):\s*([0-9\-\(\)\s\+]+)',
+    r'(?:Emergency\s*Claims?):\s*([0-9\-\(\)\s\+]+)',
+)
+
+# Contact information
+_PHONE_PATTERNS = _compile(
+    r'(?:Phone|Tel|Telephone):\s*([0-9\-\(\)\s\+]{10,20})',
+    r'(?:Customer\s*Service):\s*([0-9\-\(\)\s\+]{10,20})',
+    r'(?:טלפון):\s*([0-9\-\(\)\s\+]{10,20})',
+)
+
+_EMAIL_PATTERNS = _compile(
+    r'(?:Email|E[\-\s]*mail):\s*([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})',
+    r'([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})',
+)
+
+_ADDRESS_PATTERNS = _compile(
+    r'(?:Address|Mailing\s*Address):\s*([^\n\r]{10,100})',
+    r'(?:כתובת):\s*([^\n\r]{10,100})',
+)
+
+# First-match-wins categories are scanned once through a fused alternation
+_POLICY_NUMBER_FUSED = _fuse(_POLICY_NUMBER_PATTERNS)
+_INSURER_FUSED = _fuse(_INSURER_PATTERNS)
+_HOLDER_FUSED = _fuse(_HOLDER_PATTERNS)
+_AGENT_FUSED = _fuse(_AGENT_PATTERNS)
+_PRODUCT_TYPE_FUSED = _fuse(_ALL_PRODUCT_TYPE_PATTERNS)
+_CLAIMS_FUSED = _fuse(_CLAIMS_PATTERNS)
+_CONTACT_FIELDS = (
+    ('phone', _PHONE_PATTERNS, _fuse(_PHONE_PATTERNS)),
+    ('email', _EMAIL_PATTERNS, _fuse(_EMAIL_PATTERNS)),
+    ('address', _ADDRESS_PATTERNS, _fuse(_ADDRESS_PATTERNS)),
+)
+
+_LEGAL_PATTERNS = _compile_fields(
+    (r'(?:License\s*(?:Number|No\.?)):\s*([A-Z0-9\-]+)', 'license_number'),
+    (r'(?:State\s*of\s*(?:Issue|Domicile)):\s*([A-Z]{2}|[A-Za-z\s]+)', 'state_of_issue'),
+    (r'(?:NAIC\s*(?:Number|Code)):\s*([0-9]+)', 'naic_number'),
+    (r'(?:Department\s*of\s*Insurance):\s*([^\n\r]{5,50})', None),
+)
+
+_PROVISION_PATTERNS = _compile(
+    r'(?:Special\s*Provisions?):\s*([^\n\r]{10,200})',
+    r'(?:Endorsements?):\s*([^\n\r]{10,200})',
+    r'(?:Riders?):\s*([^\n\r]{10,200})',
+    r'(?:Additional\s*Coverage):\s*([^\n\r]{10,200})',
+)
+
+_METADATA_PATTERNS = _compile_fields(
+    (r'(?:Document\s*(?:Date|Created)):\s*([0-9/\-\.]{8,12})', 'document_date'),
+    (r'(?:Issue\s*Date):\s*([0-9/\-\.]{8,12})', 'document_date'),
+    (r'(?:Version|Revision):\s*([0-9\.]+)', 'document_version'),
+    (r'(?:Form\s*(?:Number|Code)):\s*([A-Z0-9\-]+)', 'form_number'),
+)
+
+_RISK_PATTERNS = _compile_fields(
+    (r'(?:Risk\s*(?:Category|Class|Rating)):\s*([^\n\r]{3,30})', 'risk_category'),
+    (r'(?:Territory|Rating\s*Territory):\s*([^\n\r]{3,30})', 'territory'),
+    (r'(?:Experience\s*Rating):\s*([^\n\r]{3,30})', 'experience_rating'),
+    (r'(?:Safety\s*Rating):\s*([^\n\r]{3,30})', 'safety_rating'),
+)
+
+_PAYMENT_PATTERNS = _compile_fields(
+    (r'(?:Payment\s*(?:Schedule|Plan)):\s*([^\n\r]{5,50})', 'payment_schedule'),
+    (r'(?:Due\s*Date):\s*([0-9/\-\.]{8,12})', 'due_date'),
+    (r'(?:Payment\s*Method):\s*([^\n\r]{5,30})', 'payment_method'),
+    (r'(?:Installments?):\s*([^\n\r]{5,30})', 'installments'),
+)
+
+_RIDER_PATTERNS = _compile(
+    r'(?:Rider|Endorsement)\s*([A-Z0-9\-]+):\s*([^\n\r]{5,100})',
+    r'(?:Additional\s*Coverage)\s*([A-Z0-9\-]+):\s*([^\n\r]{5,100})',
+)
+
+# Policy-type specific information; amount fields are parsed as numbers
+_VEHICLE_PATTERNS = _compile_fields(
+    (r'(?:Year|Model\s*Year):\s*([0-9]{4})', 'year'),
+    (r'(?:Make|Manufacturer):\s*([A-Za-z\s]+)', 'make'),
+    (r'(?:Model):\s*([A-Za-z0-9\s\-]+)', 'model'),
+    (r'(?:VIN|Vehicle\s*ID):\s*([A-Z0-9]{17})', 'vin'),
+    (r'(?:License\s*Plate):\s*([A-Z0-9\-\s]+)', 'license_plate'),
+    (r'(?:Mileage|Odometer):\s*([\d,]+)', 'mileage'),
+)
+
+_PROPERTY_PATTERNS = _compile_fields(
+    (r'(?:Property\s*Address|Address):\s*([^\n\r]{10,100})', 'property_address'),
+    (r'(?:Year\s*Built|Construction\s*Year):\s*([0-9]{4})', 'year_built'),
+    (r'(?:Square\s*Feet|Sq\s*Ft):\s*([\d,]+)', 'square_feet'),
+    (r'(?:Construction\s*Type|Building\s*Type):\s*([A-Za-z\s]+)', 'construction_type'),
+    (r'(?:Roof\s*Type):\s*([A-Za-z\s]+)', 'roof_type'),
+    (r'(?:Foundation\s*Type):\s*([A-Za-z\s]+)', 'foundation_type'),
+    (r'(?:Number\s*of\s*Stories):\s*([0-9\.]+)', 'stories'),
+)
+
+_HEALTH_PATTERNS = _compile_fields(
+    (r'(?:Group\s*Number|Group\s*ID):\s*([A-Z0-9\-]+)', 'group_number'),
+    (r'(?:Member\s*ID|Subscriber\s*ID):\s*([A-Z0-9\-]+)', 'member_id'),
+    (r'(?:Plan\s*Type|Plan\s*Name):\s*([A-Za-z0-9\s\-]+)', 'plan_type'),
+    (r'(?:Network|Provider\s*Network):\s*([A-Za-z\s]+)', 'network'),
+    (r'(?:PCP|Primary\s*Care\s*Physician):\s*([A-Za-z\s,\.]+)', 'primary_care_physician'),
+    (r'(?:Copay|Co[\-\s]*pay):\s*\$?([\d,]+)', 'copay'),
+    (r'(?:Out[\-\s]*of[\-\s]*Pocket\s*Maximum):\s*\$?([\d,]+)', 'out_of_pocket_max'),
+)
+_HEALTH_AMOUNT_FIELDS = frozenset({'copay', 'out_of_pocket_max'})
+
+_LIFE_PATTERNS = _compile_fields(
+    (r'(?:Death\s*Benefit|Face\s*Amount):\s*\$?([\d,]+)', 'death_benefit'),
+    (r'(?:Cash\s*Value):\s*\$?([\d,]+)', 'cash_value'),
+    (r'(?:Policy\s*Type):\s*([A-Za-z\s]+)', 'policy_type'),
+    (r'(?:Premium\s*Mode):\s*([A-Za-z\s]+)', 'premium_mode'),
+    (r'(?:Dividend\s*Option):\s*([A-Za-z\s]+)', 'dividend_option'),
+    (r'(?:Loan\s*Value):\s*\$?([\d,]+)', 'loan_value'),
+)
+_LIFE_AMOUNT_FIELDS = frozenset({'death_benefit', 'cash_value', 'loan_value'})
+
+_BUSINESS_PATTERNS = _compile_fields(
+    (r'(?:Business\s*Name|Company\s*Name):\s*([^\n\r]{3,50})', 'business_name'),
+    (r'(?:Industry\s*Type|Business\s*Type):\s*([A-Za-z\s]+)', 'business_name'),
+    (r'(?:Number\s*of\s*Employees):\s*([\d,]+)', 'num_employees'),
+    (r'(?:Annual\s*Revenue|Gross\s*Revenue):\s*\$?([\d,]+)', 'annual_revenue'),
+    (r'(?:FEIN|Tax\s*ID):\s*([0-9\-]+)', 'tax_id'),
+    (r'(?:SIC\s*Code|NAICS\s*Code):\s*([0-9]+)', 'industry_code'),
+)
+_BUSINESS_AMOUNT_FIELDS = frozenset({'annual_revenue'})
+
+# Legacy helpers (_analyze_coverage, _extract_financial_details, ...)
+_COVERAGE_AMOUNT_PATTERNS = _compile(
+    r'([A-Za-z\s]+Coverage):\s*\$?([\d,]+)',
+    r'([A-Za-z\s]+Limit):\s*\$?([\d,]+)',
+    r'([A-Za-z\s]+Deductible):\s*\$?([\d,]+)',
+)
+
+_SIMPLE_PREMIUM_PATTERNS = _compile_fields(
+    (r'(?:Annual Premium|Total Premium):\s*\$?([\d,\.]+)', 'premium_annual'),
+    (r'(?:Monthly Premium):\s*\$?([\d,\.]+)', 'premium_monthly'),
+    (r'(?:דמי ביטוח שנתי):\s*₪?([\d,\.]+)', 'premium_annual'),  # Hebrew
+)
+
+_SIMPLE_DEDUCTIBLE_PATTERNS = _compile(
+    r'(?:Deductible|Self Risk):\s*\$?([\d,\.]+)',
+    r'(?:השתתפות עצמית):\s*₪?([\d,\.]+)',  # Hebrew
+)
+
+# (section header, section end): the terms run from the first header to the next end marker
+_TERMS_SECTIONS = tuple((_compile_pattern(_fold_pattern(header)), _compile_pattern(_fold_pattern(end))) for header, end in (
+    (r'(?:Terms and Conditions|General Conditions|Policy Conditions)', r'(?:Signatures?|End of Policy|Page \d+)'),
+    (r'(?:תנאי הפוליסה|תנאים כלליים)', r'(?:חתימות?|סוף הפוליסה|עמוד \d+)'),  # Hebrew
+))
+
+_BENEFIT_PATTERNS = _compile(
+    r'(?:Additional Benefits?|Riders?|Optional Coverage):\s*([^\n]+)',
+    r'(?:הטבות נוספות|כיסויים אופציונליים):\s*([^\n]+)',  # Hebrew
+)
+
+class _AmountChars(dict):
+    """str.translate table keeping only decimal digits (any script, as re's \\d) and '.'"""
+
+    def __missing__(self, codepoint: int) -> Optional[int]:
+        kept = codepoint if chr(codepoint).isdecimal() or codepoint == 46 else None
+        self[codepoint] = kept
+        return kept
+
+# Filled in lazily; translate then strips amounts in C without a regex pass
+_AMOUNT_CHARS = _AmountChars()
+
+@lru_cache(maxsize=2048)
+def _amount_value(amount_str: str) -> float:
+    """Amount string as a float, 0.0 when it holds no number; the same strings recur across sections"""
+    clean_amount = amount_str.translate(_AMOUNT_CHARS)
+    try:
+        return float(clean_amount) if clean_amount else 0.0
+    except ValueError:
+        return 0.0
+
+_ANCHOR_KEYWORDS = frozenset(k for keywords in _PATTERN_KEYWORDS.values() if keywords for k in keywords)
+if _AHOCORASICK_AVAILABLE:
+    _KEYWORD_AUTOMATON = ahocorasick.Automaton()
+    for _keyword in _ANCHOR_KEYWORDS:
+        _KEYWORD_AUTOMATON.add_word(_keyword, _keyword)
+    _KEYWORD_AUTOMATON.make_automaton()
+
+@lru_cache(maxsize=8)
+def _fold(text: str) -> str:
+    """Lowercased text the compiled patterns run on; computed once per document.
+
+    Folding keeps every character at its offset, so match spans on the folded
+    text slice the original text and captures keep their original case.
+    """
+    return text.translate(_KEYWORD_FOLD).lower()
+
+class _FoldedMatch:
+    """Match found in _fold(text) whose groups are read from the original text"""
+    __slots__ = ('_match', '_text')
+
+    def __init__(self, match: Match, text: str):
+        self._match = match
+        self._text = text
+
+    def group(self, index: int = 0) -> Optional[str]:
+        start, end = self._match.span(index)
+        return self._text[start:end] if start >= 0 else None
+
+def _search(pattern: Pattern, text: str) -> Optional[_FoldedMatch]:
+    """pattern.search() on the folded text"""
+    match = pattern.search(_fold(text))
+    return _FoldedMatch(match, text) if match else None
+
+def _found_value(pattern: Pattern, match: Match, text: str) -> Any:
+    """What findall() reports for one match, read from the original text"""
+    if pattern.groups == 0:
+        return text[match.start():match.end()]
+    values = tuple(
+        text[start:end] if start >= 0 else ''
+        for start, end in (match.span(index) for index in range(1, pattern.groups + 1))
+    )
+    return values[0] if pattern.groups == 1 else values
+
+def _findall(pattern: Pattern, text: str) -> List:
+    """pattern.findall() on the folded text, returning captures in their original case"""
+    return [_found_value(pattern, match, text) for match in pattern.finditer(_fold(text))]
+
+def _first_found(pattern: Pattern, text: str) -> Any:
+    """_findall(pattern, text)[0], stopping at the first match; None when nothing matches"""
+    match = pattern.search(_fold(text))
+    return _found_value(pattern, match, text) if match else None
+
+# Counting happens on the UTF-8 bytes, where C-level count/translate do the work.
+# ASCII letters are single bytes that never occur inside a multi-byte sequence;
+# U+0590-U+05FF encode as D6 90-BF and D7 80-BF, and D6 80-8F is Armenian
+_NON_LETTER_BYTES = bytes(b for b in range(256) if chr(b) not in string.ascii_letters)
+_ARMENIAN_UTF8_RE = re.compile(rb'\xd6[\x80-\x8f]')
+# Non-ASCII characters that _fold turns into ASCII letters (the last is the Kelvin sign)
+_FOLDS_TO_LATIN = ('İ', 'ı', 'ſ', '\u212a')
+
+@lru_cache(maxsize=8)
+def _script_counts(text: str) -> Tuple[int, int]:
+    """(Hebrew, ASCII Latin) letter counts, taken over the UTF-8 bytes of text"""
+    encoded = text.encode('utf-8', 'surrogatepass')
+    latin = len(encoded.translate(None, _NON_LETTER_BYTES))
+    hebrew = encoded.count(b'\xd7')
+    lead_d6 = encoded.count(b'\xd6')
+    if lead_d6:
+        hebrew += lead_d6 - len(_ARMENIAN_UTF8_RE.findall(encoded))
+    return hebrew, latin
+
+# The language ratio settles within a few thousand characters
+_LANGUAGE_SAMPLE_CHARS = 4096
+
+def _language_sample(text: str) -> str:
+    """Text to judge the document language on: all of it, or its opening and middle when long"""
+    if len(text) <= _LANGUAGE_SAMPLE_CHARS:
+        return text
+    half = _LANGUAGE_SAMPLE_CHARS // 2
+    middle = len(text) // 2
+    return text[:half] + text[middle:middle + half]
+
+@lru_cache(maxsize=8)
+def _scripts_in(text: str) -> FrozenSet[str]:
+    """Scripts with at least one letter in the folded text, checked once per document"""
+    hebrew, latin = _script_counts(text)
+    scripts = set()
+    if hebrew:
+        scripts.add('hebrew')
+    if latin or any(char in text for char in _FOLDS_TO_LATIN):
+        scripts.add('latin')
+    return frozenset(scripts)
+
+@lru_cache(maxsize=8)
+def _keywords_in(text: str) -> FrozenSet[str]:
+    """Anchor keywords present in text; cached so each extractor reuses one scan"""
+    folded = _fold(text)
+    if _AHOCORASICK_AVAILABLE:
+        return frozenset(keyword for _, keyword in _KEYWORD_AUTOMATON.iter(folded))
+    return frozenset(keyword for keyword in _ANCHOR_KEYWORDS if keyword in folded)
+
+def _prefilter(entries: Sequence, text: str) -> List:
+    """Keep pattern (or (pattern, field)) entries whose anchor keyword occurs in text"""
+    present = _keywords_in(text)
+    kept = []
+    for entry in entries:
+        keywords = _PATTERN_KEYWORDS[entry[0] if isinstance(entry, tuple) else entry]
+        if keywords is None or not keywords.isdisjoint(present):
+            kept.append(entry)
+    return kept
+
+_DEDUCTIBLE_AND_LIMIT_PATTERNS = _DEDUCTIBLE_PATTERNS + _LIMIT_PATTERNS
+
+# Tables read through _candidates. With re2 installed they share one pattern set,
+# so a single pass over the text reports every "Key: value" pattern that matches
+# and only those are searched again for their captures
+_SET_TABLES = (
+    _BENEFICIARY_PATTERNS, _LEGAL_PATTERNS, _METADATA_PATTERNS, _RISK_PATTERNS, _PAYMENT_PATTERNS,
+    _VEHICLE_PATTERNS, _PROPERTY_PATTERNS, _HEALTH_PATTERNS, _LIFE_PATTERNS, _BUSINESS_PATTERNS,
+    _PREMIUM_PATTERNS, _DEDUCTIBLE_AND_LIMIT_PATTERNS, _AUTO_COVERAGE_PATTERNS, _HOME_COVERAGE_PATTERNS,
+    _PERIOD_PATTERNS, _RENEWAL_PATTERNS, _PROVISION_PATTERNS, _RIDER_PATTERNS, _EXCLUSION_PATTERNS,
+    _BENEFIT_PATTERNS, _SIMPLE_PREMIUM_PATTERNS, _SIMPLE_DEDUCTIBLE_PATTERNS,
+)
+_SET_OFFSETS: Dict[int, int] = {}  # id(table) -> set index of its first entry
+_SET_UNSUPPORTED = set()  # patterns re2 cannot take; they are always searched
+_PATTERN_SET = None
+if _RE2_AVAILABLE:
+    _PATTERN_SET = re2.Set.SearchSet(re2.Options())
+    for _table in _SET_TABLES:
+        for _index, _entry in enumerate(_table):
+            _pattern = _entry[0] if isinstance(_entry, tuple) else _entry
+            _translated = re2_syntax(_PATTERN_SOURCE[_pattern])
+            try:
+                _set_index = _PATTERN_SET.Add(_translated)
+            except (re2.error, TypeError):
+                # A never-matching stand-in keeps set indices aligned with the table
+                _set_index = _PATTERN_SET.Add(r'[^\x00-\x{10ffff}]')
+                _SET_UNSUPPORTED.add(_pattern)
+            if _index == 0:
+                _SET_OFFSETS[id(_table)] = _set_index
+    _PATTERN_SET.Compile()
+
+@lru_cache(maxsize=8)
+def _set_matches(text: str) -> FrozenSet[int]:
+    """Indices of the set patterns that match anywhere in the folded text"""
+    return frozenset(_PATTERN_SET.Match(_fold(text)) or ())
+
+def _candidates(entries: Sequence, text: str) -> List:
+    """Entries of a pattern table that can match text: exact via the re2 set, else _prefilter"""
+    offset = _SET_OFFSETS.get(id(entries))
+    if offset is None:
+        return _prefilter(entries, text)
+    matched = _set_matches(text)
+    return [
+        entry for index, entry in enumerate(entries)
+        if offset + index in matched or (entry[0] if isinstance(entry, tuple) else entry) in _SET_UNSUPPORTED
+    ]
+
+# A document mentioning none of these is not worth an OpenAI request
+_INSURANCE_KEYWORDS = ("insurance", "policy", "premium", "פוליסה", "ביטוח")
+
+# Keys of per-document values (names, numbers, dates, contact details) that a
+# near-duplicate document's cached response must not supply
+_DOCUMENT_SPECIFIC_KEY_RE = re.compile(r'number|name|holder|(?:^|_)insured|date|effective|expir|phone|email|address|(?:^|_)vin(?:_|$)')
+
+# Top-level objects requested from the model; they match the regex section names
+_AI_SECTIONS = (
+    "basic_info", "financial_info", "coverage_details", "policy_terms",
+    "contact_info", "vehicle_info", "property_info", "legal_info",
+)
+_AI_INSTRUCTION = (
+    "Extract all policy information from {subject} as JSON with nested objects "
+    + ", ".join(_AI_SECTIONS)
+    + ". Give amounts as numbers and dates as YYYY-MM-DD."
+)
+
 class PolicyAnalyzer:
     """Enhanced policy analysis with GenAI capabilities"""
+
+    # Bump when the extraction prompt changes so cached responses are not reused
+    _PROMPT_VERSION = 2
+    _AI_MODEL = "gpt-4o-mini"
+    _AI_TEMPERATURE = 0.1
+    _AI_MAX_TOKENS = 2000
+    _AI_BATCH_SIZE = 4  # documents per batched extraction request
+    _AI_MIN_TEXT_LENGTH = 300  # shorter documents are left to the regex pass
+    _EMBEDDING_MODEL = "text-embedding-3-small"
+    _EMBEDDING_MAX_CHARS = 8000
+    # Standard section mapping between AI and regex results
+    _SECTION_MAPPINGS = {
+        "basic_info": ["basic_information", "policy_info", "general", "basic_info"],
+        "financial_info": ["financial_details", "financial", "costs", "financial_info"],
+        "coverage_details": ["coverage_details", "coverage", "coverages", "benefits"],
+        "contact_info": ["contact_information", "contact", "contacts", "contact_info"],
+        "vehicle_info": ["vehicle_information", "vehicle", "auto", "car"],
+        "property_info": ["property_information", "property", "real_estate", "home"],
+        "policy_terms": ["policy_terms", "terms", "conditions", "policy_conditions"],
+        "legal_info": ["legal_information", "legal", "regulatory", "compliance"]
+    }
+    _MAPPED_AI_SECTIONS = frozenset(key for keys in _SECTION_MAPPINGS.values() for key in keys)
+    # Result key -> extractor run on every document (coverage_details also takes the policy type)
+    _SECTION_EXTRACTORS = (
+        ("basic_info", "_extract_comprehensive_basic_info"),
+        ("financial_info", "_extract_comprehensive_financial_info"),
+        ("coverage_details", "_extract_comprehensive_coverage_details"),
+        ("policy_terms", "_extract_policy_terms"),
+        ("beneficiaries", "_extract_beneficiaries"),
+        ("exclusions", "_extract_exclusions"),
+        ("claims_info", "_extract_claims_information"),
+        ("contact_info", "_extract_contact_information"),
+        ("legal_info", "_extract_legal_information"),
+        ("special_provisions", "_extract_special_provisions"),
+        ("document_metadata", "_extract_document_metadata"),
+        ("risk_assessment", "_extract_risk_assessment"),
+        ("payment_schedule", "_extract_payment_schedule"),
+        ("riders_endorsements", "_extract_riders_and_endorsements"),
+    )
+    # Policy type -> (result key, extractor); only the matching extractor runs
+    _TYPE_SPECIFIC_EXTRACTORS = {
+        "auto": ("vehicle_info", "_extract_vehicle_information"),
+        "home": ("property_info", "_extract_property_information"),
+        "property": ("property_info", "_extract_property_information"),
+        "health": ("health_info", "_extract_health_information"),
+        "life": ("life_info", "_extract_life_insurance_information"),
+        "business": ("business_info", "_extract_business_information"),
+    }
+    # Extractors that return {} unless one of their patterns matches; skipped
+    # outright when the keyword scan rules out every pattern in the table
+    _EXTRACTOR_PATTERNS = {
+        "_extract_beneficiaries": _BENEFICIARY_PATTERNS,
+        "_extract_legal_information": _LEGAL_PATTERNS,
+        "_extract_special_provisions": _PROVISION_PATTERNS,
+        "_extract_document_metadata": _METADATA_PATTERNS,
+        "_extract_risk_assessment": _RISK_PATTERNS,
+        "_extract_payment_schedule": _PAYMENT_PATTERNS,
+        "_extract_riders_and_endorsements": _RIDER_PATTERNS,
+        "_extract_vehicle_information": _VEHICLE_PATTERNS,
+        "_extract_property_information": _PROPERTY_PATTERNS,
+        "_extract_health_information": _HEALTH_PATTERNS,
+        "_extract_life_insurance_information": _LIFE_PATTERNS,
+        "_extract_business_information": _BUSINESS_PATTERNS,
+    }
+    _ANALYSIS_SECTIONS = tuple(key for key, _ in _SECTION_EXTRACTORS) + (
+        "vehicle_info", "property_info", "health_info", "life_info", "business_info"
+    )
     
     def __init__(self):
         self.coverage_categories = [
@@ -33,58 +787,93 @@ class PolicyAnalyzer:
             "special_provisions"
         ]
         
-        # Initialize OpenAI client
-        if settings.OPENAI_API_KEY:
-            self.openai_client = openai.OpenAI(api_key=settings.OPENAI_API_KEY)
-            self.ai_enabled = True
-        else:
-            self.openai_client = None
-            self.ai_enabled = False
+        # The OpenAI client is created on first use; importing openai is slow
+        self._openai_key = settings.OPENAI_API_KEY
+        self.ai_enabled = bool(self._openai_key)
+        self.openai_client = None
+        if not self.ai_enabled:
             logger.warning("OpenAI API key not found. Falling back to regex-only parsing.")
+        
+        # Bound concurrent requests and respect the account's RPM/TPM quotas
+        self._request_slots = asyncio.Semaphore(settings.OPENAI_MAX_CONCURRENCY)
+        self._rate_limiter = TokenBucket(rpm=settings.OPENAI_RPM, tpm=settings.OPENAI_TPM)
     
-    def analyze_policy_text(self, text: str, policy_type: str = "auto") -> Dict[str, Any]:
+    async def analyze_policy_text(self, text: str, policy_type: str = "auto") -> Dict[str, Any]:
         """
         Enhanced insurance policy analysis using AI + regex patterns
         """
-        import logging
-        logger = logging.getLogger(__name__)
+        logger.info("Starting AI-enhanced policy analysis for type: %s", policy_type)
+        logger.info("Text length: %d characters, AI enabled: %s", len(text), self.ai_enabled)
         
-        logger.info(f"Starting AI-enhanced policy analysis for type: {policy_type}")
-        logger.info(f"Text length: {len(text)} characters, AI enabled: {self.ai_enabled}")
+        # Regex extraction runs in a worker process while the AI request is in flight
+        regex_job = asyncio.ensure_future(_cached_regex_analysis(text, policy_type))
         
         # First, try AI-powered analysis if available
         ai_analysis = {}
-        if self.ai_enabled and len(text) > 100:
+        if self.ai_enabled and self._worth_ai_extraction(text):
             try:
-                ai_analysis = self._ai_extract_policy_data(text, policy_type)
-                logger.info(f"AI analysis completed successfully")
+                ai_analysis = await self._ai_extract_policy_data(text, policy_type)
+                logger.info("AI analysis completed successfully")
             except Exception as e:
                 logger.error(f"AI analysis failed: {e}")
                 ai_analysis = {}
         
-        # Always run regex-based analysis as backup/enhancement
-        regex_analysis = {
-            "basic_info": self._extract_comprehensive_basic_info(text),
-            "financial_info": self._extract_comprehensive_financial_info(text),
-            "coverage_details": self._extract_comprehensive_coverage_details(text, policy_type),
-            "policy_terms": self._extract_policy_terms(text),
-            "beneficiaries": self._extract_beneficiaries(text),
-            "exclusions": self._extract_exclusions(text),
-            "claims_info": self._extract_claims_information(text),
-            "contact_info": self._extract_contact_information(text),
-            "legal_info": self._extract_legal_information(text),
-            "special_provisions": self._extract_special_provisions(text),
-            "document_metadata": self._extract_document_metadata(text),
-            "risk_assessment": self._extract_risk_assessment(text),
-            "payment_schedule": self._extract_payment_schedule(text),
-            "riders_endorsements": self._extract_riders_and_endorsements(text),
-            "vehicle_info": self._extract_vehicle_information(text) if policy_type == "auto" else {},
-            "property_info": self._extract_property_information(text) if policy_type in ["home", "property"] else {},
-            "health_info": self._extract_health_information(text) if policy_type == "health" else {},
-            "life_info": self._extract_life_insurance_information(text) if policy_type == "life" else {},
-            "business_info": self._extract_business_information(text) if policy_type == "business" else {}
-        }
+        return self._complete_analysis(text, ai_analysis, await regex_job)
+
+    async def analyze_policy_texts(self, items: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+        """
+        Analyze several (text, policy_type) documents, sharing OpenAI round-trips
+        """
+        logger.info("Starting AI-enhanced analysis of %d policies, AI enabled: %s", len(items), self.ai_enabled)
+        
+        regex_job = asyncio.gather(*(_cached_regex_analysis(text, policy_type) for text, policy_type in items))
         
+        ai_analyses: List[Dict[str, Any]] = [{} for _ in items]
+        if self.ai_enabled:
+            pending = [index for index, (text, _) in enumerate(items) if self._worth_ai_extraction(text)]
+            chunks = [pending[start:start + self._AI_BATCH_SIZE] for start in range(0, len(pending), self._AI_BATCH_SIZE)]
+            outcomes = await asyncio.gather(
+                *(self._ai_extract_policy_data_batch([items[index] for index in chunk]) for chunk in chunks),
+                return_exceptions=True
+            )
+            for chunk, outcome in zip(chunks, outcomes):
+                if isinstance(outcome, Exception):
+                    logger.error(f"Batched AI analysis failed: {outcome}")
+                    continue
+                for index, result in zip(chunk, outcome):
+                    ai_analyses[index] = result
+        
+        regex_analyses = await regex_job
+        return [
+            self._complete_analysis(text, ai_analysis, regex_analysis)
+            for (text, _), ai_analysis, regex_analysis in zip(items, ai_analyses, regex_analyses)
+        ]
+
+    def _regex_analysis(self, text: str, policy_type: str) -> Dict[str, Any]:
+        """Regex-based analysis, always run as backup/enhancement to the AI"""
+        # The extractors are independent, so they run side by side on the thread pool;
+        # results are collected in table order to keep the section order stable
+        sections = list(self._SECTION_EXTRACTORS)
+        if policy_type in self._TYPE_SPECIFIC_EXTRACTORS:
+            sections.append(self._TYPE_SPECIFIC_EXTRACTORS[policy_type])
+        jobs = {}
+        for key, extractor in sections:
+            patterns = self._EXTRACTOR_PATTERNS.get(extractor)
+            if patterns is not None and not _candidates(patterns, text):
+                continue
+            args = (text, policy_type) if key == "coverage_details" else (text,)
+            jobs[key] = _EXTRACTOR_POOL.submit(getattr(self, extractor), *args)
+        return {key: jobs[key].result() if key in jobs else {} for key in self._ANALYSIS_SECTIONS}
+
+    def _worth_ai_extraction(self, text: str) -> bool:
+        """Skip the OpenAI request for short documents and ones that are not insurance related"""
+        if len(text) < self._AI_MIN_TEXT_LENGTH:
+            return False
+        folded = _fold(text)
+        return any(keyword in folded for keyword in _INSURANCE_KEYWORDS)
+
+    def _complete_analysis(self, text: str, ai_analysis: Dict[str, Any], regex_analysis: Dict[str, Any]) -> Dict[str, Any]:
+        """Merge the AI and regex analyses and score the result"""
         # Merge AI and regex analysis intelligently
         final_analysis = self._merge_analysis_results(ai_analysis, regex_analysis)
         
@@ -95,96 +884,171 @@ class PolicyAnalyzer:
         final_analysis["total_parameters_extracted"] = self._count_extracted_parameters(final_analysis)
         final_analysis["ai_enhanced"] = self.ai_enabled and len(ai_analysis) > 0
         
-        logger.info(f"Analysis completed. Confidence: {confidence:.2f}, Parameters extracted: {final_analysis['total_parameters_extracted']}, AI enhanced: {final_analysis['ai_enhanced']}")
+        logger.info(
+            "Analysis completed. Confidence: %.2f, Parameters extracted: %d, AI enhanced: %s",
+            confidence, final_analysis['total_parameters_extracted'], final_analysis['ai_enhanced'],
+        )
         
         return final_analysis
 
-    def _ai_extract_policy_data(self, text: str, policy_type: str) -> Dict[str, Any]:
+    async def _ai_extract_policy_data(self, text: str, policy_type: str) -> Dict[str, Any]:
         """Use OpenAI to extract comprehensive policy information"""
         
-        # Truncate text if too long (to stay within token limits)
-        max_chars = 12000  # Roughly 3000 tokens
-        if len(text) > max_chars:
-            text = text[:max_chars] + "...[truncated]"
+        text = self._truncate_for_ai(text)
         
-        prompt = f"""
-You are an expert insurance policy analyst. Analyze the following {policy_type} insurance document and extract ALL possible information in a structured JSON format.
-
-Extract comprehensive details including but not limited to:
+        prompt = _AI_INSTRUCTION.format(subject=f"this {policy_type} insurance document") + f"\n\n{text}"
 
-BASIC INFORMATION:
-- Policy number, insurer name, policyholder name, agent details
-- Effective dates, expiration dates, renewal terms
-- Product type and coverage type
+        cache_key = self._ai_cache_key(text, policy_type)
+        result = await asyncio.to_thread(openai_cache.get, cache_key)
+        if result is None and openai_cache.mode == "replay":
+            logger.info("OpenAI cache miss in replay mode; skipping AI analysis")
+            return {}
+        
+        try:
+            if result is None:
+                embedding = None
+                if semantic_cache.enabled and (openai_cache.readable or openai_cache.writable):
+                    # The semantic cache is an optimization; without an embedding the document is simply analyzed
+                    try:
+                        embedding = await self._embedding(text)
+                    except Exception as e:
+                        logger.warning("Embedding for the semantic cache failed: %s", e)
+                if embedding is not None and openai_cache.readable:
+                    similar = await asyncio.to_thread(semantic_cache.get, embedding, text, self._ai_scope(policy_type))
+                    if similar is not None:
+                        logger.info("Semantic cache hit; reusing the AI analysis of a near-duplicate document")
+                        return self._without_document_specific(self._parse_ai_json(similar))
+                result = await self._chat_completion(prompt, self._AI_MAX_TOKENS)
+                if result:
+                    await asyncio.to_thread(openai_cache.put, cache_key, result)
+                    if embedding is not None and openai_cache.writable:
+                        await asyncio.to_thread(semantic_cache.put, embedding, text, self._ai_scope(policy_type), result)
+            
+            return self._parse_ai_json(result)
+                    
+        except Exception as e:
+            logger.error(f"OpenAI API error: {e}")
+            return {}
 
-FINANCIAL DETAILS:
-- Premium amounts (annual, monthly, quarterly)
-- Deductibles (collision, comprehensive, etc.)
-- Coverage limits and maximum payouts
-- Co-pays, co-insurance percentages
-- Out-of-pocket maximums
+    async def _ai_extract_policy_data_batch(self, items: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+        """Extract several documents with one OpenAI request; cached documents are not resent"""
+        results: List[Dict[str, Any]] = [{} for _ in items]
+        misses = []
+        for index, (text, policy_type) in enumerate(items):
+            truncated = self._truncate_for_ai(text)
+            cache_key = self._ai_cache_key(truncated, policy_type)
+            cached = await asyncio.to_thread(openai_cache.get, cache_key)
+            if cached is not None:
+                results[index] = self._parse_ai_json(cached)
+            elif openai_cache.mode != "replay":
+                misses.append((index, truncated, policy_type, cache_key))
+        
+        if len(misses) == 1:
+            index = misses[0][0]
+            results[index] = await self._ai_extract_policy_data(*items[index])
+            return results
+        if not misses:
+            return results
+        
+        documents = "".join(
+            f"Insurance Document {number} ({policy_type}):\n{text}\n\n"
+            for number, (_, text, policy_type, _) in enumerate(misses)
+        )
+        prompt = (
+            _AI_INSTRUCTION.format(subject=f"each of the {len(misses)} insurance documents below")
+            + ' Return {"documents": [...]} with one object per document, in order.\n\n'
+            + documents
+        )
 
-COVERAGE DETAILS:
-- Liability coverage (bodily injury, property damage)
-- Collision and comprehensive coverage
-- Medical payments, PIP, uninsured motorist
-- Special coverages, riders, endorsements
+        try:
+            result = await self._chat_completion(prompt, self._AI_MAX_TOKENS * len(misses))
+            parsed = self._parse_ai_json(result or "")
+        except Exception as e:
+            logger.error(f"OpenAI API error: {e}")
+            return results
+        
+        parsed = parsed.get("documents") if isinstance(parsed, dict) else None
+        if not (isinstance(parsed, list) and len(parsed) == len(misses) and all(isinstance(item, dict) for item in parsed)):
+            logger.warning("Batched AI response did not match the documents; analyzing them one by one")
+            singles = await asyncio.gather(*(self._ai_extract_policy_data(*items[index]) for index, _, _, _ in misses))
+            for (index, _, _, _), analysis in zip(misses, singles):
+                results[index] = analysis
+            return results
+        
+        for (index, _, _, cache_key), analysis in zip(misses, parsed):
+            results[index] = analysis
+            await asyncio.to_thread(openai_cache.put, cache_key, orjson.dumps(analysis).decode())
+        return results
 
-POLICY TERMS:
-- Policy period, renewal terms
-- Cancellation conditions
-- Payment schedules and methods
+    def _client(self):
+        """AsyncOpenAI client, created on first use"""
+        if self.openai_client is None:
+            import openai
+            self.openai_client = openai.AsyncOpenAI(api_key=self._openai_key)
+        return self.openai_client
 
-CONTACT INFORMATION:
-- Phone numbers, email addresses
-- Mailing addresses, billing addresses
-- Agent contact details
+    async def _embedding(self, text: str) -> List[float]:
+        """Embed the document for the semantic cache, bounded like any other request"""
+        text = text[:self._EMBEDDING_MAX_CHARS]
+        async with self._request_slots:
+            await self._rate_limiter.acquire(len(text) // 4)
+            response = await self._client().embeddings.create(model=self._EMBEDDING_MODEL, input=text)
+        return response.data[0].embedding
 
-VEHICLE/PROPERTY SPECIFIC (if applicable):
-- VIN numbers, vehicle details (make, model, year)
-- Property addresses, construction details
-- Risk factors and safety features
+    async def _chat_completion(self, prompt: str, max_tokens: int) -> Optional[str]:
+        """Send one extraction prompt, bounded by the concurrency and rate limits"""
+        async with self._request_slots:
+            # Roughly 4 characters per prompt token; the reply counts against TPM too
+            await self._rate_limiter.acquire(len(prompt) // 4 + max_tokens)
+            response = await self._client().chat.completions.create(
+                model=self._AI_MODEL,
+                messages=[
+                    {"role": "system", "content": "You are an expert insurance document analyzer. Always return valid JSON."},
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=self._AI_TEMPERATURE,
+                max_tokens=max_tokens,
+                response_format={"type": "json_object"}
+            )
+        return response.choices[0].message.content
 
-LEGAL INFORMATION:
-- License numbers, regulatory information
-- State of issuance, NAIC codes
+    def _truncate_for_ai(self, text: str) -> str:
+        """Truncate text if too long (to stay within token limits)"""
+        max_chars = 12000  # Roughly 3000 tokens
+        if len(text) > max_chars:
+            return text[:max_chars] + "...[truncated]"
+        return text
 
-Extract amounts as numbers where possible. For dates, use YYYY-MM-DD format.
-Return only valid JSON with nested objects for categories.
+    def _ai_cache_key(self, text: str, policy_type: str) -> str:
+        return openai_cache.make_key(
+            text,
+            prompt_version=self._PROMPT_VERSION,
+            policy_type=policy_type,
+            model=self._AI_MODEL,
+            temperature=self._AI_TEMPERATURE,
+            max_tokens=self._AI_MAX_TOKENS,
+        )
 
-Insurance Document:
-{text}
+    def _ai_scope(self, policy_type: str) -> str:
+        """Request parameters a semantic cache hit has to share, everything but the text"""
+        return f"{self._PROMPT_VERSION}|{self._AI_MODEL}|{policy_type}"
 
-JSON Response:"""
+    def _without_document_specific(self, analysis: Any) -> Any:
+        """Drop values tied to the cached document so the regex pass supplies this one's"""
+        if isinstance(analysis, dict):
+            return {
+                key: self._without_document_specific(value)
+                for key, value in analysis.items()
+                if not _DOCUMENT_SPECIFIC_KEY_RE.search(key.lower())
+            }
+        return analysis
 
+    def _parse_ai_json(self, result: str) -> Any:
+        """Parse a JSON-mode reply; only a reply cut off at max_tokens can fail"""
         try:
-            response = self.openai_client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": "You are an expert insurance document analyzer. Always return valid JSON."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.1,
-                max_tokens=2000
-            )
-            
-            result = response.choices[0].message.content
-            
-            # Try to parse JSON response
-            try:
-                parsed_result = json.loads(result)
-                return parsed_result
-            except json.JSONDecodeError:
-                # If JSON parsing fails, try to extract JSON from the response
-                json_match = re.search(r'\{.*\}', result, re.DOTALL)
-                if json_match:
-                    return json.loads(json_match.group())
-                else:
-                    logger.warning("AI response was not valid JSON")
-                    return {}
-                    
-        except Exception as e:
-            logger.error(f"OpenAI API error: {e}")
+            return orjson.loads(result)
+        except orjson.JSONDecodeError:
+            logger.warning("AI response was not valid JSON")
             return {}
 
     def _merge_analysis_results(self, ai_analysis: Dict[str, Any], regex_analysis: Dict[str, Any]) -> Dict[str, Any]:
@@ -194,18 +1058,7 @@ JSON Response:"""
             return regex_analysis
         
         merged = {}
-        
-        # Standard section mapping between AI and regex results
-        section_mappings = {
-            "basic_info": ["basic_information", "policy_info", "general", "basic_info"],
-            "financial_info": ["financial_details", "financial", "costs", "financial_info"],
-            "coverage_details": ["coverage_details", "coverage", "coverages", "benefits"],
-            "contact_info": ["contact_information", "contact", "contacts", "contact_info"],
-            "vehicle_info": ["vehicle_information", "vehicle", "auto", "car"],
-            "property_info": ["property_information", "property", "real_estate", "home"],
-            "policy_terms": ["policy_terms", "terms", "conditions", "policy_conditions"],
-            "legal_info": ["legal_information", "legal", "regulatory", "compliance"]
-        }
+        section_mappings = self._SECTION_MAPPINGS
         
         # Process each section
         for regex_section, section_data in regex_analysis.items():
@@ -237,7 +1090,7 @@ JSON Response:"""
             
             # Add any additional AI sections not covered by regex
             for ai_key, ai_value in ai_analysis.items():
-                if ai_key not in [item for sublist in section_mappings.values() for item in sublist]:
+                if ai_key not in self._MAPPED_AI_SECTIONS:
                     if ai_key not in merged:
                         merged[ai_key] = ai_value
         
@@ -248,117 +1101,24 @@ JSON Response:"""
         info = {}
         
         # Policy Number patterns (much more comprehensive)
-        policy_patterns = [
-            r'(?:Policy\s*(?:Number|No\.?|#)):\s*([A-Z0-9\-]+)',
-            r'(?:פוליסה\s*(?:מספר|מס\.?)):\s*([A-Z0-9\-]+)',
-            r'(?:Certificate\s*(?:Number|No\.?)):\s*([A-Z0-9\-]+)',
-            r'(?:Contract\s*(?:Number|No\.?)):\s*([A-Z0-9\-]+)',
-            r'(?:Policy\s*ID):\s*([A-Z0-9\-]+)',
-            r'(?:Reference\s*(?:Number|No\.?)):\s*([A-Z0-9\-]+)',
-            r'([A-Z]{2,4}[\-]?[0-9]{6,12})',  # Pattern like ABC-123456789
-            r'([0-9]{8,15})',  # Numeric policy numbers
-        ]
-        
-        for pattern in policy_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                info['policy_number'] = matches[0] if isinstance(matches[0], str) else matches[0][0]
-                break
-        
-        # Insurer/Company patterns (comprehensive list)
-        insurer_patterns = [
-            # Major US insurers
-            r'(State Farm|Geico|Progressive|Allstate|Farmers|USAA|Liberty Mutual|Nationwide)',
-            r'(American Family|Auto-Owners|Amica|Erie|Travelers|Hartford|Chubb)',
-            # Major Israeli insurers
-            r'(הפניקס|פניקס|Phoenix|הראל|Harel|כלל|Clal|מנורה מבטחים|Menorah|ביטוח ישיר|Bituach Yashir)',
-            r'(מגדל|Migdal|אי.די.איי|IDB|שומרה|Shomera|איילון|Ayalon|הכשרה|Hachshara)',
-            # International insurers
-            r'(AXA|Allianz|Zurich|MetLife|Prudential|AIG|Munich Re|Swiss Re)',
-            r'(Aviva|RSA|Admiral|Direct Line|Churchill|Hastings|More Than)',
-            # Generic patterns
-            r'([A-Z][a-z]+\s+Insurance\s+(?:Company|Corp|Group|Inc)?)',
-            r'([A-Z][a-z]+\s+Assurance\s+(?:Company|Corp|Group)?)',
-            r'(חברת\s+[א-ת\s]+(?:לביטוח|ביטוח))',
-        ]
-        
-        for pattern in insurer_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                info['insurer'] = match.group(1).strip()
-                break
-        
-        # Policy holder patterns (multiple variations)
-        holder_patterns = [
-            r'(?:Policy\s*Holder|Named\s*Insured|Insured\s*Person):\s*([^\n\r]{3,50})',
-            r'(?:Policyholder|Policy\s*Owner):\s*([^\n\r]{3,50})',
-            r'(?:בעל\s*הפוליסה|מבוטח|בעל\s*הביטוח):\s*([^\n\r]{3,50})',
-            r'(?:Customer\s*Name|Client\s*Name):\s*([^\n\r]{3,50})',
-            r'(?:Insured\s*Name|Member\s*Name):\s*([^\n\r]{3,50})',
-            r'(?:First\s*Named\s*Insured):\s*([^\n\r]{3,50})',
-        ]
-        
-        for pattern in holder_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                info['owner_name'] = match.group(1).strip()
-                break
-        
-        # Agent/Broker information
-        agent_patterns = [
-            r'(?:Agent|Broker|Producer):\s*([^\n\r]{3,50})',
-            r'(?:סוכן|מתווך):\s*([^\n\r]{3,50})',
-            r'(?:Agent\s*Name|Broker\s*Name):\s*([^\n\r]{3,50})',
-            r'(?:Licensed\s*Agent):\s*([^\n\r]{3,50})',
-        ]
-        
-        for pattern in agent_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                info['agent_name'] = match.group(1).strip()
-                break
+        found = _search_by_priority(_POLICY_NUMBER_FUSED, _POLICY_NUMBER_PATTERNS, text)
+        if found:
+            info['policy_number'] = found[1].group(1)
+        
+        # Insurer/Company, policy holder and agent/broker patterns
+        for field, fused, patterns in (
+            ('insurer', _INSURER_FUSED, _INSURER_PATTERNS),
+            ('owner_name', _HOLDER_FUSED, _HOLDER_PATTERNS),
+            ('agent_name', _AGENT_FUSED, _AGENT_PATTERNS),
+        ):
+            found = _search_by_priority(fused, patterns, text)
+            if found:
+                info[field] = found[1].group(1).strip()
         
         # Product type detection (enhanced)
-        product_patterns = {
-            'auto': [
-                r'(?:Auto|Vehicle|Car|Motor|Automobile)\s*(?:Insurance|Policy|Coverage)',
-                r'(?:ביטוח\s*רכב|רכב\s*ביטוח)',
-                r'Personal\s*Auto\s*Policy',
-                r'Commercial\s*Auto\s*Policy'
-            ],
-            'home': [
-                r'(?:Home|House|Property|Dwelling)\s*(?:Insurance|Policy|Coverage)',
-                r'(?:ביטוח\s*בית|בית\s*ביטוח|ביטוח\s*דירה)',
-                r'Homeowners\s*Policy',
-                r'Renters\s*Insurance'
-            ],
-            'health': [
-                r'(?:Health|Medical|Healthcare)\s*(?:Insurance|Policy|Coverage)',
-                r'(?:ביטוח\s*בריאות|בריאות\s*ביטוח)',
-                r'Major\s*Medical',
-                r'Group\s*Health'
-            ],
-            'life': [
-                r'(?:Life|Term\s*Life|Whole\s*Life)\s*(?:Insurance|Policy)',
-                r'(?:ביטוח\s*חיים|חיים\s*ביטוח)',
-                r'Universal\s*Life',
-                r'Variable\s*Life'
-            ],
-            'business': [
-                r'(?:Business|Commercial|General\s*Liability)\s*(?:Insurance|Policy)',
-                r'(?:ביטוח\s*עסקי|עסקי\s*ביטוח)',
-                r'Professional\s*Liability',
-                r'Workers\s*Compensation'
-            ]
-        }
-        
-        for product_type, patterns in product_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, text, re.IGNORECASE):
-                    info['product_type'] = product_type
-                    break
-            if 'product_type' in info:
-                break
+        found = _search_by_priority(_PRODUCT_TYPE_FUSED, _ALL_PRODUCT_TYPE_PATTERNS, text)
+        if found:
+            info['product_type'] = _PRODUCT_TYPES[found[0]]
         
         return info
 
@@ -366,65 +1126,29 @@ JSON Response:"""
         """Extract comprehensive financial information"""
         financial = {}
         
-        # Premium patterns (multiple currencies and formats)
-        premium_patterns = [
-            r'(?:Annual\s*Premium|Yearly\s*Premium):\s*[$₪€£¥]?([\d,]+\.?\d*)',
-            r'(?:Monthly\s*Premium|Monthly\s*Payment):\s*[$₪€£¥]?([\d,]+\.?\d*)',
-            r'(?:Total\s*Premium|Premium\s*Amount):\s*[$₪€£¥]?([\d,]+\.?\d*)',
-            r'(?:פרמיה\s*שנתית|פרמיה\s*חודשית):\s*[$₪€£¥]?([\d,]+\.?\d*)',
-            r'(?:Premium\s*Due):\s*[$₪€£¥]?([\d,]+\.?\d*)',
-            r'(?:Policy\s*Premium):\s*[$₪€£¥]?([\d,]+\.?\d*)',
-        ]
-        
-        for pattern in premium_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                if 'annual' in pattern.lower() or 'yearly' in pattern.lower() or 'שנתית' in pattern:
-                    financial['premium_annual'] = self._parse_amount(matches[0])
-                    financial['premium_monthly'] = self._parse_amount(matches[0]) / 12
-                elif 'monthly' in pattern.lower() or 'חודשית' in pattern:
-                    financial['premium_monthly'] = self._parse_amount(matches[0])
-                    financial['premium_annual'] = self._parse_amount(matches[0]) * 12
-                else:
-                    financial['premium_total'] = self._parse_amount(matches[0])
-        
-        # Deductible patterns
-        deductible_patterns = [
-            r'(?:Deductible|Deductible\s*Amount):\s*[$₪€£¥]?([\d,]+\.?\d*)',
-            r'(?:Self\s*Insured\s*Retention):\s*[$₪€£¥]?([\d,]+\.?\d*)',
-            r'(?:השתתפות\s*עצמית):\s*[$₪€£¥]?([\d,]+\.?\d*)',
-            r'(?:Collision\s*Deductible):\s*[$₪€£¥]?([\d,]+\.?\d*)',
-            r'(?:Comprehensive\s*Deductible):\s*[$₪€£¥]?([\d,]+\.?\d*)',
-        ]
-        
-        for pattern in deductible_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                if 'collision' in pattern.lower():
-                    financial['collision_deductible'] = self._parse_amount(matches[0])
-                elif 'comprehensive' in pattern.lower():
-                    financial['comprehensive_deductible'] = self._parse_amount(matches[0])
-                else:
-                    financial['deductible'] = self._parse_amount(matches[0])
-        
-        # Coverage limits and amounts
-        limit_patterns = [
-            r'(?:Coverage\s*Limit|Policy\s*Limit|Maximum\s*Coverage):\s*[$₪€£¥]?([\d,]+\.?\d*)',
-            r'(?:Liability\s*Limit|Per\s*Occurrence\s*Limit):\s*[$₪€£¥]?([\d,]+\.?\d*)',
-            r'(?:Aggregate\s*Limit|Annual\s*Aggregate):\s*[$₪€£¥]?([\d,]+\.?\d*)',
-            r'(?:Sum\s*Insured|Insured\s*Amount):\s*[$₪€£¥]?([\d,]+\.?\d*)',
-            r'(?:סכום\s*ביטוח|גבול\s*כיסוי):\s*[$₪€£¥]?([\d,]+\.?\d*)',
-        ]
-        
-        for pattern in limit_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                if 'liability' in pattern.lower():
-                    financial['liability_limit'] = self._parse_amount(matches[0])
-                elif 'aggregate' in pattern.lower():
-                    financial['aggregate_limit'] = self._parse_amount(matches[0])
-                else:
-                    financial['coverage_limit'] = self._parse_amount(matches[0])
+        # Premium patterns (multiple currencies and formats); amounts are parsed in one batch
+        premiums = []
+        for pattern, period in _candidates(_PREMIUM_PATTERNS, text):
+            found = _first_found(pattern, text)
+            if found is not None:
+                premiums.append((period, found))
+        for (period, _), amount in zip(premiums, self._parse_amounts([raw for _, raw in premiums])):
+            if period == 'annual':
+                financial['premium_annual'] = amount
+                financial['premium_monthly'] = amount / 12
+            elif period == 'monthly':
+                financial['premium_monthly'] = amount
+                financial['premium_annual'] = amount * 12
+            else:
+                financial['premium_total'] = amount
+        
+        # Deductible and coverage limit patterns
+        amounts = {}
+        for pattern, field in _candidates(_DEDUCTIBLE_AND_LIMIT_PATTERNS, text):
+            found = _first_found(pattern, text)
+            if found is not None:
+                amounts[field] = found
+        financial.update(zip(amounts, self._parse_amounts(list(amounts.values()))))
         
         return financial
 
@@ -433,71 +1157,39 @@ JSON Response:"""
         coverage = {}
         
         # General coverage patterns
-        general_coverage_patterns = [
-            r'([A-Za-z\s]+(?:Coverage|Protection|Benefit)):\s*[$₪€£¥]?([\d,]+\.?\d*)',
-            r'([A-Za-z\s]+(?:Limit|Maximum)):\s*[$₪€£¥]?([\d,]+\.?\d*)',
-            r'([א-ת\s]+(?:כיסוי|הגנה|הטבה)):\s*[$₪€£¥]?([\d,]+\.?\d*)',
-        ]
-        
-        for pattern in general_coverage_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for coverage_name, amount in matches:
-                key = coverage_name.lower().strip().replace(' ', '_')
-                coverage[key] = {
-                    'amount': self._parse_amount(amount),
-                    'description': coverage_name.strip(),
-                    'type': 'general'
-                }
+        general = [match for pattern in _GENERAL_COVERAGE_PATTERNS for match in _findall(pattern, text)]
+        for (coverage_name, _), amount in zip(general, self._parse_amounts([raw for _, raw in general])):
+            key = coverage_name.lower().strip().replace(' ', '_')
+            coverage[key] = {
+                'amount': amount,
+                'description': coverage_name.strip(),
+                'type': 'general'
+            }
         
         # Auto-specific coverage
+        specific, specific_type = {}, None
         if policy_type == "auto":
-            auto_coverage_patterns = [
-                r'(?:Bodily\s*Injury\s*Liability):\s*[$₪€£¥]?([\d,]+\.?\d*)(?:/[$₪€£¥]?([\d,]+\.?\d*))?',
-                r'(?:Property\s*Damage\s*Liability):\s*[$₪€£¥]?([\d,]+\.?\d*)',
-                r'(?:Collision\s*Coverage):\s*[$₪€£¥]?([\d,]+\.?\d*)',
-                r'(?:Comprehensive\s*Coverage):\s*[$₪€£¥]?([\d,]+\.?\d*)',
-                r'(?:Uninsured\s*Motorist):\s*[$₪€£¥]?([\d,]+\.?\d*)',
-                r'(?:Personal\s*Injury\s*Protection|PIP):\s*[$₪€£¥]?([\d,]+\.?\d*)',
-                r'(?:Medical\s*Payments):\s*[$₪€£¥]?([\d,]+\.?\d*)',
-                r'(?:Rental\s*Reimbursement):\s*[$₪€£¥]?([\d,]+\.?\d*)',
-                r'(?:Towing\s*and\s*Labor):\s*[$₪€£¥]?([\d,]+\.?\d*)',
-            ]
-            
-            for pattern in auto_coverage_patterns:
-                matches = re.findall(pattern, text, re.IGNORECASE)
-                if matches:
-                    if 'bodily_injury' in pattern.lower():
-                        if len(matches[0]) == 2 and matches[0][1]:  # Per person/per accident format
-                            coverage['bodily_injury_per_person'] = {'amount': self._parse_amount(matches[0][0]), 'type': 'auto'}
-                            coverage['bodily_injury_per_accident'] = {'amount': self._parse_amount(matches[0][1]), 'type': 'auto'}
-                        else:
-                            coverage['bodily_injury_liability'] = {'amount': self._parse_amount(matches[0][0]), 'type': 'auto'}
-                    elif 'property_damage' in pattern.lower():
-                        coverage['property_damage_liability'] = {'amount': self._parse_amount(matches[0]), 'type': 'auto'}
-                    elif 'collision' in pattern.lower():
-                        coverage['collision_coverage'] = {'amount': self._parse_amount(matches[0]), 'type': 'auto'}
-                    elif 'comprehensive' in pattern.lower():
-                        coverage['comprehensive_coverage'] = {'amount': self._parse_amount(matches[0]), 'type': 'auto'}
+            specific_type = 'auto'
+            for pattern, coverage_type, split in _candidates(_AUTO_COVERAGE_PATTERNS, text):
+                match = _search(pattern, text)
+                if not match:
+                    continue
+                if split and match.group(2):  # Per person/per accident format
+                    specific[f'{split}_per_person'] = match.group(1)
+                    specific[f'{split}_per_accident'] = match.group(2)
+                else:
+                    specific[coverage_type] = match.group(1)
         
         # Home insurance specific coverage
         elif policy_type in ["home", "property"]:
-            home_coverage_patterns = [
-                r'(?:Dwelling\s*Coverage|Coverage\s*A):\s*[$₪€£¥]?([\d,]+\.?\d*)',
-                r'(?:Other\s*Structures|Coverage\s*B):\s*[$₪€£¥]?([\d,]+\.?\d*)',
-                r'(?:Personal\s*Property|Coverage\s*C):\s*[$₪€£¥]?([\d,]+\.?\d*)',
-                r'(?:Loss\s*of\s*Use|Coverage\s*D):\s*[$₪€£¥]?([\d,]+\.?\d*)',
-                r'(?:Personal\s*Liability|Coverage\s*E):\s*[$₪€£¥]?([\d,]+\.?\d*)',
-                r'(?:Medical\s*Payments|Coverage\s*F):\s*[$₪€£¥]?([\d,]+\.?\d*)',
-                r'(?:Water\s*Damage|Flood\s*Coverage):\s*[$₪€£¥]?([\d,]+\.?\d*)',
-                r'(?:Fire\s*Coverage|Fire\s*Damage):\s*[$₪€£¥]?([\d,]+\.?\d*)',
-                r'(?:Theft\s*Coverage|Burglary\s*Coverage):\s*[$₪€£¥]?([\d,]+\.?\d*)',
-            ]
-            
-            for pattern in home_coverage_patterns:
-                matches = re.findall(pattern, text, re.IGNORECASE)
-                if matches:
-                    coverage_type = pattern.lower().split('|')[0].strip('(?:').replace('\\s*', '_').replace('\\', '')
-                    coverage[coverage_type] = {'amount': self._parse_amount(matches[0]), 'type': 'home'}
+            specific_type = 'home'
+            for pattern, coverage_type in _candidates(_HOME_COVERAGE_PATTERNS, text):
+                found = _first_found(pattern, text)
+                if found is not None:
+                    specific[coverage_type] = found
+        
+        for coverage_type, amount in zip(specific, self._parse_amounts(list(specific.values()))):
+            coverage[coverage_type] = {'amount': amount, 'type': specific_type}
         
         return coverage
 
@@ -506,104 +1198,35 @@ JSON Response:"""
         terms = {}
         
         # Policy period patterns
-        period_patterns = [
-            r'(?:Policy\s*Period|Coverage\s*Period|Term):\s*([0-9/\-\.]{8,12})\s*(?:to|through|[\-–])\s*([0-9/\-\.]{8,12})',
-            r'(?:Effective\s*Date):\s*([0-9/\-\.]{8,12})',
-            r'(?:Expiration\s*Date|Expires):\s*([0-9/\-\.]{8,12})',
-            r'(?:תקופת\s*הביטוח):\s*([0-9/\-\.]{8,12})\s*(?:עד|ל)\s*([0-9/\-\.]{8,12})',
-        ]
-        
-        for pattern in period_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern, field in _candidates(_PERIOD_PATTERNS, text):
+            match = _search(pattern, text)
             if match:
-                if len(match.groups()) >= 2 and match.group(2):
+                if field == 'range':
                     terms['start_date'] = match.group(1).strip()
                     terms['end_date'] = match.group(2).strip()
-                elif 'effective' in pattern.lower():
-                    terms['start_date'] = match.group(1).strip()
-                elif 'expiration' in pattern.lower() or 'expires' in pattern.lower():
-                    terms['end_date'] = match.group(1).strip()
+                else:
+                    terms[field] = match.group(1).strip()
                 break
         
         # Renewal terms
-        renewal_patterns = [
-            r'(?:Renewal|Auto[\-\s]*Renewal):\s*([^\n\r]{5,50})',
-            r'(?:Cancellation\s*Notice):\s*([^\n\r]{5,50})',
-            r'(?:חידוש):\s*([^\n\r]{5,50})',
-        ]
-        
-        for pattern in renewal_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern, field in _candidates(_RENEWAL_PATTERNS, text):
+            match = _search(pattern, text)
             if match:
-                if 'renewal' in pattern.lower() or 'חידוש' in pattern:
-                    terms['renewal_terms'] = match.group(1).strip()
-                elif 'cancellation' in pattern.lower():
-                    terms['cancellation_notice'] = match.group(1).strip()
+                terms[field] = match.group(1).strip()
         
         return terms
 
     def _extract_beneficiaries(self, text: str) -> Dict[str, Any]:
         """Extract beneficiary information"""
-        beneficiaries = {}
-        
-        beneficiary_patterns = [
-            r'(?:Primary\s*Beneficiary|Beneficiary):\s*([^\n\r]{3,50})',
-            r'(?:Secondary\s*Beneficiary|Contingent\s*Beneficiary):\s*([^\n\r]{3,50})',
-            r'(?:מוטב|מוטב\s*ראשי):\s*([^\n\r]{3,50})',
-            r'(?:Spouse|Partner):\s*([^\n\r]{3,50})',
-            r'(?:Children|Dependents):\s*([^\n\r]{3,100})',
-        ]
-        
-        for pattern in beneficiary_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                if 'primary' in pattern.lower() or 'beneficiary' in pattern.lower() and 'secondary' not in pattern.lower():
-                    beneficiaries['primary_beneficiary'] = matches[0].strip()
-                elif 'secondary' in pattern.lower() or 'contingent' in pattern.lower():
-                    beneficiaries['secondary_beneficiary'] = matches[0].strip()
-                elif 'spouse' in pattern.lower():
-                    beneficiaries['spouse'] = matches[0].strip()
-                elif 'children' in pattern.lower():
-                    beneficiaries['children'] = matches[0].strip()
-        
-        return beneficiaries
-
-    def _extract_exclusions(self, text: str) -> Dict[str, Any]:
-        """Extract policy exclusions"""
-        exclusions = {}
-        
-        exclusion_patterns = [
-            r'(?:Exclusions?|Not\s*Covered|Excluded):\s*([^\n\r]{10,200})',
-            r'(?:לא\s*מכוסה|הוצאות):\s*([^\n\r]{10,200})',
-            r'(?:This\s*policy\s*does\s*not\s*cover):\s*([^\n\r]{10,200})',
-        ]
-        
-        exclusion_items = []
-        for pattern in exclusion_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            exclusion_items.extend(matches)
-        
-        if exclusion_items:
-            exclusions['general_exclusions'] = exclusion_items
-        
-        return exclusions
+        return self._extract_first_matches(text, _BENEFICIARY_PATTERNS)
 
     def _extract_claims_information(self, text: str) -> Dict[str, Any]:
         """Extract claims and contact information"""
         claims = {}
         
-        claims_patterns = [
-            r'(?:Claims?\s*(?:Phone|Number|Hotline)):\s*([0-9\-\(\)\s\+]+)',
-            r'(?:Report\s*a\s*Claim):\s*([0-9\-\(\)\s\+]+)',
-            r'(?:24\s*Hour\s*Claims?):\s*([0-9\-\(\)\s\+]+)',
-            r'(?:Emergency\s*Claims?):\s*([0-9\-\(\)\s\+]+)',
-        ]
-        
-        for pattern in claims_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                claims['claims_phone'] = matches[0].strip()
-                break
+        found = _search_by_priority(_CLAIMS_FUSED, _CLAIMS_PATTERNS, text)
+        if found:
+            claims['claims_phone'] = found[1].group(1).strip()
         
         return claims
 
@@ -611,80 +1234,24 @@ JSON Response:"""
         """Extract contact information"""
         contact = {}
         
-        phone_patterns = [
-            r'(?:Phone|Tel|Telephone):\s*([0-9\-\(\)\s\+]{10,20})',
-            r'(?:Customer\s*Service):\s*([0-9\-\(\)\s\+]{10,20})',
-            r'(?:טלפון):\s*([0-9\-\(\)\s\+]{10,20})',
-        ]
-        
-        email_patterns = [
-            r'(?:Email|E[\-\s]*mail):\s*([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})',
-            r'([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})',
-        ]
-        
-        address_patterns = [
-            r'(?:Address|Mailing\s*Address):\s*([^\n\r]{10,100})',
-            r'(?:כתובת):\s*([^\n\r]{10,100})',
-        ]
-        
-        for pattern in phone_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                contact['phone'] = matches[0].strip()
-                break
-        
-        for pattern in email_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                contact['email'] = matches[0].strip()
-                break
-        
-        for pattern in address_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                contact['address'] = matches[0].strip()
-                break
+        for field, patterns, fused in _CONTACT_FIELDS:
+            found = _search_by_priority(fused, patterns, text)
+            if found:
+                contact[field] = found[1].group(1).strip()
         
         return contact
 
     def _extract_legal_information(self, text: str) -> Dict[str, Any]:
         """Extract legal information"""
-        legal = {}
-        
-        legal_patterns = [
-            r'(?:License\s*(?:Number|No\.?)):\s*([A-Z0-9\-]+)',
-            r'(?:State\s*of\s*(?:Issue|Domicile)):\s*([A-Z]{2}|[A-Za-z\s]+)',
-            r'(?:NAIC\s*(?:Number|Code)):\s*([0-9]+)',
-            r'(?:Department\s*of\s*Insurance):\s*([^\n\r]{5,50})',
-        ]
-        
-        for pattern in legal_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                if 'license' in pattern.lower():
-                    legal['license_number'] = matches[0].strip()
-                elif 'state' in pattern.lower():
-                    legal['state_of_issue'] = matches[0].strip()
-                elif 'naic' in pattern.lower():
-                    legal['naic_number'] = matches[0].strip()
-        
-        return legal
+        return self._extract_first_matches(text, _LEGAL_PATTERNS)
 
     def _extract_special_provisions(self, text: str) -> Dict[str, Any]:
         """Extract special provisions and endorsements"""
         provisions = {}
         
-        provision_patterns = [
-            r'(?:Special\s*Provisions?):\s*([^\n\r]{10,200})',
-            r'(?:Endorsements?):\s*([^\n\r]{10,200})',
-            r'(?:Riders?):\s*([^\n\r]{10,200})',
-            r'(?:Additional\s*Coverage):\s*([^\n\r]{10,200})',
-        ]
-        
         provision_items = []
-        for pattern in provision_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            provision_items.extend(matches)
+        for pattern in _candidates(_PROVISION_PATTERNS, text):
+            provision_items.extend(_findall(pattern, text))
         
         if provision_items:
             provisions['special_provisions'] = provision_items
@@ -693,89 +1260,23 @@ JSON Response:"""
 
     def _extract_document_metadata(self, text: str) -> Dict[str, Any]:
         """Extract document metadata"""
-        metadata = {}
-        
-        metadata_patterns = [
-            r'(?:Document\s*(?:Date|Created)):\s*([0-9/\-\.]{8,12})',
-            r'(?:Issue\s*Date):\s*([0-9/\-\.]{8,12})',
-            r'(?:Version|Revision):\s*([0-9\.]+)',
-            r'(?:Form\s*(?:Number|Code)):\s*([A-Z0-9\-]+)',
-        ]
-        
-        for pattern in metadata_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                if 'document' in pattern.lower() or 'issue' in pattern.lower():
-                    metadata['document_date'] = matches[0].strip()
-                elif 'version' in pattern.lower() or 'revision' in pattern.lower():
-                    metadata['document_version'] = matches[0].strip()
-                elif 'form' in pattern.lower():
-                    metadata['form_number'] = matches[0].strip()
-        
-        return metadata
+        return self._extract_first_matches(text, _METADATA_PATTERNS)
 
     def _extract_risk_assessment(self, text: str) -> Dict[str, Any]:
         """Extract risk assessment information"""
-        risk = {}
-        
-        risk_patterns = [
-            r'(?:Risk\s*(?:Category|Class|Rating)):\s*([^\n\r]{3,30})',
-            r'(?:Territory|Rating\s*Territory):\s*([^\n\r]{3,30})',
-            r'(?:Experience\s*Rating):\s*([^\n\r]{3,30})',
-            r'(?:Safety\s*Rating):\s*([^\n\r]{3,30})',
-        ]
-        
-        for pattern in risk_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                if 'risk' in pattern.lower():
-                    risk['risk_category'] = matches[0].strip()
-                elif 'territory' in pattern.lower():
-                    risk['territory'] = matches[0].strip()
-                elif 'experience' in pattern.lower():
-                    risk['experience_rating'] = matches[0].strip()
-                elif 'safety' in pattern.lower():
-                    risk['safety_rating'] = matches[0].strip()
-        
-        return risk
+        return self._extract_first_matches(text, _RISK_PATTERNS)
 
     def _extract_payment_schedule(self, text: str) -> Dict[str, Any]:
         """Extract payment schedule information"""
-        payment = {}
-        
-        payment_patterns = [
-            r'(?:Payment\s*(?:Schedule|Plan)):\s*([^\n\r]{5,50})',
-            r'(?:Due\s*Date):\s*([0-9/\-\.]{8,12})',
-            r'(?:Payment\s*Method):\s*([^\n\r]{5,30})',
-            r'(?:Installments?):\s*([^\n\r]{5,30})',
-        ]
-        
-        for pattern in payment_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                if 'schedule' in pattern.lower() or 'plan' in pattern.lower():
-                    payment['payment_schedule'] = matches[0].strip()
-                elif 'due' in pattern.lower():
-                    payment['due_date'] = matches[0].strip()
-                elif 'method' in pattern.lower():
-                    payment['payment_method'] = matches[0].strip()
-                elif 'installment' in pattern.lower():
-                    payment['installments'] = matches[0].strip()
-        
-        return payment
+        return self._extract_first_matches(text, _PAYMENT_PATTERNS)
 
     def _extract_riders_and_endorsements(self, text: str) -> Dict[str, Any]:
         """Extract riders and endorsements"""
         riders = {}
         
-        rider_patterns = [
-            r'(?:Rider|Endorsement)\s*([A-Z0-9\-]+):\s*([^\n\r]{5,100})',
-            r'(?:Additional\s*Coverage)\s*([A-Z0-9\-]+):\s*([^\n\r]{5,100})',
-        ]
-        
         rider_items = {}
-        for pattern in rider_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+        for pattern in _candidates(_RIDER_PATTERNS, text):
+            matches = _findall(pattern, text)
             for rider_id, description in matches:
                 rider_items[rider_id.strip()] = description.strip()
         
@@ -843,14 +1344,8 @@ JSON Response:"""
         coverage = {}
         
         # Coverage amount patterns
-        amount_patterns = [
-            r'([A-Za-z\s]+Coverage):\s*\$?([\d,]+)',
-            r'([A-Za-z\s]+Limit):\s*\$?([\d,]+)',
-            r'([A-Za-z\s]+Deductible):\s*\$?([\d,]+)'
-        ]
-        
-        for pattern in amount_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+        for pattern in _COVERAGE_AMOUNT_PATTERNS:
+            matches = _findall(pattern, text)
             for coverage_type, amount in matches:
                 key = coverage_type.lower().replace(' ', '_')
                 coverage[key] = {
@@ -870,94 +1365,71 @@ JSON Response:"""
         
         return coverage
     
+
     def _extract_financial_details(self, text: str) -> Dict[str, Any]:
         """Extract financial information"""
         financial = {}
         
         # Premium patterns
-        premium_patterns = [
-            r'(?:Annual Premium|Total Premium):\s*\$?([\d,\.]+)',
-            r'(?:Monthly Premium):\s*\$?([\d,\.]+)',
-            r'(?:דמי ביטוח שנתי):\s*₪?([\d,\.]+)',  # Hebrew
-        ]
-        
-        for pattern in premium_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern, field in _candidates(_SIMPLE_PREMIUM_PATTERNS, text):
+            match = _search(pattern, text)
             if match:
-                amount = self._parse_amount(match.group(1))
-                if 'annual' in pattern.lower() or 'שנתי' in pattern:
-                    financial['premium_annual'] = amount
-                elif 'monthly' in pattern.lower():
-                    financial['premium_monthly'] = amount
+                financial[field] = self._parse_amount(match.group(1))
         
         # Deductible patterns
-        deductible_patterns = [
-            r'(?:Deductible|Self Risk):\s*\$?([\d,\.]+)',
-            r'(?:השתתפות עצמית):\s*₪?([\d,\.]+)',  # Hebrew
-        ]
-        
-        for pattern in deductible_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _candidates(_SIMPLE_DEDUCTIBLE_PATTERNS, text):
+            match = _search(pattern, text)
             if match:
                 financial['deductible'] = self._parse_amount(match.group(1))
                 break
         
         return financial
     
+
     def _extract_terms_and_conditions(self, text: str) -> str:
         """Extract key terms and conditions"""
-        # Look for terms section
-        terms_patterns = [
-            r'(?:Terms and Conditions|General Conditions|Policy Conditions)(.*?)(?:Signatures?|End of Policy|Page \d+)',
-            r'(?:תנאי הפוליסה|תנאים כלליים)(.*?)(?:חתימות?|סוף הפוליסה|עמוד \d+)',  # Hebrew
-        ]
-        
-        for pattern in terms_patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
-            if match:
-                return match.group(1).strip()[:2000]  # Limit length
+        # Look for terms section; two forward searches instead of a lazy .*? across the document
+        folded = _fold(text)
+        for header_pattern, end_pattern in _prefilter(_TERMS_SECTIONS, text):
+            header = header_pattern.search(folded)
+            if not header:
+                continue
+            end = end_pattern.search(folded, header.end())
+            if end:
+                return text[header.end():end.start()].strip()[:2000]  # Limit length
         
         # Fallback: extract first 1000 characters as summary
         return text[:1000] + "..." if len(text) > 1000 else text
     
+
     def _extract_exclusions(self, text: str) -> List[str]:
         """Extract policy exclusions"""
         exclusions = []
-        exclusion_patterns = [
-            r'(?:Exclusions?|Not Covered|Excluded):\s*([^\n]+)',
-            r'(?:אינו מכוסה|החרגות):\s*([^\n]+)',  # Hebrew
-        ]
-        
-        for pattern in exclusion_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            exclusions.extend(matches)
+        for pattern in _candidates(_EXCLUSION_PATTERNS, text):
+            exclusions.extend(_findall(pattern, text))
         
         return exclusions
     
     def _extract_additional_benefits(self, text: str) -> List[str]:
         """Extract additional benefits and riders"""
         benefits = []
-        benefit_patterns = [
-            r'(?:Additional Benefits?|Riders?|Optional Coverage):\s*([^\n]+)',
-            r'(?:הטבות נוספות|כיסויים אופציונליים):\s*([^\n]+)',  # Hebrew
-        ]
-        
-        for pattern in benefit_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            benefits.extend(matches)
+        for pattern in _candidates(_BENEFIT_PATTERNS, text):
+            benefits.extend(_findall(pattern, text))
         
         return benefits
     
+
     def _detect_language(self, text: str) -> str:
         """Detect text language"""
         # Simple Hebrew detection
-        hebrew_chars = len(re.findall(r'[\u0590-\u05FF]', text))
-        total_chars = len(re.findall(r'[a-zA-Z\u0590-\u05FF]', text))
+        hebrew_chars, english_chars = _script_counts(_language_sample(text))
+        total_chars = hebrew_chars + english_chars
         
         if total_chars > 0 and hebrew_chars / total_chars > 0.3:
             return "he"  # Hebrew
         return "en"  # Default to English
     
+
     def _calculate_confidence(self, text: str, basic_info: Dict, coverage: Dict) -> float:
         """Calculate extraction confidence score"""
         score = 0.0
@@ -978,15 +1450,18 @@ JSON Response:"""
         
         return min(1.0, score)
     
+    def _parse_amounts(self, amount_strs: List[str]) -> List[float]:
+        """Parse a batch of monetary amounts with the same rules as _parse_amount"""
+        return [_amount_value(amount_str) for amount_str in amount_strs]
+
     def _parse_amount(self, amount_str: str) -> float:
         """Parse monetary amount from string"""
         try:
-            # Remove commas and non-digit characters except decimal point
-            clean_amount = re.sub(r'[^\d\.]', '', amount_str)
-            return float(clean_amount) if clean_amount else 0.0
+            return _amount_value(amount_str)
         except:
             return 0.0
     
+
     def _create_fallback_analysis(self, text: str) -> Dict[str, Any]:
         """Create basic analysis when detailed extraction fails"""
         return {
@@ -1002,164 +1477,37 @@ JSON Response:"""
 
     def _extract_vehicle_information(self, text: str) -> Dict[str, Any]:
         """Extract vehicle-specific information for auto policies"""
-        vehicle = {}
-        
-        vehicle_patterns = [
-            r'(?:Year|Model\s*Year):\s*([0-9]{4})',
-            r'(?:Make|Manufacturer):\s*([A-Za-z\s]+)',
-            r'(?:Model):\s*([A-Za-z0-9\s\-]+)',
-            r'(?:VIN|Vehicle\s*ID):\s*([A-Z0-9]{17})',
-            r'(?:License\s*Plate):\s*([A-Z0-9\-\s]+)',
-            r'(?:Mileage|Odometer):\s*([\d,]+)',
-        ]
-        
-        for pattern in vehicle_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                if 'year' in pattern.lower():
-                    vehicle['year'] = matches[0].strip()
-                elif 'make' in pattern.lower() or 'manufacturer' in pattern.lower():
-                    vehicle['make'] = matches[0].strip()
-                elif 'model' in pattern.lower() and 'year' not in pattern.lower():
-                    vehicle['model'] = matches[0].strip()
-                elif 'vin' in pattern.lower():
-                    vehicle['vin'] = matches[0].strip()
-                elif 'license' in pattern.lower() or 'plate' in pattern.lower():
-                    vehicle['license_plate'] = matches[0].strip()
-                elif 'mileage' in pattern.lower() or 'odometer' in pattern.lower():
-                    vehicle['mileage'] = matches[0].strip()
-        
-        return vehicle
+        return self._extract_first_matches(text, _VEHICLE_PATTERNS)
 
     def _extract_property_information(self, text: str) -> Dict[str, Any]:
         """Extract property-specific information for home policies"""
-        property_info = {}
-        
-        property_patterns = [
-            r'(?:Property\s*Address|Address):\s*([^\n\r]{10,100})',
-            r'(?:Year\s*Built|Construction\s*Year):\s*([0-9]{4})',
-            r'(?:Square\s*Feet|Sq\s*Ft):\s*([\d,]+)',
-            r'(?:Construction\s*Type|Building\s*Type):\s*([A-Za-z\s]+)',
-            r'(?:Roof\s*Type):\s*([A-Za-z\s]+)',
-            r'(?:Foundation\s*Type):\s*([A-Za-z\s]+)',
-            r'(?:Number\s*of\s*Stories):\s*([0-9\.]+)',
-        ]
-        
-        for pattern in property_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                if 'address' in pattern.lower():
-                    property_info['property_address'] = matches[0].strip()
-                elif 'year' in pattern.lower():
-                    property_info['year_built'] = matches[0].strip()
-                elif 'square' in pattern.lower() or 'sq' in pattern.lower():
-                    property_info['square_feet'] = matches[0].strip()
-                elif 'construction' in pattern.lower() or 'building' in pattern.lower():
-                    property_info['construction_type'] = matches[0].strip()
-                elif 'roof' in pattern.lower():
-                    property_info['roof_type'] = matches[0].strip()
-                elif 'foundation' in pattern.lower():
-                    property_info['foundation_type'] = matches[0].strip()
-                elif 'stories' in pattern.lower():
-                    property_info['stories'] = matches[0].strip()
-        
-        return property_info
+        return self._extract_first_matches(text, _PROPERTY_PATTERNS)
 
     def _extract_health_information(self, text: str) -> Dict[str, Any]:
         """Extract health-specific information"""
-        health = {}
-        
-        health_patterns = [
-            r'(?:Group\s*Number|Group\s*ID):\s*([A-Z0-9\-]+)',
-            r'(?:Member\s*ID|Subscriber\s*ID):\s*([A-Z0-9\-]+)',
-            r'(?:Plan\s*Type|Plan\s*Name):\s*([A-Za-z0-9\s\-]+)',
-            r'(?:Network|Provider\s*Network):\s*([A-Za-z\s]+)',
-            r'(?:PCP|Primary\s*Care\s*Physician):\s*([A-Za-z\s,\.]+)',
-            r'(?:Copay|Co[\-\s]*pay):\s*\$?([\d,]+)',
-            r'(?:Out[\-\s]*of[\-\s]*Pocket\s*Maximum):\s*\$?([\d,]+)',
-        ]
-        
-        for pattern in health_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                if 'group' in pattern.lower():
-                    health['group_number'] = matches[0].strip()
-                elif 'member' in pattern.lower() or 'subscriber' in pattern.lower():
-                    health['member_id'] = matches[0].strip()
-                elif 'plan' in pattern.lower():
-                    health['plan_type'] = matches[0].strip()
-                elif 'network' in pattern.lower():
-                    health['network'] = matches[0].strip()
-                elif 'pcp' in pattern.lower() or 'primary' in pattern.lower():
-                    health['primary_care_physician'] = matches[0].strip()
-                elif 'copay' in pattern.lower():
-                    health['copay'] = self._parse_amount(matches[0])
-                elif 'pocket' in pattern.lower():
-                    health['out_of_pocket_max'] = self._parse_amount(matches[0])
-        
-        return health
+        return self._extract_first_matches(text, _HEALTH_PATTERNS, _HEALTH_AMOUNT_FIELDS)
 
     def _extract_life_insurance_information(self, text: str) -> Dict[str, Any]:
         """Extract life insurance specific information"""
-        life = {}
-        
-        life_patterns = [
-            r'(?:Death\s*Benefit|Face\s*Amount):\s*\$?([\d,]+)',
-            r'(?:Cash\s*Value):\s*\$?([\d,]+)',
-            r'(?:Policy\s*Type):\s*([A-Za-z\s]+)',
-            r'(?:Premium\s*Mode):\s*([A-Za-z\s]+)',
-            r'(?:Dividend\s*Option):\s*([A-Za-z\s]+)',
-            r'(?:Loan\s*Value):\s*\$?([\d,]+)',
-        ]
-        
-        for pattern in life_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                if 'death' in pattern.lower() or 'face' in pattern.lower():
-                    life['death_benefit'] = self._parse_amount(matches[0])
-                elif 'cash' in pattern.lower():
-                    life['cash_value'] = self._parse_amount(matches[0])
-                elif 'type' in pattern.lower():
-                    life['policy_type'] = matches[0].strip()
-                elif 'mode' in pattern.lower():
-                    life['premium_mode'] = matches[0].strip()
-                elif 'dividend' in pattern.lower():
-                    life['dividend_option'] = matches[0].strip()
-                elif 'loan' in pattern.lower():
-                    life['loan_value'] = self._parse_amount(matches[0])
-        
-        return life
+        return self._extract_first_matches(text, _LIFE_PATTERNS, _LIFE_AMOUNT_FIELDS)
 
     def _extract_business_information(self, text: str) -> Dict[str, Any]:
         """Extract business insurance specific information"""
-        business = {}
-        
-        business_patterns = [
-            r'(?:Business\s*Name|Company\s*Name):\s*([^\n\r]{3,50})',
-            r'(?:Industry\s*Type|Business\s*Type):\s*([A-Za-z\s]+)',
-            r'(?:Number\s*of\s*Employees):\s*([\d,]+)',
-            r'(?:Annual\s*Revenue|Gross\s*Revenue):\s*\$?([\d,]+)',
-            r'(?:FEIN|Tax\s*ID):\s*([0-9\-]+)',
-            r'(?:SIC\s*Code|NAICS\s*Code):\s*([0-9]+)',
-        ]
-        
-        for pattern in business_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                if 'business' in pattern.lower() or 'company' in pattern.lower():
-                    business['business_name'] = matches[0].strip()
-                elif 'industry' in pattern.lower() or 'type' in pattern.lower():
-                    business['industry_type'] = matches[0].strip()
-                elif 'employees' in pattern.lower():
-                    business['num_employees'] = matches[0].strip()
-                elif 'revenue' in pattern.lower():
-                    business['annual_revenue'] = self._parse_amount(matches[0])
-                elif 'fein' in pattern.lower() or 'tax' in pattern.lower():
-                    business['tax_id'] = matches[0].strip()
-                elif 'sic' in pattern.lower() or 'naics' in pattern.lower():
-                    business['industry_code'] = matches[0].strip()
-        
-        return business
+        return self._extract_first_matches(text, _BUSINESS_PATTERNS, _BUSINESS_AMOUNT_FIELDS)
+
+    def _extract_first_matches(self, text: str, patterns, amount_fields=frozenset()) -> Dict[str, Any]:
+        """Store the first match of each (pattern, field) pair; later patterns for a field win"""
+        extracted = {}
+        for pattern, field in _candidates(patterns, text):
+            if field is None:
+                continue
+            found = _first_found(pattern, text)
+            if found is not None:
+                if field in amount_fields:
+                    extracted[field] = self._parse_amount(found)
+                else:
+                    extracted[field] = found.strip()
+        return extracted
 
     def _calculate_extraction_confidence(self, analysis: Dict[str, Any], text: str) -> float:
         """Calculate confidence score based on extracted parameters"""
@@ -1186,16 +1534,16 @@ JSON Response:"""
         count = 0
         for section in analysis.values():
             if isinstance(section, dict):
-                count += len([v for v in section.values() if v])
+                count += sum(1 for v in section.values() if v)
             elif section:
                 count += 1
         return count
 
     def _detect_document_language(self, text: str) -> str:
         """Enhanced language detection"""
-        hebrew_chars = len(re.findall(r'[\u0590-\u05FF]', text))
-        english_chars = len(re.findall(r'[a-zA-Z]', text))
-        total_chars = len(text)
+        sample = _language_sample(text)
+        hebrew_chars, english_chars = _script_counts(sample)
+        total_chars = len(sample)
         
         if total_chars == 0:
             return "unknown"
@@ -1210,39 +1558,91 @@ JSON Response:"""
         else:
             return "mixed"
 
-def parse_csv(lines) -> List[Dict]:
-    """Parse CSV policy data"""
-    reader = csv.DictReader(lines)
-    rows = []
+_CSV_FIELDS = (
+    "owner_name", "insurer", "product_type", "policy_number", "start_date", "end_date",
+    "premium_monthly", "deductible", "coverage_limit", "notes",
+)
+
+def parse_csv(lines) -> Iterator[Dict]:
+    """Parse CSV policy data, yielding one policy dict per row as it is read"""
+    reader = csv.reader(lines)
+    header = next(reader, None)
+    if header is None:
+        return
+    # Column positions are resolved once; fields missing from the header read the
+    # empty cell appended to every row, and short rows are padded with empty cells
+    width = len(header)
+    columns = {name: index for index, name in enumerate(header)}
+    (owner_name, insurer, product_type, policy_number, start_date, end_date,
+     premium_monthly, deductible, coverage_limit, notes) = (columns.get(field, -1) for field in _CSV_FIELDS)
     for row in reader:
-        rows.append({
-            "owner_name": row.get("owner_name","").strip(),
-            "insurer": row.get("insurer","").strip(),
-            "product_type": normalize_product(row.get("product_type","").strip()),
-            "policy_number": row.get("policy_number","").strip(),
-            "start_date": row.get("start_date","").strip(),
-            "end_date": row.get("end_date","").strip(),
-            "premium_monthly": float(row.get("premium_monthly",0) or 0),
-            "deductible": float(row.get("deductible",0) or 0),
-            "coverage_limit": float(row.get("coverage_limit",0) or 0),
-            "notes": row.get("notes","").strip()
-        })
-    return rows
+        if not row:
+            continue
+        if len(row) < width:
+            row += [""] * (width - len(row))
+        row.append("")
+        yield {
+            "owner_name": row[owner_name].strip(),
+            "insurer": row[insurer].strip(),
+            "product_type": normalize_product(row[product_type].strip()),
+            "policy_number": row[policy_number].strip(),
+            "start_date": row[start_date].strip(),
+            "end_date": row[end_date].strip(),
+            "premium_monthly": float(row[premium_monthly] or 0),
+            "deductible": float(row[deductible] or 0),
+            "coverage_limit": float(row[coverage_limit] or 0),
+            "notes": row[notes].strip()
+        }
+
+_PRODUCT_ALIASES = {
+    "auto": ["car","vehicle","auto","רכב"],
+    "home": ["home","house","property","בית","דירה"],
+    "health": ["health","medical","בריאות","רפואי"],
+    "life": ["life","term life","whole life","חיים"],
+    "disability": ["disability","income protection","נכות"]
+}
+# alias -> product type, one hash lookup per CSV row
+_PRODUCT_BY_ALIAS = {alias: key for key, vals in _PRODUCT_ALIASES.items() for alias in vals}
 
 def normalize_product(product: str) -> str:
     """Normalize product type names"""
     m = product.strip().lower()
-    aliases = {
-        "auto": ["car","vehicle","auto","רכב"],
-        "home": ["home","house","property","בית","דירה"],
-        "health": ["health","medical","בריאות","רפואי"],
-        "life": ["life","term life","whole life","חיים"],
-        "disability": ["disability","income protection","נכות"]
-    }
-    for key, vals in aliases.items():
-        if m in vals:
-            return key
-    return m
+    return _PRODUCT_BY_ALIAS.get(m, m)
 
 # Initialize global analyzer
-policy_analyzer = PolicyAnalyzer()
\ No newline at end of file
+policy_analyzer = PolicyAnalyzer()
+
+# Regex extraction is CPU-bound, so it runs in worker processes rather than on
+# the event loop; each worker compiles the pattern tables when it imports this module
+_REGEX_WORKERS = settings.NLP_REGEX_WORKERS or os.cpu_count() or 1
+_REGEX_POOL = WorkerPool("Regex analysis", _REGEX_WORKERS)
+# Within a worker, one document's section extractors run on threads; re2 matches
+# without holding the GIL. The workers share the CPUs between them, so with every
+# worker busy there is still about one thread per CPU. Threads start on first
+# use, i.e. only inside workers
+_EXTRACTOR_POOL = ThreadPoolExecutor(
+    max_workers=settings.NLP_EXTRACTOR_THREADS or max(1, (os.cpu_count() or 1) // _REGEX_WORKERS)
+)
+
+def _run_regex_analysis(text: str, policy_type: str) -> Dict[str, Any]:
+    """Process-pool entry point for PolicyAnalyzer._regex_analysis"""
+    return policy_analyzer._regex_analysis(text, policy_type)
+
+# Re-uploaded and re-analyzed documents skip the regex battery; keyed by a digest
+# so the cache does not hold on to full document texts
+_REGEX_CACHE_SIZE = 256
+_regex_results: "OrderedDict[Tuple[bytes, str], Dict[str, Any]]" = OrderedDict()
+
+async def _cached_regex_analysis(text: str, policy_type: str) -> Dict[str, Any]:
+    """Regex analysis from the worker pool, memoized per (text, policy type)"""
+    key = (hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest(), policy_type)
+    if key in _regex_results:
+        _regex_results.move_to_end(key)
+    else:
+        analysis = await _REGEX_POOL.run(_run_regex_analysis, text, policy_type)
+        _regex_results[key] = analysis
+        while len(_regex_results) > _REGEX_CACHE_SIZE:
+            _regex_results.popitem(last=False)
+    # Callers merge into and annotate the result, so each gets its own copy
+    return copy.deepcopy(_regex_results[key])
+
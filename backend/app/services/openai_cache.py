@@ -0,0 +1,247 @@
+"""
+Persistent cache for OpenAI responses, keyed by request content
+"""
+import hashlib
+import math
+import operator
+import sqlite3
+import threading
+from array import array
+from collections import OrderedDict
+from contextlib import closing
+from datetime import datetime
+from difflib import SequenceMatcher
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import logging
+from ..core.settings import settings
+try:
+    import numpy as np  # type: ignore  # one matrix product per semantic lookup
+    NUMPY_AVAILABLE = True
+except Exception:
+    np = None
+    NUMPY_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# enabled: read and write; replay: read only, never call the API on a miss;
+# write_only: always call the API and refresh the entry; disabled: bypass
+CACHE_MODES = ("enabled", "replay", "write_only", "disabled")
+
+class OpenAIResponseCache:
+    """SQLite-backed response cache with a small in-process LRU in front"""
+
+    def __init__(self, path: str = "openai_cache.db", mode: str = "enabled", memory_size: int = 128):
+        if mode not in CACHE_MODES:
+            logger.warning(f"Unknown OpenAI cache mode '{mode}', caching disabled")
+            mode = "disabled"
+        self.path = path
+        self.mode = mode
+        self.memory_size = memory_size
+        self._memory: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._table_ready = False
+
+    @staticmethod
+    def make_key(text: str, **params) -> str:
+        """SHA-256 over whitespace-normalized text plus every request parameter"""
+        normalized = " ".join(text.split())
+        header = "|".join(f"{name}={params[name]}" for name in sorted(params))
+        return hashlib.sha256(f"{header}|{normalized}".encode("utf-8")).hexdigest()
+
+    @property
+    def readable(self) -> bool:
+        return self.mode in ("enabled", "replay")
+
+    @property
+    def writable(self) -> bool:
+        return self.mode in ("enabled", "write_only")
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path)
+        if not self._table_ready:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS openai_cache ("
+                "key TEXT PRIMARY KEY, response_json TEXT NOT NULL, created_at TIMESTAMP)"
+            )
+            self._table_ready = True
+        return conn
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response text, or None on a miss"""
+        if not self.readable:
+            return None
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return self._memory[key]
+        try:
+            with closing(self._connect()) as conn:
+                row = conn.execute("SELECT response_json FROM openai_cache WHERE key = ?", (key,)).fetchone()
+        except sqlite3.Error as e:
+            logger.error(f"OpenAI cache read failed: {e}")
+            return None
+        if row is None:
+            return None
+        self._remember(key, row[0])
+        return row[0]
+
+    def put(self, key: str, response: str) -> None:
+        """Store a response; failures are logged and otherwise ignored"""
+        if not self.writable:
+            return
+        self._remember(key, response)
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO openai_cache (key, response_json, created_at) VALUES (?, ?, ?)",
+                    (key, response, datetime.utcnow().isoformat()),
+                )
+        except sqlite3.Error as e:
+            logger.error(f"OpenAI cache write failed: {e}")
+
+    def _remember(self, key: str, response: str) -> None:
+        with self._lock:
+            self._memory[key] = response
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_size:
+                self._memory.popitem(last=False)
+
+class SemanticResponseCache:
+    """Near-duplicate lookup over embeddings of previously analyzed documents.
+
+    Templated policies and renewals differ only in names, numbers and dates, so
+    a cached response is reused when the cosine similarity of the embeddings
+    exceeds the threshold and the opening text of both documents still agrees.
+    Only the newest max_entries documents per scope are kept.
+    """
+
+    def __init__(self, path: str = "openai_cache.db", enabled: bool = False, threshold: float = 0.98,
+                 prefix_chars: int = 1000, prefix_ratio: float = 0.9, max_entries: int = 2000):
+        self.path = path
+        self.enabled = enabled
+        self.threshold = threshold
+        self.prefix_chars = prefix_chars
+        self.prefix_ratio = prefix_ratio
+        self.max_entries = max_entries
+        # scope -> [(unit embedding, text prefix, response)], oldest first; loaded from SQLite on first use
+        self._entries: "Optional[Dict[str, List[Tuple[array, str, str]]]]" = None
+        # scope -> stacked embeddings of the scope's entries (None if sizes differ), rebuilt after a put
+        self._matrices: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def _prefix(self, text: str) -> str:
+        return " ".join(text.split())[:self.prefix_chars]
+
+    @staticmethod
+    def _unit(embedding: Sequence[float]) -> array:
+        norm = math.sqrt(sum(value * value for value in embedding)) or 1.0
+        return array("f", (value / norm for value in embedding))
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS openai_semantic_cache ("
+            "scope TEXT NOT NULL, embedding BLOB NOT NULL, text_prefix TEXT NOT NULL, "
+            "response_json TEXT NOT NULL, created_at TIMESTAMP)"
+        )
+        return conn
+
+    def _load(self) -> Dict[str, List[Tuple[array, str, str]]]:
+        with self._lock:
+            if self._entries is None:
+                entries: Dict[str, List[Tuple[array, str, str]]] = {}
+                try:
+                    with closing(self._connect()) as conn:
+                        for scope, blob, prefix, response in conn.execute(
+                            "SELECT scope, embedding, text_prefix, response_json FROM openai_semantic_cache ORDER BY rowid"
+                        ):
+                            vector = array("f")
+                            vector.frombytes(blob)
+                            entries.setdefault(scope, []).append((vector, prefix, response))
+                except sqlite3.Error as e:
+                    logger.error(f"Semantic cache load failed: {e}")
+                for scope_entries in entries.values():
+                    del scope_entries[:-self.max_entries]
+                self._entries = entries
+            return self._entries
+
+    def _best_match(self, scope: str, vector: array) -> Optional[Tuple[str, str]]:
+        """(prefix, response) of the most similar entry above the threshold"""
+        with self._lock:
+            scope_entries = self._entries.get(scope, [])
+            if not scope_entries:
+                return None
+            if NUMPY_AVAILABLE and scope not in self._matrices:
+                dimensions = {len(entry_vector) for entry_vector, _, _ in scope_entries}
+                # One matrix product when every stored embedding has the same size
+                self._matrices[scope] = (
+                    np.array([entry_vector for entry_vector, _, _ in scope_entries], dtype=np.float32)
+                    if len(dimensions) == 1 else None
+                )
+            matrix = self._matrices.get(scope)
+            if matrix is not None and matrix.shape[1] == len(vector):
+                similarities = matrix @ np.frombuffer(vector, dtype=np.float32)
+                index = int(similarities.argmax())
+                if similarities[index] <= self.threshold:
+                    return None
+                _, prefix, response = scope_entries[index]
+                return prefix, response
+            best, best_similarity = None, self.threshold
+            for entry_vector, prefix, response in scope_entries:
+                if len(entry_vector) != len(vector):
+                    continue
+                similarity = sum(map(operator.mul, vector, entry_vector))
+                if similarity > best_similarity:
+                    best, best_similarity = (prefix, response), similarity
+            return best
+
+    def get(self, embedding: Sequence[float], text: str, scope: str) -> Optional[str]:
+        """Return the response cached for the most similar document in scope, or None"""
+        if not self.enabled:
+            return None
+        self._load()
+        best = self._best_match(scope, self._unit(embedding))
+        if best is None:
+            return None
+        # Embeddings of long documents can be close while the documents are not;
+        # the opening text has to agree as well
+        prefix, response = best
+        if SequenceMatcher(None, prefix, self._prefix(text), autojunk=False).ratio() < self.prefix_ratio:
+            return None
+        return response
+
+    def put(self, embedding: Sequence[float], text: str, scope: str, response: str) -> None:
+        """Remember a response; failures are logged and otherwise ignored"""
+        if not self.enabled:
+            return
+        vector = self._unit(embedding)
+        prefix = self._prefix(text)
+        entries = self._load()
+        with self._lock:
+            scope_entries = entries.setdefault(scope, [])
+            scope_entries.append((vector, prefix, response))
+            del scope_entries[:-self.max_entries]
+            self._matrices.pop(scope, None)
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute(
+                    "INSERT INTO openai_semantic_cache (scope, embedding, text_prefix, response_json, created_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (scope, vector.tobytes(), prefix, response, datetime.utcnow().isoformat()),
+                )
+                conn.execute(
+                    "DELETE FROM openai_semantic_cache WHERE scope = ? AND rowid NOT IN ("
+                    "SELECT rowid FROM openai_semantic_cache WHERE scope = ? ORDER BY rowid DESC LIMIT ?)",
+                    (scope, scope, self.max_entries),
+                )
+        except sqlite3.Error as e:
+            logger.error(f"Semantic cache write failed: {e}")
+
+# Global cache instances
+openai_cache = OpenAIResponseCache(settings.OPENAI_CACHE_PATH, settings.OPENAI_CACHE_MODE)
+semantic_cache = SemanticResponseCache(
+    settings.OPENAI_CACHE_PATH,
+    enabled=settings.OPENAI_SEMANTIC_CACHE,
+    threshold=settings.OPENAI_SEMANTIC_THRESHOLD,
+    max_entries=settings.OPENAI_SEMANTIC_MAX_ENTRIES,
+)
@@ -1,38 +1,372 @@
-from typing import Dict, List, Tuple
-from pdfminer.high_level import extract_text
+from typing import Any, Dict, FrozenSet, Iterator, List, Optional, Tuple
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 import re
 import json
-from .nlp import policy_analyzer
+from .nlp import _AMOUNT_CHARS, _anchor_keywords, _fold, _script_counts, policy_analyzer
+from .regex_engine import RE2_AVAILABLE, PatternSet, compile_pattern
+from .worker_pool import WorkerPool
 from ..core.sanitization import input_sanitizer
+from ..core.settings import settings
 try:
-    from PIL import Image  # type: ignore
+    from PIL import Image, ImageSequence  # type: ignore
     import pytesseract  # type: ignore
     _OCR_AVAILABLE = True
 except Exception:
     _OCR_AVAILABLE = False
+try:
+    import cv2  # type: ignore  # scan clean-up before OCR
+    import numpy as np  # type: ignore
+    _CV2_AVAILABLE = True
+except Exception:
+    _CV2_AVAILABLE = False
+try:
+    import tesserocr  # type: ignore  # in-process tesseract, model loaded once per thread
+    _TESSEROCR_AVAILABLE = True
+except Exception:
+    _TESSEROCR_AVAILABLE = False
+try:
+    import pypdfium2  # type: ignore  # native PDF text extraction and page rendering
+    _PDFIUM_AVAILABLE = True
+except Exception:
+    _PDFIUM_AVAILABLE = False
+try:
+    import ahocorasick  # type: ignore  # one-pass coverage keyword scan (pyahocorasick)
+    _AHOCORASICK_AVAILABLE = True
+except Exception:
+    _AHOCORASICK_AVAILABLE = False
+try:
+    from pdfminer.high_level import extract_text  # pure-Python fallback when pdfium is missing or fails
+    _PDFMINER_AVAILABLE = True
+except Exception:
+    _PDFMINER_AVAILABLE = False
+import asyncio
+import copy
+import hashlib
 import io
+import logging
+import mmap
+import os
+import tempfile
+import threading
+
+logger = logging.getLogger(__name__)
 
-def _text_from_pdf(file_path: str) -> str:
+@contextmanager
+def _pdf_buffer(file_path: str, raw_bytes: Optional[bytes]) -> Iterator:
+    """The PDF's bytes: raw_bytes when the caller already holds them, else the file memory-mapped"""
+    if raw_bytes is not None:
+        yield raw_bytes
+        return
     try:
-        return extract_text(file_path) or ""
+        with open(file_path, 'rb') as f:
+            # mmap cannot map an empty file
+            if os.fstat(f.fileno()).st_size == 0:
+                yield b''
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                yield mapped
+    except OSError:
+        yield b''
+
+def _text_from_pdf(pdf_bytes, file_path: str = "") -> str:
+    if _PDFIUM_AVAILABLE:
+        try:
+            # A memory-mapped file is opened by path so pdfium reads it without
+            # first copying the whole mapping into a bytes object
+            return _pdfium_text(pdf_bytes if isinstance(pdf_bytes, bytes) else file_path or bytes(pdf_bytes))
+        except Exception:
+            pass  # Let pdfminer try files pdfium rejects
+    if not _PDFMINER_AVAILABLE:
+        return ""
+    try:
+        return extract_text(io.BytesIO(pdf_bytes)) or ""
     except Exception:
         return ""
 
-def _ocr_first_page(file_bytes: bytes) -> str:
+def _pdfium_text(source) -> str:
+    """Text of every page via pdfium, many times faster than pdfminer's pure-Python parser;
+    source is the PDF's bytes or its path"""
+    pdf = pypdfium2.PdfDocument(source)
+    try:
+        pages = []
+        for page in pdf:
+            textpage = page.get_textpage()
+            try:
+                pages.append(textpage.get_text_range())
+            finally:
+                textpage.close()
+                page.close()
+        return "\n".join(pages)
+    finally:
+        pdf.close()
+
+def _page_images(file_bytes: bytes) -> List:
+    """Every page of a PDF (or frame of an image file) as a PIL image"""
+    if file_bytes[:4] == b'%PDF':
+        if not _PDFIUM_AVAILABLE:
+            return []
+        pdf = pypdfium2.PdfDocument(bytes(file_bytes))
+        try:
+            return [page.render(scale=2).to_pil() for page in pdf]
+        finally:
+            pdf.close()
+    img = Image.open(io.BytesIO(file_bytes))
+    return [frame.convert('RGB') for frame in ImageSequence.Iterator(img)]
+
+def _preprocess_for_ocr(image):
+    """Grayscale, denoised and adaptively binarized copy of a scanned page.
+
+    Clean black-on-white input reads more accurately and leaves tesseract's
+    layout analysis less to search through.
+    """
+    if not _CV2_AVAILABLE:
+        return image
+    gray = np.asarray(image.convert('L'))
+    gray = cv2.fastNlMeansDenoising(gray, h=10)
+    binary = cv2.adaptiveThreshold(gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 31, 10)
+    return Image.fromarray(binary)
+
+# One tesserocr handle per thread; a handle is not safe to share between threads
+_tesseract = threading.local()
+
+def _tesseract_api():
+    api = getattr(_tesseract, 'api', None)
+    if api is None:
+        api = tesserocr.PyTessBaseAPI(psm=tesserocr.PSM.SINGLE_BLOCK, oem=tesserocr.OEM.LSTM_ONLY)
+        _tesseract.api = api
+    return api
+
+def _ocr_image(image) -> str:
+    api = _tesseract_api()
+    api.SetImage(image)
+    return api.GetUTF8Text()
+
+# Pages are OCR'd as horizontal strips on threads; tesserocr releases the GIL
+# while recognizing, and each thread has its own handle. Strips are cut on
+# blank pixel rows, so no text line is split between two strips
+_OCR_STRIPS = 4
+_OCR_MIN_STRIP_HEIGHT = 128
+_OCR_BLANK_LEVEL = 128
+_OCR_STRIP_POOL = ThreadPoolExecutor(max_workers=_OCR_STRIPS)
+
+def _is_blank_row(gray, y: int) -> bool:
+    return gray.crop((0, y, gray.width, y + 1)).getextrema()[0] >= _OCR_BLANK_LEVEL
+
+def _strip_bounds(gray) -> List[Tuple[int, int]]:
+    """Row ranges of the strips, each cut at the blank row nearest an even split
+
+    A split with no blank row within half a strip of it is left out, so its
+    neighbouring strips are read as one.
+    """
+    height = gray.height
+    step = -(-height // _OCR_STRIPS)
+    reach = step // 2
+    cuts = [0]
+    for nominal in range(step, height, step):
+        rows = range(max(cuts[-1] + 1, nominal - reach), min(height, nominal + reach))
+        cut = next((y for y in sorted(rows, key=lambda y: abs(y - nominal)) if _is_blank_row(gray, y)), None)
+        if cut is not None:
+            cuts.append(cut)
+    cuts.append(height)
+    return list(zip(cuts, cuts[1:]))
+
+def _ocr_tiled(image) -> str:
+    """OCR one page as horizontal strips in parallel, text in reading order"""
+    width, height = image.size
+    if height < _OCR_STRIPS * _OCR_MIN_STRIP_HEIGHT:
+        return _ocr_image(image)
+    bounds = _strip_bounds(image.convert('L'))
+    if len(bounds) == 1:
+        return _ocr_image(image)
+    strips = [image.crop((0, top, width, bottom)) for top, bottom in bounds]
+    texts = _OCR_STRIP_POOL.map(_ocr_image, strips)
+    return "\n".join(text.strip('\n') for text in texts if text.strip())
+
+def _ocr_all_pages(file_bytes: bytes) -> str:
+    """OCR all pages, in-process via tesserocr or with a single tesseract run over a multi-page TIFF"""
     if not _OCR_AVAILABLE:
         return ""
     try:
-        img = Image.open(io.BytesIO(file_bytes))
-        return pytesseract.image_to_string(img)
+        images = [_preprocess_for_ocr(image) for image in _page_images(file_bytes)]
+        if not images:
+            return ""
+        if _TESSEROCR_AVAILABLE:
+            # tesseract's own text output ends each page with a form feed
+            return "".join(_ocr_tiled(image) + "\f" for image in images)
+        # tesseract reads every page of a TIFF given by path, so its start-up
+        # cost is paid once per document instead of once per page
+        fd, tiff_path = tempfile.mkstemp(suffix='.tiff')
+        try:
+            with os.fdopen(fd, 'wb') as tiff:
+                images[0].save(tiff, format='TIFF', save_all=True, append_images=images[1:])
+            return pytesseract.image_to_string(tiff_path, config='--psm 6 --oem 1')
+        finally:
+            os.remove(tiff_path)
     except Exception:
         return ""
 
+# Hebrew and English/standard document patterns. No upload path calls
+# _extract_hebrew_insurance_fields or _extract_standard_insurance_fields (documents
+# go through policy_analyzer), so the tables are compiled on first use rather
+# than at import in the server and every extraction worker
+# Company name patterns (Hebrew) - More comprehensive
+_HE_COMPANY_PATTERNS = (
+    r'(אדנל.*?(?:קבוצת|חברת|בע"מ))',  # Landa Group (Hebrew RTL)
+    r'(לנדא.*?(?:קבוצה|חברה|בע"מ))',  # Landa Group (alternative)
+    r'(Applied.*?Materials.*?Israel)',
+    r'(מנורה.*?מבטחים)',
+    r'(הפניקס.*?חברה.*?לביטוח)',
+    r'(כלל.*?ביטוח)',
+    r'(הראל.*?ביטוח)',
+    r'(מגדל.*?ביטוח)',
+    r'(איילון.*?ביטוח)',
+    r'([^\n]*סבל.*?אדנל[^\n]*)',  # "סבל אדנל" (Leseb Landa)
+    r'([^\n]*בע"מ[^\n]*)',  # Any company with Ltd designation
+    r'([^\n]*עמ"ב[^\n]*)',  # Reverse Hebrew Ltd
+)
+
+# Employee/Group patterns for owner identification
+_HE_EMPLOYEE_PATTERNS = (
+    r'([^\n]*(?:עובדי|עובדים).*?(?:קבוצת|חברת|אדנל)[^\n]*)',
+    r'([^\n]*(?:קבוצת|חברת).*?(?:אדנל|לנדא)[^\n]*)',
+    r'([^\n]*(?:אדנל|לנדא).*?(?:עובדי|עובדים)[^\n]*)',
+    r'([^\n]*(?:בני משפחתם|בני משפחת)[^\n]*)',
+    r'([^\n]*ידבועל.*?אדנל[^\n]*)',  # RTL: "לעובדי אדנל"
+)
+
+# Policy number patterns - Dynamic search
+_HE_POLICY_PATTERNS = (
+    r'(?:פוליסה.*?מספר|מספר.*?פוליסה)[:\s]*([A-Z0-9\-]+)',
+    r'פוליסה[:\s]*([A-Z0-9\-]{5,})',
+    r'מספר[:\s]*([A-Z0-9\-]{5,})',
+    r'([A-Z]{2,}\-[0-9]{4,}\-[0-9]{4})',  # Pattern like XXX-YYYY-ZZZZ
+    r'([0-9]{4,})',  # Fallback to any 4+ digit number
+)
+
+# Product type identification - Enhanced patterns
+_HE_PRODUCT_PATTERNS = (
+    (r'(?:ביטוח.*?בריאות|בריאות.*?ביטוח|תואירב.*?חוטיב)', 'Health Insurance'),
+    (r'(?:ביטוח.*?רכב|רכב.*?ביטוח)', 'Auto Insurance'),
+    (r'(?:ביטוח.*?דירה|דירה.*?ביטוח|ביטוח.*?דיור)', 'Home Insurance'),
+    (r'(?:ביטוח.*?חיים|חיים.*?ביטוח)', 'Life Insurance'),
+    (r'(?:ביטוח.*?נסיעות|נסיעות.*?ביטוח)', 'Travel Insurance'),
+    (r'(?:ביטוח.*?קבוצתי|קבוצתי.*?ביטוח|יתצובק.*?תואירב)', 'Group Insurance'),
+    (r'(?:ביטוח.*?משלים|משלים.*?ביטוח)', 'Supplementary Insurance'),
+    (r'(?:תנאי.*?הביטוח|חוברת.*?תנאי|יאנת.*?תרבוח)', 'Insurance Terms'),
+)
+
+# Date patterns - More flexible
+_HE_DATE_PATTERNS = (
+    (r'(?:תחילת.*?ביטוח|מתחיל.*?ביטוח)[:\s]*(\d{1,2}\.\d{1,2}\.\d{4})', 'start_date'),
+    (r'(?:סיום.*?ביטוח|מסתיים.*?ביטוח)[:\s]*(\d{1,2}\.\d{1,2}\.\d{4})', 'end_date'),
+    (r'(?:תקופת.*?ביטוח)[:\s]*(\d{1,2}\.\d{1,2}\.\d{4})', 'start_date'),
+    (r'(?:עד.*?תאריך|בתוקף.*?עד)[:\s]*(\d{1,2}\.\d{1,2}\.\d{4})', 'end_date'),
+    (r'(\d{1,2}\.\d{1,2}\.\d{4})', 'date_found'),  # Any date
+)
+
+# Financial information - Enhanced patterns
+_HE_FINANCIAL_PATTERNS = (
+    (r'(?:פרמיה.*?חודשית|תשלום.*?חודשי)[:\s]*(\d+(?:,\d{3})*(?:\.\d{2})?)', 'premium_monthly'),
+    (r'(?:פרמיה.*?שנתית|תשלום.*?שנתי)[:\s]*(\d+(?:,\d{3})*(?:\.\d{2})?)', 'premium_annual'),
+    (r'(?:השתתפות.*?עצמית|השתתפות)[:\s]*₪?\s*(\d+(?:,\d{3})*)', 'deductible'),
+    (r'(?:סכום.*?ביטוח|כיסוי.*?מקסימלי)[:\s]*₪?\s*(\d+(?:,\d{3})*)', 'coverage_limit'),
+)
+_HE_SHEKEL_AMOUNT_PATTERN = r'₪\s*(\d+(?:,\d{3})*)'
+
+# Contact information - Enhanced patterns
+_HE_CONTACT_PATTERNS = (
+    (r'(?:דוא"ל|מייל)[:\s]*([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})', 'contact_email'),
+    (r'(?:טלפון|פקס)[:\s]*(\d{2,3}\-\d{7})', 'contact_phone'),
+    (r'(\d{2,3}\-\d{7})', 'phone_found'),  # Any phone number
+    (r'([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})', 'email_found'),  # Any email
+)
+
+# Coverage details extraction - Dynamic
+_HE_COVERAGE_KEYWORDS = (
+    'השתלות', 'ניתוחים', 'טיפולים', 'בדיקות', 'רפואה משלימה',
+    'רופא משפחה', 'מומחה', 'אשפוז', 'חירום', 'רפואה פרטית',
+    'תולתשה', 'םיחותינ', 'םילופיט', 'תוקידב', 'המילשמ האופר',  # RTL variations
+    'החפשמ אפור', 'החמומ', 'זופשא', 'םורח', 'תיטרפ האופר'
+)
+# Lines kept per coverage keyword
+_HE_COVERAGE_LINES = 3
+
+# Agent/Contact person patterns
+_HE_AGENT_PATTERNS = (
+    r'(?:סוכן|נציג|איש קשר)[:\s]*([^\n]+)',
+    r'([^\n]*דורביט[^\n]*)',  # Insurance agency
+    r'([^\n]*תיווך[^\n]*)',   # Brokerage
+)
+
+# English/standard document patterns: field -> patterns tried in order
+_STANDARD_FIELD_SOURCES = (
+    ("owner_name", (r"(?:Insured|Named Insured|Owner|Policy Holder)[:\s]*(.+?)(?:\n|$)", r"Insured[:\s]+(.+?)(?:\n|$)")),
+    ("insurer", (r"(?:Company|Insurer|Insurance Company)[:\s]*(.+?)(?:\n|$)", r"(ALLSTATE|STATE FARM|PROGRESSIVE|GEICO|FARMERS|LIBERTY MUTUAL|USAA|AMERICAN FAMILY)")),
+    ("product_type", (r"(?:Product Type|Coverage Type|Policy Type)[:\s]*(.+?)(?:\n|$)", r"(Home|Auto|Life|Health|Renters?) Insurance")),
+    ("policy_number", (r"Policy\s*(?:Number|No\.?|#)[:\s]*([A-Z0-9\-]+)", r"Policy Number[:\s]*([A-Z0-9\-]+)")),
+    ("start_date", (r"(?:Effective Date|Start Date|Policy Period)[:\s]*([0-9]{1,2}[/-][0-9]{1,2}[/-][0-9]{4})", r"Effective Date[:\s]*([A-Za-z]+ [0-9]{1,2}, [0-9]{4})")),
+    ("end_date", (r"(?:Expiration Date|End Date|Renewal Date)[:\s]*([0-9]{1,2}[/-][0-9]{1,2}[/-][0-9]{4})", r"Expiration Date[:\s]*([A-Za-z]+ [0-9]{1,2}, [0-9]{4})")),
+    ("premium_monthly", (r"(?:Monthly Premium|Monthly Payment)[:\s]*\$?([0-9,]+\.?[0-9]*)", r"Premium[:\s]*\$?([0-9,]+\.?[0-9]*)")),
+    ("premium_annual", (r"(?:Annual Premium|Yearly Premium)[:\s]*\$?([0-9,]+\.?[0-9]*)",)),
+    ("deductible", (r"Deductible[:\s]*\$?([0-9,]+\.?[0-9]*)",)),
+    ("coverage_limit", (r"(?:Total Coverage|Coverage Limit|Total Limit)[:\s]*\$?([0-9,]+\.?[0-9]*)", r"(?:Dwelling Coverage|Coverage)[:\s]*\$?([0-9,]+\.?[0-9]*)")),
+    ("contact_phone", (r"(?:Phone|Tel|Contact)[:\s]*([0-9\-\(\)\+\s]+)",)),
+    ("contact_email", (r"([a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+)",)),
+)
+
+def _keyword_automaton(keywords):
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+@lru_cache(maxsize=None)
+def _hebrew_tables() -> Dict[str, Any]:
+    """Compiled Hebrew pattern tables, built on first call"""
+    def compiled(patterns, flags=0):
+        return tuple(compile_pattern(pattern, flags) for pattern in patterns)
+    def labelled(pairs, flags=0):
+        return tuple((compile_pattern(pattern, flags), label) for pattern, label in pairs)
+    return {
+        'company': compiled(_HE_COMPANY_PATTERNS, re.IGNORECASE),
+        'employee': compiled(_HE_EMPLOYEE_PATTERNS),
+        'policy': compiled(_HE_POLICY_PATTERNS),
+        'product': labelled(_HE_PRODUCT_PATTERNS, re.IGNORECASE),
+        'date': labelled(_HE_DATE_PATTERNS),
+        'financial': labelled(_HE_FINANCIAL_PATTERNS),
+        'shekel': compile_pattern(_HE_SHEKEL_AMOUNT_PATTERN),
+        'contact': labelled(_HE_CONTACT_PATTERNS),
+        'agent': compiled(_HE_AGENT_PATTERNS),
+        'coverage': _keyword_automaton(_HE_COVERAGE_KEYWORDS) if _AHOCORASICK_AVAILABLE else None,
+    }
+
+@lru_cache(maxsize=None)
+def _standard_tables() -> Dict[str, Any]:
+    """Compiled English/standard field patterns and their prefilters, built on first call"""
+    sources = [pattern for _, patterns in _STANDARD_FIELD_SOURCES for pattern in patterns]
+    # Without re2, a keyword scan rules out patterns whose anchor word is absent
+    anchors = tuple(_anchor_keywords(pattern) for pattern in sources)
+    anchor_words = frozenset(k for keywords in anchors if keywords for k in keywords)
+    return {
+        'fields': tuple(
+            (field, tuple(compile_pattern(pattern, re.IGNORECASE) for pattern in patterns))
+            for field, patterns in _STANDARD_FIELD_SOURCES
+        ),
+        # One pass over the text tells which of the patterns can match at all
+        'set': PatternSet(sources, re.IGNORECASE) if RE2_AVAILABLE else None,
+        'anchors': anchors,
+        'anchor_words': anchor_words,
+        'automaton': _keyword_automaton(anchor_words) if _AHOCORASICK_AVAILABLE else None,
+    }
+
 def _detect_language(text: str) -> str:
     """Detect the primary language of the document"""
-    # Check for Hebrew characters
-    hebrew_chars = len(re.findall(r'[\u0590-\u05FF]', text))
-    # Check for English characters  
-    english_chars = len(re.findall(r'[a-zA-Z]', text))
+    # One counting pass, shared with the analyzer's cache for the same text
+    hebrew_chars, english_chars = _script_counts(text)
     
     if hebrew_chars > english_chars * 2:
         return "he"  # Hebrew
@@ -41,119 +375,102 @@ def _detect_language(text: str) -> str:
     else:
         return "unknown"
 
+def _first_found(pattern, text: str):
+    """pattern.findall(text)[0] without scanning past the first match; None when nothing matches"""
+    match = pattern.search(text)
+    if match is None:
+        return None
+    if pattern.groups == 0:
+        return match.group()
+    values = match.groups('')
+    return values[0] if pattern.groups == 1 else values
+
+def _lines_containing(text: str, keyword: str, limit: int) -> List[str]:
+    """First `limit` lines containing keyword, found with str.find instead of a full regex scan"""
+    lines = []
+    index = text.find(keyword)
+    while index != -1 and len(lines) < limit:
+        start = text.rfind('\n', 0, index) + 1
+        end = text.find('\n', index)
+        if end == -1:
+            end = len(text)
+        lines.append(text[start:end])
+        index = text.find(keyword, end)
+    return lines
+
+def _coverage_lines(text: str) -> Dict[str, List[str]]:
+    """Up to _HE_COVERAGE_LINES lines per coverage keyword, keywords in table order"""
+    if not _AHOCORASICK_AVAILABLE:
+        found = {}
+        for keyword in _HE_COVERAGE_KEYWORDS:
+            matches = _lines_containing(text, keyword, _HE_COVERAGE_LINES)
+            if matches:
+                found[keyword] = matches
+        return found
+    # One automaton pass finds every keyword; hits arrive in text order
+    lines: Dict[str, List[str]] = {}
+    line_starts: Dict[str, int] = {}
+    for last, keyword in _hebrew_tables()['coverage'].iter(text):
+        start = text.rfind('\n', 0, last) + 1
+        kept = lines.setdefault(keyword, [])
+        if len(kept) == _HE_COVERAGE_LINES or line_starts.get(keyword) == start:
+            continue
+        end = text.find('\n', last)
+        kept.append(text[start:end if end != -1 else len(text)])
+        line_starts[keyword] = start
+    return {keyword: lines[keyword] for keyword in _HE_COVERAGE_KEYWORDS if keyword in lines}
+
 def _extract_hebrew_insurance_fields(text: str) -> Dict:
     """Extract fields specifically from Hebrew insurance documents using dynamic patterns"""
+    tables = _hebrew_tables()
     data = {}
     
-    # Company name patterns (Hebrew) - More comprehensive
-    company_patterns = [
-        r'(אדנל.*?(?:קבוצת|חברת|בע"מ))',  # Landa Group (Hebrew RTL)
-        r'(לנדא.*?(?:קבוצה|חברה|בע"מ))',  # Landa Group (alternative)
-        r'(Applied.*?Materials.*?Israel)',
-        r'(מנורה.*?מבטחים)',
-        r'(הפניקס.*?חברה.*?לביטוח)',
-        r'(כלל.*?ביטוח)',
-        r'(הראל.*?ביטוח)',
-        r'(מגדל.*?ביטוח)',
-        r'(איילון.*?ביטוח)',
-        r'([^\n]*סבל.*?אדנל[^\n]*)',  # "סבל אדנל" (Leseb Landa)
-        r'([^\n]*בע"מ[^\n]*)',  # Any company with Ltd designation
-        r'([^\n]*עמ"ב[^\n]*)',  # Reverse Hebrew Ltd
-    ]
-    
     # Extract company/insurer
-    for pattern in company_patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        if matches:
+    for pattern in tables['company']:
+        found = _first_found(pattern, text)
+        if found is not None:
             # Clean and use the first meaningful match
-            company = matches[0].strip()
+            company = found.strip()
             if len(company) > 3:  # Avoid very short matches
                 data['insurer'] = company
                 break
     
-    # Employee/Group patterns for owner identification
-    employee_patterns = [
-        r'([^\n]*(?:עובדי|עובדים).*?(?:קבוצת|חברת|אדנל)[^\n]*)',
-        r'([^\n]*(?:קבוצת|חברת).*?(?:אדנל|לנדא)[^\n]*)',
-        r'([^\n]*(?:אדנל|לנדא).*?(?:עובדי|עובדים)[^\n]*)',
-        r'([^\n]*(?:בני משפחתם|בני משפחת)[^\n]*)',
-        r'([^\n]*ידבועל.*?אדנל[^\n]*)',  # RTL: "לעובדי אדנל"
-    ]
-    
-    for pattern in employee_patterns:
-        matches = re.findall(pattern, text)
-        if matches:
-            if isinstance(matches[0], tuple):
-                owner = ' '.join(matches[0]).strip()
+    for pattern in tables['employee']:
+        found = _first_found(pattern, text)
+        if found is not None:
+            if isinstance(found, tuple):
+                owner = ' '.join(found).strip()
             else:
-                owner = matches[0].strip()
+                owner = found.strip()
             if len(owner) > 5:
                 data['owner_name'] = owner
                 break
     
-    # Policy number patterns - Dynamic search
-    policy_patterns = [
-        r'(?:פוליסה.*?מספר|מספר.*?פוליסה)[:\s]*([A-Z0-9\-]+)',
-        r'פוליסה[:\s]*([A-Z0-9\-]{5,})',
-        r'מספר[:\s]*([A-Z0-9\-]{5,})',
-        r'([A-Z]{2,}\-[0-9]{4,}\-[0-9]{4})',  # Pattern like XXX-YYYY-ZZZZ
-        r'([0-9]{4,})',  # Fallback to any 4+ digit number
-    ]
-    
-    for pattern in policy_patterns:
-        matches = re.findall(pattern, text)
-        if matches:
-            policy_num = matches[0].strip()
+    for pattern in tables['policy']:
+        found = _first_found(pattern, text)
+        if found is not None:
+            policy_num = found.strip()
             if len(policy_num) >= 4:
                 data['policy_number'] = policy_num
                 break
     
-    # Product type identification - Enhanced patterns
-    product_patterns = [
-        (r'(?:ביטוח.*?בריאות|בריאות.*?ביטוח|תואירב.*?חוטיב)', 'Health Insurance'),
-        (r'(?:ביטוח.*?רכב|רכב.*?ביטוח)', 'Auto Insurance'),
-        (r'(?:ביטוח.*?דירה|דירה.*?ביטוח|ביטוח.*?דיור)', 'Home Insurance'),
-        (r'(?:ביטוח.*?חיים|חיים.*?ביטוח)', 'Life Insurance'),
-        (r'(?:ביטוח.*?נסיעות|נסיעות.*?ביטוח)', 'Travel Insurance'),
-        (r'(?:ביטוח.*?קבוצתי|קבוצתי.*?ביטוח|יתצובק.*?תואירב)', 'Group Insurance'),
-        (r'(?:ביטוח.*?משלים|משלים.*?ביטוח)', 'Supplementary Insurance'),
-        (r'(?:תנאי.*?הביטוח|חוברת.*?תנאי|יאנת.*?תרבוח)', 'Insurance Terms'),
-    ]
-    
-    for pattern, product_type in product_patterns:
-        if re.search(pattern, text, re.IGNORECASE):
+    for pattern, product_type in tables['product']:
+        if pattern.search(text):
             data['product_type'] = product_type
             break
     
-    # Date patterns - More flexible
-    date_patterns = [
-        (r'(?:תחילת.*?ביטוח|מתחיל.*?ביטוח)[:\s]*(\d{1,2}\.\d{1,2}\.\d{4})', 'start_date'),
-        (r'(?:סיום.*?ביטוח|מסתיים.*?ביטוח)[:\s]*(\d{1,2}\.\d{1,2}\.\d{4})', 'end_date'),
-        (r'(?:תקופת.*?ביטוח)[:\s]*(\d{1,2}\.\d{1,2}\.\d{4})', 'start_date'),
-        (r'(?:עד.*?תאריך|בתוקף.*?עד)[:\s]*(\d{1,2}\.\d{1,2}\.\d{4})', 'end_date'),
-        (r'(\d{1,2}\.\d{1,2}\.\d{4})', 'date_found'),  # Any date
-    ]
-    
-    for pattern, field in date_patterns:
-        matches = re.findall(pattern, text)
-        if matches and field != 'date_found':
-            data[field] = matches[0]
-        elif matches and field == 'date_found' and not data.get('start_date'):
+    for pattern, field in tables['date']:
+        found = _first_found(pattern, text)
+        if found is not None and field != 'date_found':
+            data[field] = found
+        elif found is not None and field == 'date_found' and not data.get('start_date'):
             # Use first found date as start date if no specific start date found
-            data['start_date'] = matches[0]
-    
-    # Financial information - Enhanced patterns
-    financial_patterns = [
-        (r'(?:פרמיה.*?חודשית|תשלום.*?חודשי)[:\s]*(\d+(?:,\d{3})*(?:\.\d{2})?)', 'premium_monthly'),
-        (r'(?:פרמיה.*?שנתית|תשלום.*?שנתי)[:\s]*(\d+(?:,\d{3})*(?:\.\d{2})?)', 'premium_annual'),
-        (r'(?:השתתפות.*?עצמית|השתתפות)[:\s]*₪?\s*(\d+(?:,\d{3})*)', 'deductible'),
-        (r'(?:סכום.*?ביטוח|כיסוי.*?מקסימלי)[:\s]*₪?\s*(\d+(?:,\d{3})*)', 'coverage_limit'),
-    ]
+            data['start_date'] = found
     
-    for pattern, field in financial_patterns:
-        matches = re.findall(pattern, text)
-        if matches:
-            amount = matches[0].replace(',', '')
+    for pattern, field in tables['financial']:
+        found = _first_found(pattern, text)
+        if found is not None:
+            amount = found.replace(',', '')
             try:
                 data[field] = float(amount)
             except:
@@ -161,133 +478,174 @@ def _extract_hebrew_insurance_fields(text: str) -> Dict:
     
     # Look for any general amounts if specific fields weren't found
     if not any(data.get(field, 0) for field in ['premium_monthly', 'premium_annual', 'deductible', 'coverage_limit']):
-        general_amount_matches = re.findall(r'₪\s*(\d+(?:,\d{3})*)', text)
-        if general_amount_matches:
+        general_amount = _first_found(tables['shekel'], text)
+        if general_amount is not None:
             # Use first found amount as premium_monthly if nothing else was found
             try:
-                amount = general_amount_matches[0].replace(',', '')
+                amount = general_amount.replace(',', '')
                 data['premium_monthly'] = float(amount)
             except:
                 pass
     
-    # Contact information - Enhanced patterns
-    contact_patterns = [
-        (r'(?:דוא"ל|מייל)[:\s]*([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})', 'contact_email'),
-        (r'(?:טלפון|פקס)[:\s]*(\d{2,3}\-\d{7})', 'contact_phone'),
-        (r'(\d{2,3}\-\d{7})', 'phone_found'),  # Any phone number
-        (r'([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})', 'email_found'),  # Any email
-    ]
-    
-    for pattern, field in contact_patterns:
-        matches = re.findall(pattern, text)
-        if matches:
+    for pattern, field in tables['contact']:
+        found = _first_found(pattern, text)
+        if found is not None:
             if field == 'phone_found' and not data.get('contact_phone'):
-                data['contact_phone'] = matches[0]
+                data['contact_phone'] = found
             elif field == 'email_found' and not data.get('contact_email'):
-                data['contact_email'] = matches[0]
+                data['contact_email'] = found
             elif field not in ['phone_found', 'email_found']:
-                data[field] = matches[0]
-    
-    # Coverage details extraction - Dynamic
-    coverage_keywords = [
-        'השתלות', 'ניתוחים', 'טיפולים', 'בדיקות', 'רפואה משלימה',
-        'רופא משפחה', 'מומחה', 'אשפוז', 'חירום', 'רפואה פרטית',
-        'תולתשה', 'םיחותינ', 'םילופיט', 'תוקידב', 'המילשמ האופר',  # RTL variations
-        'החפשמ אפור', 'החמומ', 'זופשא', 'םורח', 'תיטרפ האופר'
-    ]
+                data[field] = found
     
-    coverage_details = {}
-    for keyword in coverage_keywords:
-        pattern = f'([^\n]*{keyword}[^\n]*)'
-        matches = re.findall(pattern, text)
-        if matches:
-            coverage_details[keyword] = matches[:3]  # Keep up to 3 matches per keyword
+    coverage_details = _coverage_lines(text)
     
     if coverage_details:
         data['coverage_details'] = coverage_details
     
-    # Agent/Contact person patterns
-    agent_patterns = [
-        r'(?:סוכן|נציג|איש קשר)[:\s]*([^\n]+)',
-        r'([^\n]*דורביט[^\n]*)',  # Insurance agency
-        r'([^\n]*תיווך[^\n]*)',   # Brokerage
-    ]
-    
-    for pattern in agent_patterns:
-        matches = re.findall(pattern, text)
-        if matches:
-            data['agent_name'] = matches[0].strip()
+    for pattern in tables['agent']:
+        found = _first_found(pattern, text)
+        if found is not None:
+            data['agent_name'] = found.strip()
             break
     
     # Extract year for fallback dates
-    years = re.findall(r'\b(20\d{2})\b', text)
-    if years and not data.get('start_date'):
-        # Use most common year found
-        from collections import Counter
-        most_common_year = Counter(years).most_common(1)[0][0]
+    most_common_year = None if data.get('start_date') else _most_common_year(text)
+    if most_common_year:
         data['start_date'] = f'01/01/{most_common_year}'
         data['end_date'] = f'31/12/{most_common_year}'
     
     return data
 
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == '_'
+
+def _most_common_year(text: str) -> Optional[str]:
+    """Most frequent whole-word 20xx year (as re's \\b(20\\d{2})\\b finds them), first seen on ties.
+
+    str.find jumps between "20" occurrences, so only those few positions are
+    examined in Python; re has to try the pattern at every offset, and \\b keeps
+    it off re2.
+    """
+    counts: Dict[str, int] = {}
+    index = text.find('20')
+    while index != -1:
+        end = index + 4
+        year = text[index:end]
+        if (len(year) == 4 and year[2].isdecimal() and year[3].isdecimal()
+                and (index == 0 or not _is_word_char(text[index - 1]))
+                and (end == len(text) or not _is_word_char(text[end]))):
+            counts[year] = counts.get(year, 0) + 1
+            index = text.find('20', end)
+        else:
+            index = text.find('20', index + 1)
+    return max(counts, key=counts.get) if counts else None
+
+def _standard_field_candidates(text: str) -> FrozenSet[int]:
+    """Indexes (in _STANDARD_FIELD_SOURCES order) of the patterns that may match text"""
+    tables = _standard_tables()
+    if tables['set'] is not None:
+        return tables['set'].matching(text)
+    folded = _fold(text)
+    if tables['automaton'] is not None:
+        present = {keyword for _, keyword in tables['automaton'].iter(folded)}
+    else:
+        present = {keyword for keyword in tables['anchor_words'] if keyword in folded}
+    return frozenset(
+        index for index, keywords in enumerate(tables['anchors'])
+        if keywords is None or not keywords.isdisjoint(present)
+    )
+
 def _extract_standard_insurance_fields(text: str) -> Dict:
     """Extract fields from English/standard insurance documents"""
-    def find(pattern, default=""):
-        m = re.search(pattern, text, flags=re.IGNORECASE)
-        result = m.group(1).strip() if m else default
-        return result
-
-    data = {
-        "owner_name": find(r"(?:Insured|Named Insured|Owner|Policy Holder)[:\s]*(.+?)(?:\n|$)") or find(r"Insured[:\s]+(.+?)(?:\n|$)"),
-        "insurer": find(r"(?:Company|Insurer|Insurance Company)[:\s]*(.+?)(?:\n|$)") or find(r"(ALLSTATE|STATE FARM|PROGRESSIVE|GEICO|FARMERS|LIBERTY MUTUAL|USAA|AMERICAN FAMILY)", ""),
-        "product_type": find(r"(?:Product Type|Coverage Type|Policy Type)[:\s]*(.+?)(?:\n|$)") or find(r"(Home|Auto|Life|Health|Renters?) Insurance", ""),
-        "policy_number": find(r"Policy\s*(?:Number|No\.?|#)[:\s]*([A-Z0-9\-]+)") or find(r"Policy Number[:\s]*([A-Z0-9\-]+)"),
-        "start_date": find(r"(?:Effective Date|Start Date|Policy Period)[:\s]*([0-9]{1,2}[/-][0-9]{1,2}[/-][0-9]{4})") or find(r"Effective Date[:\s]*([A-Za-z]+ [0-9]{1,2}, [0-9]{4})"),
-        "end_date": find(r"(?:Expiration Date|End Date|Renewal Date)[:\s]*([0-9]{1,2}[/-][0-9]{1,2}[/-][0-9]{4})") or find(r"Expiration Date[:\s]*([A-Za-z]+ [0-9]{1,2}, [0-9]{4})"),
-        "premium_monthly": find(r"(?:Monthly Premium|Monthly Payment)[:\s]*\$?([0-9,]+\.?[0-9]*)") or find(r"Premium[:\s]*\$?([0-9,]+\.?[0-9]*)"),
-        "premium_annual": find(r"(?:Annual Premium|Yearly Premium)[:\s]*\$?([0-9,]+\.?[0-9]*)"),
-        "deductible": find(r"Deductible[:\s]*\$?([0-9,]+\.?[0-9]*)"),
-        "coverage_limit": find(r"(?:Total Coverage|Coverage Limit|Total Limit)[:\s]*\$?([0-9,]+\.?[0-9]*)") or find(r"(?:Dwelling Coverage|Coverage)[:\s]*\$?([0-9,]+\.?[0-9]*)"),
-        "contact_phone": find(r"(?:Phone|Tel|Contact)[:\s]*([0-9\-\(\)\+\s]+)"),
-        "contact_email": find(r"([a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+)"),
-    }
+    data = {}
+    possible = _standard_field_candidates(text)
+    index = 0
+    for field, patterns in _standard_tables()['fields']:
+        # First pattern with a non-empty capture wins
+        data[field] = ""
+        first, index = index, index + len(patterns)
+        for offset, pattern in enumerate(patterns):
+            if first + offset not in possible:
+                continue
+            m = pattern.search(text)
+            if m and m.group(1).strip():
+                data[field] = m.group(1).strip()
+                break
     
     return data
 
-def parse_pdf_to_policy_fields(file_path: str, raw_bytes: bytes | None = None, original_filename: str = "") -> Dict:
-    import logging
-    logger = logging.getLogger(__name__)
-    
-    text = _text_from_pdf(file_path)
-    logger.info(f"Extracted text from PDF (length: {len(text)}, first 500 chars): {repr(text[:500])}")
-    
-    if not text.strip() and raw_bytes:
-        logger.info("No meaningful text extracted, trying OCR...")
-        text = _ocr_first_page(raw_bytes)
-        logger.info(f"OCR text (length: {len(text)}, first 500 chars): {repr(text[:500])}")
+# pdfminer and tesseract are CPU-bound, so extraction runs in worker processes
+_PDF_POOL = WorkerPool("PDF extraction", settings.PDF_EXTRACT_WORKERS or min(8, os.cpu_count() or 1))
+
+def _extract_document_text(file_path: str, raw_bytes: Optional[bytes]) -> str:
+    """Text layer of the document, or its OCR text when it has none"""
+    # The document is read once; text extraction and OCR share the same buffer
+    with _pdf_buffer(file_path, raw_bytes) as pdf_bytes:
+        text = _text_from_pdf(pdf_bytes, file_path)
+        logger.info("Extracted text from PDF (length: %d, first 500 chars): %r", len(text), text[:500])
+        
+        if not text.strip() and len(pdf_bytes):
+            logger.info("No meaningful text extracted, trying OCR...")
+            text = _ocr_all_pages(pdf_bytes)
+            logger.info("OCR text (length: %d, first 500 chars): %r", len(text), text[:500])
+    return text
+
+async def parse_pdfs_batch(file_specs: List[Tuple[str, Optional[bytes], str]]) -> List[Dict]:
+    """parse_pdf_to_policy_fields over (file_path, raw_bytes, original_filename) specs,
+    extracting the documents in parallel; results are in input order"""
+    return list(await asyncio.gather(*(parse_pdf_to_policy_fields(*spec) for spec in file_specs)))
+
+# Words in the filename or text that select the analyzer's policy type, checked in order
+_POLICY_TYPE_HINTS = (
+    ("home", ("home", "house", "property", "בית", "דירה")),
+    ("health", ("health", "medical", "בריאות")),
+    ("life", ("life", "חיים")),
+)
+
+# Re-uploaded documents skip extraction and analysis; keyed by a digest of the
+# bytes and the filename, which also steers the policy type
+_PARSE_CACHE_SIZE = 1024
+_parsed_fields: "OrderedDict[Tuple[bytes, str], Dict]" = OrderedDict()
+
+async def parse_pdf_to_policy_fields(file_path: str, raw_bytes: bytes | None = None, original_filename: str = "") -> Dict:
+    key = None
+    if raw_bytes is not None:
+        key = (hashlib.blake2b(raw_bytes, digest_size=16).digest(), original_filename)
+        if key in _parsed_fields:
+            _parsed_fields.move_to_end(key)
+            return _with_import_metadata(copy.deepcopy(_parsed_fields[key]), file_path, original_filename)
+    data = await _analyze_document(file_path, raw_bytes, original_filename)
+    if key is not None:
+        _parsed_fields[key] = copy.deepcopy(data)
+        while len(_parsed_fields) > _PARSE_CACHE_SIZE:
+            _parsed_fields.popitem(last=False)
+    return _with_import_metadata(data, file_path, original_filename)
+
+async def _analyze_document(file_path: str, raw_bytes: Optional[bytes], original_filename: str) -> Dict:
+    """Policy fields found in the document, before import metadata is attached"""
+    text = await _PDF_POOL.run(_extract_document_text, file_path, raw_bytes)
     
     # Use the enhanced policy analyzer for comprehensive analysis
     if text.strip():
         logger.info("Using AI-powered policy analyzer for text analysis")
         
-        # Detect policy type from filename or text
-        policy_type = "auto"  # default
-        if any(word in (original_filename + text).lower() for word in ["home", "house", "property", "בית", "דירה"]):
-            policy_type = "home"
-        elif any(word in (original_filename + text).lower() for word in ["health", "medical", "בריאות"]):
-            policy_type = "health"
-        elif any(word in (original_filename + text).lower() for word in ["life", "חיים"]):
-            policy_type = "life"
+        # Detect policy type from filename or text; auto when nothing hints otherwise
+        haystack = (original_filename + text).lower()
+        policy_type = next(
+            (hinted for hinted, words in _POLICY_TYPE_HINTS if any(word in haystack for word in words)), "auto"
+        )
         
         # Use the policy analyzer
-        analysis_result = policy_analyzer.analyze_policy_text(text, policy_type)
+        analysis_result = await policy_analyzer.analyze_policy_text(text, policy_type)
         
         # Convert analysis result to policy fields format
         data = _convert_analysis_to_policy_fields(analysis_result, original_filename)
     else:
         logger.warning("No text could be extracted from PDF, creating minimal record")
         data = _create_minimal_policy_record(original_filename)
-    
+    return data
+
+def _with_import_metadata(data: Dict, file_path: str, original_filename: str) -> Dict:
     # Store additional metadata
     data.update({
         "original_filename": original_filename,
@@ -299,7 +657,7 @@ def parse_pdf_to_policy_fields(file_path: str, raw_bytes: bytes | None = None, o
     # Sanitize all extracted data for security
     data = input_sanitizer.sanitize_policy_data(data)
     
-    logger.info(f"Final extracted data with confidence {data['extraction_confidence']}: {data}")
+    logger.info("Final extracted data with confidence %s: %s", data['extraction_confidence'], data)
     return data
 
 def _convert_analysis_to_policy_fields(analysis: Dict, filename: str) -> Dict:
@@ -330,52 +688,48 @@ def _convert_analysis_to_policy_fields(analysis: Dict, filename: str) -> Dict:
     
     return data
 
+_PRODUCT_TYPE_MAPPING = {
+    "auto": "auto",
+    "car": "auto",
+    "vehicle": "auto",
+    "home": "home",
+    "house": "home",
+    "property": "home",
+    "health": "health",
+    "medical": "health",
+    "life": "life",
+    "term life": "life",
+    "whole life": "life",
+    "disability": "disability",
+    "income protection": "disability",
+    "travel": "travel",
+    "renters": "renters",
+    "unknown": "general"
+}
+
 def _normalize_product_type(policy_type: str) -> str:
     """Normalize policy type to standard values"""
-    type_mapping = {
-        "auto": "auto",
-        "car": "auto",
-        "vehicle": "auto",
-        "home": "home",
-        "house": "home",
-        "property": "home",
-        "health": "health",
-        "medical": "health",
-        "life": "life",
-        "term life": "life",
-        "whole life": "life",
-        "disability": "disability",
-        "income protection": "disability",
-        "travel": "travel",
-        "renters": "renters",
-        "unknown": "general"
-    }
-    
-    return type_mapping.get(policy_type.lower(), "general")
+    return _PRODUCT_TYPE_MAPPING.get(policy_type.lower(), "general")
 
 def _extract_coverage_limit(coverage_details: Dict) -> float:
     """Extract the highest coverage limit from coverage details"""
     if not coverage_details:
         return 0.0
     
-    max_limit = 0.0
-    for coverage_type, coverage_data in coverage_details.items():
-        if isinstance(coverage_data, dict):
-            amount = coverage_data.get("amount", 0)
-        else:
-            amount = coverage_data
-        
+    amounts = []
+    for coverage_data in coverage_details.values():
+        amount = coverage_data.get("amount", 0) if isinstance(coverage_data, dict) else coverage_data
         if isinstance(amount, (int, float)):
-            max_limit = max(max_limit, amount)
+            amounts.append(amount)
         elif isinstance(amount, str):
             try:
                 # Try to parse numeric value from string
-                numeric_value = float(re.sub(r'[^\d.]', '', str(amount)))
-                max_limit = max(max_limit, numeric_value)
-            except:
+                amounts.append(float(amount.translate(_AMOUNT_CHARS)))
+            except ValueError:
                 pass
     
-    return max_limit
+    # One max over every amount; 0.0 leads so it is the floor, as before
+    return max([0.0, *amounts])
 
 def _create_minimal_policy_record(filename: str) -> Dict:
     """Create a minimal policy record when text extraction fails"""
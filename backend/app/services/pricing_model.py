@@ -1,3 +1,10 @@
+try:
+    import numpy as np  # type: ignore  # batch scoring
+    NUMPY_AVAILABLE = True
+except Exception:
+    np = None
+    NUMPY_AVAILABLE = False
+
 def price_score(premium_monthly: float, coverage_limit: float, deductible: float) -> float:
     score = 0.0
     score += min(1_000_000, coverage_limit) / 1_000_000 * 0.5
@@ -5,6 +12,16 @@ def price_score(premium_monthly: float, coverage_limit: float, deductible: float
     score += max(0, 10_000 - min(10_000, deductible)) / 10_000 * 0.2
     return round(score * 100, 1)
 
+def price_score_vec(premium_monthly, coverage_limit, deductible):
+    """price_score over arrays of policies at once.
+
+    np.round can land one step away from round() where the score is a rounding tie.
+    """
+    cov_part = np.minimum(1_000_000, coverage_limit) / 1_000_000 * 0.5
+    prem_part = np.maximum(0, 500 - np.minimum(500, premium_monthly)) / 500 * 0.3
+    ded_part = np.maximum(0, 10_000 - np.minimum(10_000, deductible)) / 10_000 * 0.2
+    return np.round((cov_part + prem_part + ded_part) * 100, 1)
+
 def feature_contributions(premium_monthly: float, coverage_limit: float, deductible: float):
     cov_part = min(1_000_000, coverage_limit) / 1_000_000 * 0.5
     prem_part = max(0, 500 - min(500, premium_monthly)) / 500 * 0.3
@@ -1,21 +1,41 @@
+from heapq import nlargest
+from operator import itemgetter
 from typing import List, Dict
-from .pricing_model import price_score, feature_contributions
+from .pricing_model import NUMPY_AVAILABLE, np, price_score, price_score_vec, feature_contributions
+
+# One bit per product type a household is expected to cover, in the
+# alphabetical order gaps are reported in
+_TYPE_BITS = {"auto": 1, "disability": 2, "health": 4, "home": 8, "life": 16}
+_ALL_TYPES = sum(_TYPE_BITS.values())
+
+_SHORTLIST_SIZE = 3
+# price_score_vec may round a tie one step away from price_score, so the
+# vectorized pass only narrows the field and survivors are rescored exactly
+_ROUNDING_MARGIN = 0.25
 
 def find_gaps(policies: List[Dict]) -> List[Dict]:
-    types = {p["product_type"] for p in policies if p.get("active", True)}
-    possible = {"health","life","auto","home","disability"}
-    missing = possible - types
+    seen = 0
+    for p in policies:
+        if p.get("active", True):
+            seen |= _TYPE_BITS.get(p["product_type"], 0)
+    return _gap_recommendations(seen)
+
+def _gap_recommendations(seen: int) -> List[Dict]:
+    missing = _ALL_TYPES & ~seen
     return [{
         "title": f"Consider adding {t} coverage",
         "reason": f"No active {t} policy detected",
         "impact": "Risk exposure if an event occurs without coverage",
         "explanation": {"missing_type": t}
-    } for t in sorted(missing)]
+    } for t, bit in _TYPE_BITS.items() if missing & bit]
 
 def find_overlaps(policies: List[Dict]) -> List[Dict]:
     by_type = {}
     for p in policies:
         by_type.setdefault(p["product_type"], []).append(p)
+    return _overlap_recommendations(by_type)
+
+def _overlap_recommendations(by_type: Dict[str, List[Dict]]) -> List[Dict]:
     return [{
         "title": f"Overlap in {t} policies",
         "reason": f"You have {len(items)} {t} policies",
@@ -23,20 +43,42 @@ def find_overlaps(policies: List[Dict]) -> List[Dict]:
         "explanation": {"count": len(items), "policy_ids": [i.get("id") for i in items if i.get("id")]}
     } for t, items in by_type.items() if len(items) > 1]
 
+def _shortlist_candidates(policies: List[Dict]) -> List[int]:
+    """Indexes of the policies that can reach the shortlist, in list order"""
+    if not NUMPY_AVAILABLE or len(policies) <= _SHORTLIST_SIZE:
+        return list(range(len(policies)))
+    premium, coverage, deductible = (
+        np.fromiter((p.get(field, 0) for p in policies), dtype=np.float64, count=len(policies))
+        for field in ("premium_monthly", "coverage_limit", "deductible")
+    )
+    scores = price_score_vec(premium, coverage, deductible)
+    if np.isnan(scores).any():
+        # min() and np.minimum disagree about NaN
+        return list(range(len(policies)))
+    cutoff = np.partition(scores, -_SHORTLIST_SIZE)[-_SHORTLIST_SIZE] - _ROUNDING_MARGIN
+    return np.flatnonzero(scores >= cutoff).tolist()
+
 def shortlist_value(policies: List[Dict]) -> List[Dict]:
     scored = []
-    for p in policies:
+    for i in _shortlist_candidates(policies):
+        p = policies[i]
         s = price_score(p.get("premium_monthly",0), p.get("coverage_limit",0), p.get("deductible",0))
-        contrib = feature_contributions(p.get("premium_monthly",0), p.get("coverage_limit",0), p.get("deductible",0))
-        scored.append((s, p, contrib))
-    scored.sort(key=lambda x: -x[0])
-    top = scored[:3]
+        scored.append((s, p))
+    # Same order as a stable descending sort, without sorting every candidate
+    top = nlargest(_SHORTLIST_SIZE, scored, key=itemgetter(0))
     return [{
         "title": f"Good value candidate: {p['insurer']} {p['product_type']}",
         "reason": f"Score {s} based on coverage, premium, deductible",
         "impact": "Consider keeping or negotiating a better rate",
-        "explanation": contrib
-    } for s, p, contrib in top]
+        "explanation": feature_contributions(p.get("premium_monthly",0), p.get("coverage_limit",0), p.get("deductible",0))
+    } for s, p in top]
 
 def recommend(policies: List[Dict]) -> List[Dict]:
-    return find_gaps(policies) + find_overlaps(policies) + shortlist_value(policies)
\ No newline at end of file
+    # Gaps and overlaps come from one walk over the policies
+    seen = 0
+    by_type = {}
+    for p in policies:
+        if p.get("active", True):
+            seen |= _TYPE_BITS.get(p["product_type"], 0)
+        by_type.setdefault(p["product_type"], []).append(p)
+    return _gap_recommendations(seen) + _overlap_recommendations(by_type) + shortlist_value(policies)
\ No newline at end of file
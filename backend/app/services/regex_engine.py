@@ -0,0 +1,201 @@
+"""
+Pattern compilation on google-re2 when installed, with the stdlib engine as fallback
+"""
+import re
+from typing import Any, FrozenSet, Optional, Sequence
+try:
+    import re2  # type: ignore  # optional linear-time engine (google-re2)
+    RE2_AVAILABLE = True
+except Exception:
+    re2 = None
+    RE2_AVAILABLE = False
+
+# re2's \s, \d and \w are ASCII-only; these spell out what they mean to Python's re
+_SPACE = r'\t\n\v\f\r\x{1c}-\x{1f} \x{85}\x{a0}\x{1680}\x{2000}-\x{200a}\x{2028}\x{2029}\x{202f}\x{205f}\x{3000}'
+# Under re.IGNORECASE Python's \w also takes U+0345, which folds to a Greek iota
+_WORD = r'\p{L}\p{N}_'
+_OUTSIDE_CLASS = {
+    's': f'[{_SPACE}]', 'S': f'[^{_SPACE}]',
+    'd': r'\p{Nd}', 'D': r'\P{Nd}',
+    'w': f'[{_WORD}]', 'W': f'[^{_WORD}]',
+}
+_INSIDE_CLASS = {'s': _SPACE, 'd': r'\p{Nd}', 'D': r'\P{Nd}', 'w': _WORD}
+# Under re.IGNORECASE Python also matches i and I against these; re2's (?i) does not
+_DOTTED_DOTLESS_I = 'İı'
+_INLINE_FLAGS_RE = re.compile(r'\(\?([aiLmsux]+)\)')
+# "Line break or end": before a final newline the \n branch wins, so $ is only
+# ever reached at the very end of the text, where re2's \z means the same
+_NEWLINE_OR_END = r'(?:\n|$)'
+_CODEPOINT_ESCAPE_RE = re.compile(r'\\u([0-9a-fA-F]{4})|\\U([0-9a-fA-F]{8})')
+
+def _translate_escape(escape: str, in_class: bool) -> Optional[str]:
+    """re2 spelling of one escape sequence, or None if there is none"""
+    letter = escape[1]
+    table = _INSIDE_CLASS if in_class else _OUTSIDE_CLASS
+    if letter in table:
+        return table[letter]
+    if letter in 'bBSWZAN':
+        # Unicode word boundaries, \S or \W inside a class, \Z, \A and named
+        # characters have no exact re2 spelling
+        return None
+    codepoint = _CODEPOINT_ESCAPE_RE.fullmatch(escape)
+    if codepoint:
+        return '\\x{%s}' % (codepoint.group(1) or codepoint.group(2))
+    return escape
+
+def _escape_length(pattern: str, index: int) -> int:
+    if pattern[index + 1:index + 2] == 'u':
+        return 6
+    if pattern[index + 1:index + 2] == 'U':
+        return 10
+    return 2
+
+def re2_syntax(pattern: str, ignorecase: bool = False, multiline: bool = False) -> Optional[str]:
+    """Rewrite a Python pattern so re2 matches the same text, or None if it cannot"""
+    leading_flags = _INLINE_FLAGS_RE.match(pattern)
+    if leading_flags and 'i' in leading_flags.group(1):
+        ignorecase = True
+    if leading_flags and 'm' in leading_flags.group(1):
+        multiline = True
+    out = []
+    index = 0
+    while index < len(pattern):
+        char = pattern[index]
+        if char == '\\' and index + 1 < len(pattern):
+            length = _escape_length(pattern, index)
+            translated = _translate_escape(pattern[index:index + length], in_class=False)
+            if translated is None:
+                return None
+            out.append(translated)
+            index += length
+        elif char == '[':
+            end = _class_end(pattern, index)
+            if end is None:
+                return None
+            translated = _translate_class(pattern[index + 1:end], ignorecase)
+            if translated is None:
+                return None
+            out.append(translated)
+            index = end + 1
+        elif pattern.startswith(_NEWLINE_OR_END, index) and not multiline:
+            out.append(r'(?:\n|\z)')
+            index += len(_NEWLINE_OR_END)
+        elif char == '(' and pattern[index + 1:index + 2] == '?':
+            # Copy group headers such as (?:, (?P<name> and (?s) untouched
+            header = re.match(r'\(\?(?:P<\w+>|P=\w+\)|[aiLmsux-]*[:)]|)', pattern[index:])
+            out.append(header.group())
+            index += len(header.group())
+        elif char == '$':
+            # re's $ also matches before a final newline; re2's only at the very end
+            return None
+        elif ignorecase and char in 'iI':
+            out.append(f'[iI{_DOTTED_DOTLESS_I}]')
+            index += 1
+        else:
+            out.append(char)
+            index += 1
+    return ''.join(out)
+
+def _class_end(pattern: str, start: int) -> Optional[int]:
+    """Index of the ']' closing the class opened at start"""
+    index = start + 1
+    if pattern[index:index + 1] == '^':
+        index += 1
+    # A ']' right after '[' or '[^' is a literal, not the end of the class
+    if pattern[index:index + 1] == ']':
+        index += 1
+    while index < len(pattern):
+        if pattern[index] == '\\':
+            index += _escape_length(pattern, index)
+            continue
+        if pattern[index] == ']':
+            return index
+        index += 1
+    return None
+
+def _translate_class(body: str, ignorecase: bool) -> Optional[str]:
+    negated = body.startswith('^')
+    items = body[1:] if negated else body
+    out = []
+    index = 0
+    while index < len(items):
+        if items[index] == '\\' and index + 1 < len(items):
+            length = _escape_length(items, index)
+            translated = _translate_escape(items[index:index + length], in_class=True)
+            if translated is None:
+                return None
+            out.append(translated)
+            index += length
+        else:
+            out.append(items[index])
+            index += 1
+    if ignorecase and re.fullmatch(f'[{items}]', 'i', re.IGNORECASE):
+        # Added up front so they cannot become a range endpoint; a leading
+        # literal ']' then needs escaping
+        if out and out[0] == ']':
+            out[0] = '\\]'
+        out.insert(0, _DOTTED_DOTLESS_I)
+    return '[' + ('^' if negated else '') + ''.join(out) + ']'
+
+def _re2_pattern(pattern: str, flags: int) -> Optional[str]:
+    """re2 source equivalent to re.compile(pattern, flags), or None"""
+    translated = re2_syntax(
+        pattern, ignorecase=bool(flags & re.IGNORECASE), multiline=bool(flags & re.MULTILINE)
+    )
+    if translated is None:
+        return None
+    if r'(?:\n|\z)' in translated and re.compile(pattern, flags).fullmatch(''):
+        # re2's finditer reports an empty match at \z twice
+        return None
+    if flags & re.IGNORECASE:
+        translated = f'(?i){translated}'
+    if flags & re.DOTALL:
+        translated = f'(?s){translated}'
+    if flags & re.MULTILINE:
+        translated = f'(?m){translated}'
+    return translated
+
+def compile_pattern(pattern: str, flags: int = 0) -> Any:
+    """Compile on re2 when installed and the pattern translates; otherwise with re"""
+    if RE2_AVAILABLE:
+        translated = _re2_pattern(pattern, flags)
+        if translated is not None:
+            try:
+                return re2.compile(translated)
+            except re2.error:
+                pass
+    return re.compile(pattern, flags)
+
+class PatternSet:
+    """Which of several patterns occur in a text, answered by one re2 pass.
+
+    Without re2 every pattern is reported, so callers simply try them all.
+    """
+
+    def __init__(self, patterns: Sequence[str], flags: int = 0):
+        self._set = None
+        self._always: FrozenSet[int] = frozenset(range(len(patterns)))
+        if not RE2_AVAILABLE:
+            return
+        always = set()
+        pattern_set = re2.Set.SearchSet(re2.Options())
+        for index, pattern in enumerate(patterns):
+            translated = _re2_pattern(pattern, flags)
+            if translated is not None:
+                try:
+                    pattern_set.Add(translated)
+                    continue
+                except (re2.error, TypeError):
+                    pass
+            # A never-matching stand-in keeps set indices aligned with patterns
+            pattern_set.Add(r'[^\x00-\x{10ffff}]')
+            always.add(index)
+        pattern_set.Compile()
+        self._set = pattern_set
+        self._always = frozenset(always)
+
+    def matching(self, text: str) -> FrozenSet[int]:
+        """Indexes of the patterns that may match somewhere in text"""
+        if self._set is None:
+            return self._always
+        return self._always.union(self._set.Match(text) or ())
@@ -0,0 +1,39 @@
+"""
+Token-bucket limiter for requests-per-minute and tokens-per-minute quotas
+"""
+import asyncio
+import time
+
+class TokenBucket:
+    """Async limiter holding one bucket of requests and one of model tokens"""
+
+    def __init__(self, rpm: int, tpm: int):
+        self.rpm = max(1, rpm)
+        self.tpm = max(1, tpm)
+        self._request_tokens = float(self.rpm)
+        self._model_tokens = float(self.tpm)
+        self._last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._request_tokens = min(self.rpm, self._request_tokens + elapsed * self.rpm / 60)
+        self._model_tokens = min(self.tpm, self._model_tokens + elapsed * self.tpm / 60)
+
+    async def acquire(self, estimated_tokens: int) -> None:
+        """Wait until one request and estimated_tokens model tokens are available, then take them"""
+        # A request larger than the whole bucket could never be admitted
+        estimated_tokens = min(estimated_tokens, self.tpm)
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._request_tokens >= 1 and self._model_tokens >= estimated_tokens:
+                    self._request_tokens -= 1
+                    self._model_tokens -= estimated_tokens
+                    return
+                await asyncio.sleep(max(
+                    (1 - self._request_tokens) * 60 / self.rpm,
+                    (estimated_tokens - self._model_tokens) * 60 / self.tpm,
+                ))
@@ -0,0 +1,68 @@
+"""
+Process pools for CPU-bound work that survive the loss of a worker
+"""
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Workers must not inherit the threads and locks of a running server, so they
+# come from a clean forkserver where the platform has one (spawn elsewhere)
+_START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+class WorkerPool:
+    """ProcessPoolExecutor created on first use and replaced when a worker dies.
+
+    A crashed or OOM-killed worker breaks the whole executor; the next call
+    starts a fresh one and retries the job once.
+    """
+
+    def __init__(self, name: str, max_workers: int):
+        self.name = name
+        self.max_workers = max(1, max_workers)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        _POOLS.append(self)
+
+    def _current(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers, mp_context=multiprocessing.get_context(_START_METHOD)
+            )
+        return self._executor
+
+    def _discard(self, executor: ProcessPoolExecutor) -> None:
+        # Another caller may have replaced it already
+        if self._executor is executor:
+            self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """fn(*args) in a worker process"""
+        loop = asyncio.get_running_loop()
+        executor = self._current()
+        try:
+            return await loop.run_in_executor(executor, fn, *args)
+        except BrokenProcessPool:
+            logger.warning("%s worker pool broke; restarting it and retrying once", self.name)
+            self._discard(executor)
+        executor = self._current()
+        try:
+            return await loop.run_in_executor(executor, fn, *args)
+        except BrokenProcessPool:
+            self._discard(executor)
+            raise
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._discard(self._executor)
+
+_POOLS: List[WorkerPool] = []
+
+def shutdown_worker_pools() -> None:
+    """Stop the workers of every pool; called when the application shuts down"""
+    for pool in _POOLS:
+        pool.shutdown()
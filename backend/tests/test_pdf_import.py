@@ -0,0 +1,64 @@
+"""
+Unit tests for page OCR strip splitting
+"""
+import pytest
+
+Image = pytest.importorskip("PIL.Image")
+
+from app.services import pdf_import
+
+
+def _page(bars, width=400, height=1000):
+    """White page with a black bar per (top, thickness) standing in for a text line"""
+    image = Image.new("L", (width, height), 255)
+    for top, thickness in bars:
+        image.paste(0, (20, top, width - 20, top + thickness))
+    return image
+
+
+def _read_bars(strip):
+    """Fake OCR: one line per run of dark rows, named after the run's thickness"""
+    lines, run = [], 0
+    for y in range(strip.height + 1):
+        dark = y < strip.height and not pdf_import._is_blank_row(strip, y)
+        if dark:
+            run += 1
+        elif run:
+            lines.append(f"bar {run}")
+            run = 0
+    return "".join(line + "\n" for line in lines)
+
+
+class TestOcrStrips:
+    """Test suite for cutting pages into OCR strips"""
+
+    @pytest.fixture(autouse=True)
+    def fake_ocr(self, monkeypatch):
+        monkeypatch.setattr(pdf_import, "_ocr_image", _read_bars)
+
+    def test_lines_read_once_across_strip_boundaries(self):
+        """Lines spanning the even split points are read whole and only once"""
+        # 1000px page in four strips: even splits fall at 250, 500 and 750
+        bars = [(5 + 30 * i, 12 + i % 7) for i in range(33)]
+        bars = [(top, thickness) for top, thickness in bars if top + thickness < 990]
+        page = _page(bars)
+
+        assert len(pdf_import._strip_bounds(page)) == pdf_import._OCR_STRIPS
+        assert any(top < 250 < top + thickness for top, thickness in bars)
+        assert pdf_import._ocr_tiled(page).splitlines() == [f"bar {thickness}" for _, thickness in bars]
+
+    def test_strips_cut_on_blank_rows(self):
+        """Every strip starts on a blank row"""
+        page = _page([(10 + 30 * i, 20) for i in range(32)])
+        bounds = pdf_import._strip_bounds(page)
+
+        assert bounds[0][0] == 0 and bounds[-1][1] == page.height
+        assert all(pdf_import._is_blank_row(page, top) for top, _ in bounds[1:])
+        assert all(bottom == top for (_, bottom), (top, _) in zip(bounds, bounds[1:]))
+
+    def test_page_without_blank_rows_is_one_strip(self):
+        """A split with no blank row nearby is skipped rather than cutting a line"""
+        page = _page([(0, 1000)])
+
+        assert pdf_import._strip_bounds(page) == [(0, 1000)]
+        assert pdf_import._ocr_tiled(page) == "bar 1000\n"
@@ -1,9 +1,13 @@
 """
 Unit tests for security features
+
+Fixtures keep no shared on-disk state, so the module can run in parallel:
+    pytest -n auto tests/test_security.py
 """
+import asyncio
+import httpx
 import pytest
-import tempfile
-import os
+import pytest_asyncio
 from unittest.mock import Mock, patch, MagicMock
 from fastapi.testclient import TestClient
 from fastapi import UploadFile
@@ -12,6 +16,7 @@ import io
 # Import the modules to test
 from app.core.sanitization import InputSanitizer, input_sanitizer
 from app.core.api_key_manager import APIKeyManager
+from app.core.auth_security import require_auth
 from app.core.exceptions import (
     ValidationException, 
     AuthenticationException,
@@ -19,107 +24,143 @@ from app.core.exceptions import (
     ErrorCode
 )
 from app.main import app
+from app.services.regex_engine import RE2_AVAILABLE
+
+# Upload payloads; each request wraps them in a fresh BytesIO
+FAKE_PDF = b"%PDF-1.4 fake pdf content"
+FAKE_EXE = b"fake content"
+
+@pytest.fixture(scope="module")
+def client():
+    """One TestClient for the module; the app and its middleware are built once"""
+    with TestClient(app) as c:
+        yield c
+
+@pytest_asyncio.fixture
+async def aclient():
+    """Async client calling the ASGI app in-process, for issuing requests concurrently"""
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as c:
+        yield c
+
+@pytest.fixture(scope="module")
+def sanitizer():
+    """One sanitizer for the module; it holds no per-call state"""
+    return InputSanitizer()
 
 class TestInputSanitization:
     """Test suite for input sanitization functionality"""
     
-    def setup_method(self):
-        """Set up test fixtures"""
-        self.sanitizer = InputSanitizer()
-    
-    def test_sanitize_text_basic(self):
+    def test_sanitize_text_basic(self, sanitizer):
         """Test basic text sanitization"""
         # Normal text should pass through
-        result = self.sanitizer.sanitize_text("Hello World")
+        result = sanitizer.sanitize_text("Hello World")
         assert result == "Hello World"
         
         # Empty/None should return empty string
-        assert self.sanitizer.sanitize_text(None) == ""
-        assert self.sanitizer.sanitize_text("") == ""
+        assert sanitizer.sanitize_text(None) == ""
+        assert sanitizer.sanitize_text("") == ""
     
-    def test_sanitize_text_xss_prevention(self):
-        """Test XSS attack prevention"""
+    @pytest.mark.parametrize("malicious_input, forbidden", [
         # Script tags should be removed
-        malicious_input = "<script>alert('xss')</script>Hello"
-        result = self.sanitizer.sanitize_text(malicious_input)
-        assert "<script>" not in result
-        assert "alert" not in result
-        
+        ("<script>alert('xss')</script>Hello", ["<script>", "alert"]),
         # JavaScript URLs should be removed
-        js_url = "javascript:alert('xss')"
-        result = self.sanitizer.sanitize_text(js_url)
-        assert "javascript:" not in result
-        
+        ("javascript:alert('xss')", ["javascript:"]),
         # Event handlers should be removed
-        onclick_attack = "Hello onclick=alert('xss')"
-        result = self.sanitizer.sanitize_text(onclick_attack)
-        assert "onclick" not in result
+        ("Hello onclick=alert('xss')", ["onclick"]),
+    ])
+    def test_sanitize_text_xss_prevention(self, sanitizer, malicious_input, forbidden):
+        """Test XSS attack prevention"""
+        result = sanitizer.sanitize_text(malicious_input)
+        assert all(fragment not in result for fragment in forbidden)
     
-    def test_sanitize_text_sql_injection_prevention(self):
-        """Test SQL injection prevention"""
+    @pytest.mark.parametrize("malicious_input, forbidden", [
         # SQL injection attempts should be blocked
-        sql_injection = "'; DROP TABLE users; --"
-        result = self.sanitizer.sanitize_text(sql_injection)
-        assert "DROP TABLE" not in result
-        assert "--" not in result
-        
+        ("'; DROP TABLE users; --", ["DROP TABLE", "--"]),
         # UNION SELECT should be blocked
-        union_select = "1 UNION SELECT password FROM users"
-        result = self.sanitizer.sanitize_text(union_select)
-        assert "UNION SELECT" not in result
+        ("1 UNION SELECT password FROM users", ["UNION SELECT"]),
+    ])
+    def test_sanitize_text_sql_injection_prevention(self, sanitizer, malicious_input, forbidden):
+        """Test SQL injection prevention"""
+        result = sanitizer.sanitize_text(malicious_input)
+        assert all(fragment not in result for fragment in forbidden)
+    
+    @pytest.mark.parametrize("text, removed", [
+        ("<SCRIPT type='x'>steal()</script>ok", "steal"),
+        ("see document.cookie", "document."),
+        ("x; delete   from policies", "delete"),
+        ("trailing comment --  ", "--"),
+        ("docjavascript:ument.write", "document."),
+    ])
+    def test_sanitize_text_removes_each_pattern(self, sanitizer, text, removed):
+        """Every dangerous pattern is removed, including ones exposed by an earlier removal"""
+        assert removed not in sanitizer.sanitize_text(text).lower()
+    
+    @pytest.mark.parametrize("text", ["Policy 123 - Home", "Window cleaning add-on", "Evaluation (annual)"])
+    def test_sanitize_text_keeps_clean_text(self, sanitizer, text):
+        """Text without dangerous patterns is only escaped"""
+        assert sanitizer.sanitize_text(text) == text
     
-    def test_sanitize_text_length_limit(self):
+    @pytest.mark.skipif(not RE2_AVAILABLE, reason="linear-time matching needs google-re2")
+    def test_sanitize_text_redos(self, sanitizer):
+        """Pathological tag input is handled in linear time"""
+        import time
+        started = time.perf_counter()
+        result = sanitizer.sanitize_text("<script" * 20000, max_length=200000)
+        assert time.perf_counter() - started < 5.0
+        assert "<script" not in result
+    
+    def test_sanitize_text_length_limit(self, sanitizer):
         """Test text length limiting"""
         long_text = "A" * 2000
-        result = self.sanitizer.sanitize_text(long_text, max_length=100)
+        result = sanitizer.sanitize_text(long_text, max_length=100)
         assert len(result) == 100
     
-    def test_sanitize_filename(self):
+    def test_sanitize_filename(self, sanitizer):
         """Test filename sanitization"""
         # Normal filename
-        assert self.sanitizer.sanitize_filename("document.pdf") == "document.pdf"
+        assert sanitizer.sanitize_filename("document.pdf") == "document.pdf"
         
         # Path traversal attempts
-        assert self.sanitizer.sanitize_filename("../../../etc/passwd") == "passwd"
-        assert self.sanitizer.sanitize_filename("..\\..\\windows\\system32") == "system32"
+        assert sanitizer.sanitize_filename("../../../etc/passwd") == "passwd"
+        assert sanitizer.sanitize_filename("..\\..\\windows\\system32") == "system32"
         
         # Dangerous characters
         dangerous = "file<>:\"|?*.txt"
-        result = self.sanitizer.sanitize_filename(dangerous)
+        result = sanitizer.sanitize_filename(dangerous)
         assert not any(char in result for char in '<>:"|?*')
         
         # Empty filename
-        assert self.sanitizer.sanitize_filename("") == "unknown_file"
-        assert self.sanitizer.sanitize_filename(None) == "unknown_file"
+        assert sanitizer.sanitize_filename("") == "unknown_file"
+        assert sanitizer.sanitize_filename(None) == "unknown_file"
     
-    def test_sanitize_email(self):
+    def test_sanitize_email(self, sanitizer):
         """Test email sanitization and validation"""
         # Valid emails
-        assert self.sanitizer.sanitize_email("test@example.com") == "test@example.com"
-        assert self.sanitizer.sanitize_email("USER@EXAMPLE.COM") == "user@example.com"
+        assert sanitizer.sanitize_email("test@example.com") == "test@example.com"
+        assert sanitizer.sanitize_email("USER@EXAMPLE.COM") == "user@example.com"
         
         # Invalid emails
-        assert self.sanitizer.sanitize_email("invalid-email") == ""
-        assert self.sanitizer.sanitize_email("@example.com") == ""
-        assert self.sanitizer.sanitize_email("test@") == ""
-        assert self.sanitizer.sanitize_email(None) == ""
+        assert sanitizer.sanitize_email("invalid-email") == ""
+        assert sanitizer.sanitize_email("@example.com") == ""
+        assert sanitizer.sanitize_email("test@") == ""
+        assert sanitizer.sanitize_email(None) == ""
     
-    def test_sanitize_phone(self):
+    def test_sanitize_phone(self, sanitizer):
         """Test phone number sanitization"""
         # Valid phone numbers
-        assert self.sanitizer.sanitize_phone("123-456-7890") == "123-456-7890"
-        assert self.sanitizer.sanitize_phone("+1 (555) 123-4567") == "+1 (555) 123-4567"
+        assert sanitizer.sanitize_phone("123-456-7890") == "123-456-7890"
+        assert sanitizer.sanitize_phone("+1 (555) 123-4567") == "+1 (555) 123-4567"
         
         # Remove invalid characters
-        result = self.sanitizer.sanitize_phone("123abc456def7890")
+        result = sanitizer.sanitize_phone("123abc456def7890")
         assert "abc" not in result
         assert "def" not in result
         
         # Empty/None
-        assert self.sanitizer.sanitize_phone(None) == ""
-        assert self.sanitizer.sanitize_phone("") == ""
+        assert sanitizer.sanitize_phone(None) == ""
+        assert sanitizer.sanitize_phone("") == ""
     
-    def test_sanitize_policy_data(self):
+    def test_sanitize_policy_data(self, sanitizer):
         """Test comprehensive policy data sanitization"""
         policy_data = {
             "owner_name": "<script>alert('xss')</script>John Doe",
@@ -133,7 +174,7 @@ class TestInputSanitization:
             "invalid_field": "should be ignored"
         }
         
-        result = self.sanitizer.sanitize_policy_data(policy_data)
+        result = sanitizer.sanitize_policy_data(policy_data)
         
         # Check XSS was removed
         assert "<script>" not in result["owner_name"]
@@ -158,99 +199,122 @@ class TestInputSanitization:
         # Check invalid fields were preserved (we only sanitize known fields)
         assert "invalid_field" not in result
 
+@pytest.fixture
+def key_manager(tmp_path):
+    """Fresh API key manager per test, for tests that rotate, deactivate or count keys"""
+    return APIKeyManager(storage_path=str(tmp_path / "test_keys.enc"), key_path=str(tmp_path / "test.key"))
+
+@pytest.fixture(scope="module")
+def shared_key_manager(tmp_path_factory):
+    """One manager for tests that only touch the keys they generate themselves"""
+    keys_dir = tmp_path_factory.mktemp("keys")
+    return APIKeyManager(storage_path=str(keys_dir / "test_keys.enc"), key_path=str(keys_dir / "test.key"))
+
+@pytest.fixture
+def generated_key(key_manager):
+    """A freshly generated key for the test_service service"""
+    return key_manager.generate_api_key("test_service")
+
 class TestAPIKeyManager:
     """Test suite for API key management"""
     
-    def setup_method(self):
-        """Set up test fixtures"""
-        # Use temporary file for testing
-        self.temp_dir = tempfile.mkdtemp()
-        self.key_manager = APIKeyManager(
-            storage_path=os.path.join(self.temp_dir, "test_keys.enc")
-        )
-    
-    def teardown_method(self):
-        """Clean up test fixtures"""
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-    
-    def test_generate_api_key(self):
+    def test_generate_api_key(self, shared_key_manager):
         """Test API key generation"""
         # Generate a key
-        api_key = self.key_manager.generate_api_key("test_service", expires_days=30)
+        api_key = shared_key_manager.generate_api_key("test_service", expires_days=30)
         
         # Key should be generated
         assert api_key is not None
         assert len(api_key) > 20  # Should be reasonably long
         
         # Should be able to validate the key
-        is_valid, metadata = self.key_manager.validate_key(api_key)
+        is_valid, metadata = shared_key_manager.validate_key(api_key)
         assert is_valid is True
         assert metadata["service"] == "test_service"
         assert metadata["is_active"] is True
     
-    def test_rotate_api_key(self):
+    def test_rotate_api_key(self, key_manager):
         """Test API key rotation"""
         # Generate initial key
-        old_key = self.key_manager.generate_api_key("test_service")
+        old_key = key_manager.generate_api_key("test_service")
         
         # Rotate the key
-        new_key = self.key_manager.rotate_key("test_service", old_key)
+        new_key = key_manager.rotate_key("test_service", old_key)
         
         # New key should be different
         assert new_key != old_key
         
         # Old key should be deactivated
-        is_valid, _ = self.key_manager.validate_key(old_key)
+        is_valid, _ = key_manager.validate_key(old_key)
         assert is_valid is False
         
         # New key should be valid
-        is_valid, _ = self.key_manager.validate_key(new_key)
+        is_valid, _ = key_manager.validate_key(new_key)
         assert is_valid is True
     
-    def test_deactivate_key(self):
+    def test_deactivate_key(self, key_manager, generated_key):
         """Test key deactivation"""
-        # Generate a key
-        api_key = self.key_manager.generate_api_key("test_service")
+        api_key = generated_key
         
         # Deactivate it
-        result = self.key_manager.deactivate_key(api_key)
+        result = key_manager.deactivate_key(api_key)
         assert result is True
         
         # Should no longer be valid
-        is_valid, metadata = self.key_manager.validate_key(api_key)
+        is_valid, metadata = key_manager.validate_key(api_key)
         assert is_valid is False
         assert metadata["is_active"] is False
     
-    def test_validate_expired_key(self):
+    def test_validate_expired_key(self, shared_key_manager):
         """Test validation of expired keys"""
         # This would require mocking datetime to test expiration
         # For now, test the basic validation logic
-        api_key = self.key_manager.generate_api_key("test_service")
+        api_key = shared_key_manager.generate_api_key("test_service")
         
         # Valid key
-        is_valid, metadata = self.key_manager.validate_key(api_key)
+        is_valid, metadata = shared_key_manager.validate_key(api_key)
         assert is_valid is True
         assert metadata["usage_count"] == 1
         
         # Second validation should increment usage
-        is_valid, metadata = self.key_manager.validate_key(api_key)
+        is_valid, metadata = shared_key_manager.validate_key(api_key)
         assert is_valid is True
         assert metadata["usage_count"] == 2
-    
-    def test_list_keys(self):
+
+    def test_validate_key_cache_hit(self, key_manager, generated_key):
+        """Test repeated validation is served without re-reading the key store"""
+        loads = []
+        load_keys = key_manager._load_keys
+
+        def counting_load_keys():
+            loads.append(1)
+            return load_keys()
+
+        with patch.object(key_manager, "_load_keys", side_effect=counting_load_keys):
+            assert key_manager.validate_key(generated_key)[0] is True
+            is_valid, metadata = key_manager.validate_key(generated_key)
+
+        assert is_valid is True
+        assert metadata["usage_count"] == 2
+        assert len(loads) == 1
+
+        # Usage counted from the cache survives the next write
+        key_manager.deactivate_key(generated_key)
+        assert key_manager.list_keys()[0]["usage_count"] == 2
+
+    def test_list_keys(self, key_manager):
         """Test key listing"""
         # Generate keys for different services
-        self.key_manager.generate_api_key("service1")
-        self.key_manager.generate_api_key("service2")
-        self.key_manager.generate_api_key("service1")  # Second key for service1
+        key_manager.generate_api_key("service1")
+        key_manager.generate_api_key("service2")
+        key_manager.generate_api_key("service1")  # Second key for service1
         
         # List all keys
-        all_keys = self.key_manager.list_keys()
+        all_keys = key_manager.list_keys()
         assert len(all_keys) == 3
         
         # List keys for specific service
-        service1_keys = self.key_manager.list_keys("service1")
+        service1_keys = key_manager.list_keys("service1")
         assert len(service1_keys) == 2
         assert all(key["service"] == "service1" for key in service1_keys)
         
@@ -293,34 +357,32 @@ class TestExceptionHandling:
 class TestSecurityMiddleware:
     """Test suite for security middleware"""
     
-    def setup_method(self):
-        """Set up test client"""
-        self.client = TestClient(app)
-    
-    def test_security_headers_applied(self):
+    @pytest.mark.asyncio
+    async def test_security_headers_applied(self, aclient):
         """Test that security headers are applied to responses"""
-        # Make a request to any endpoint
-        response = self.client.get("/")
-        
-        # Check for key security headers
-        headers = response.headers
-        
-        # Content Security Policy should be present
-        assert "content-security-policy" in headers
-        
-        # X-Frame-Options should be set
-        assert headers.get("x-frame-options") == "DENY"
-        
-        # X-Content-Type-Options should be set
-        assert headers.get("x-content-type-options") == "nosniff"
-        
-        # X-XSS-Protection should be enabled
-        assert headers.get("x-xss-protection") == "1; mode=block"
+        # Probe several endpoints at once; every response must carry the headers
+        responses = await asyncio.gather(*(aclient.get(path) for path in ("/", "/api/policies", "/api/quotes")))
+        
+        for response in responses:
+            headers = response.headers
+            
+            # Content Security Policy should be present
+            assert "content-security-policy" in headers
+            
+            # X-Frame-Options should be set
+            assert headers.get("x-frame-options") == "DENY"
+            
+            # X-Content-Type-Options should be set
+            assert headers.get("x-content-type-options") == "nosniff"
+            
+            # X-XSS-Protection should be enabled
+            assert headers.get("x-xss-protection") == "1; mode=block"
     
-    def test_cors_restrictions(self):
+    @pytest.mark.asyncio
+    async def test_cors_restrictions(self, aclient):
         """Test CORS restrictions"""
         # Test that CORS headers are properly restricted
-        response = self.client.options("/api/policies")
+        response = await aclient.options("/api/policies")
         
         # Should have CORS headers but restricted origins
         cors_origins = response.headers.get("access-control-allow-origin")
@@ -331,44 +393,40 @@ class TestSecurityMiddleware:
 class TestFileUploadSecurity:
     """Test suite for file upload security"""
     
-    def setup_method(self):
-        """Set up test client with authentication mock"""
-        self.client = TestClient(app)
-        
-        # Mock authentication
-        self.auth_patch = patch('app.core.auth_security.require_auth')
-        self.mock_auth = self.auth_patch.start()
-        self.mock_auth.return_value = {"id": "test_user", "email": "test@example.com"}
-    
-    def teardown_method(self):
-        """Clean up patches"""
-        self.auth_patch.stop()
+    @pytest.fixture(autouse=True)
+    def mock_auth(self, monkeypatch):
+        """Mock authentication; monkeypatch undoes it after each test"""
+        # Routes captured require_auth at import, so override the dependency itself
+        monkeypatch.setitem(
+            app.dependency_overrides,
+            require_auth,
+            lambda: {"id": "test_user", "email": "test@example.com"},
+        )
     
-    def test_file_type_validation(self):
+    def test_file_type_validation(self, client):
         """Test file type validation"""
         # Create a fake file with invalid extension
-        fake_file = io.BytesIO(b"fake content")
+        fake_file = io.BytesIO(FAKE_EXE)
         
-        response = self.client.post(
+        response = client.post(
             "/api/policies/import/pdf",
             files={"file": ("malicious.exe", fake_file, "application/octet-stream")}
         )
         
         # Should reject invalid file types
         assert response.status_code in [400, 422]
-        assert ("not allowed" in response.text.lower() or 
-                "validation" in response.text.lower() or 
-                "invalid" in response.text.lower())
+        body = response.text.lower()
+        assert any(keyword in body for keyword in ("not allowed", "validation", "invalid"))
     
-    def test_filename_sanitization(self):
+    def test_filename_sanitization(self, client):
         """Test filename sanitization in uploads"""
         # Create a file with dangerous filename
         import uuid
-        fake_pdf = io.BytesIO(b"%PDF-1.4 fake pdf content")
+        fake_pdf = io.BytesIO(FAKE_PDF)
         unique_id = str(uuid.uuid4())[:8]
         dangerous_filename = f"../../../etc/passwd_{unique_id}.pdf"
         
-        response = self.client.post(
+        response = client.post(
             "/api/policies/import/pdf",
             files={"file": (dangerous_filename, fake_pdf, "application/pdf")}
         )
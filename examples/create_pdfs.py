@@ -4,83 +4,129 @@ PDF Generator for InsuraIQ Examples
 This script converts HTML policy documents to PDF format for testing the PDF import functionality.
 """
 
+import asyncio
+import importlib.util
 import os
+import shutil
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-def convert_with_weasyprint():
-    """Convert HTML to PDF using WeasyPrint (recommended)"""
+# Looked up once without importing; WeasyPrint's import alone loads cairo and pango
+_HAS_WEASY = importlib.util.find_spec("weasyprint") is not None
+_WKHTMLTOPDF = shutil.which("wkhtmltopdf")
+
+HTML_FILES = (
+    'state_farm_auto_policy.html',
+    'allstate_home_policy.html', 
+    'progressive_commercial_auto.html'
+)
+
+# wkhtmltopdf options for better output
+WKHTMLTOPDF_ARGS = (
+    '--page-size', 'A4',
+    '--margin-top', '0.75in',
+    '--margin-right', '0.75in',
+    '--margin-bottom', '0.75in',
+    '--margin-left', '0.75in',
+    '--encoding', 'UTF-8',
+    '--no-outline',
+)
+
+# Set by _init_weasyprint in each process that renders with WeasyPrint
+_font_config = None
+
+def _init_weasyprint():
+    """Scan fonts once per process instead of once per rendered file"""
+    global _font_config
     try:
-        from weasyprint import HTML
-        
-        html_files = [
-            'state_farm_auto_policy.html',
-            'allstate_home_policy.html', 
-            'progressive_commercial_auto.html'
-        ]
-        
-        print("🔄 Converting HTML files to PDF using WeasyPrint...")
-        
-        for html_file in html_files:
-            if os.path.exists(html_file):
-                pdf_file = html_file.replace('.html', '.pdf')
-                try:
-                    HTML(filename=html_file).write_pdf(pdf_file)
-                    print(f"✅ Created: {pdf_file}")
-                except Exception as e:
-                    print(f"❌ Error converting {html_file}: {e}")
-            else:
-                print(f"❌ File not found: {html_file}")
-                
-        return True
-        
+        from weasyprint.text.fonts import FontConfiguration
     except ImportError:
+        # _render_weasyprint reports the failed import for each file
+        return
+    _font_config = FontConfiguration()
+
+def _render_weasyprint(html_file):
+    """Render one HTML file with WeasyPrint; returns (html_file, pdf_file, error)"""
+    pdf_file = html_file.with_suffix('.pdf')
+    try:
+        from weasyprint import HTML
+        HTML(filename=str(html_file)).write_pdf(str(pdf_file), font_config=_font_config)
+        return html_file, pdf_file, None
+    except Exception as e:
+        return html_file, pdf_file, e
+
+async def _run_wkhtmltopdf(html_file):
+    """Render one HTML file with wkhtmltopdf; returns (html_file, pdf_file, error)"""
+    pdf_file = html_file.with_suffix('.pdf')
+    try:
+        process = await asyncio.create_subprocess_exec(
+            _WKHTMLTOPDF, *WKHTMLTOPDF_ARGS, str(html_file), str(pdf_file),
+            stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.PIPE,
+        )
+        _, stderr = await process.communicate()
+    except OSError as e:
+        return html_file, pdf_file, e
+    if process.returncode != 0:
+        message = stderr.decode(errors='replace').strip().splitlines()
+        return html_file, pdf_file, message[-1] if message else f"exit code {process.returncode}"
+    return html_file, pdf_file, None
+
+async def _render_wkhtmltopdf(html_files):
+    """Run one wkhtmltopdf process per file, all at the same time"""
+    return await asyncio.gather(*(_run_wkhtmltopdf(html_file) for html_file in html_files))
+
+def _report(results):
+    """Print one line per rendered file; True if any PDF was created"""
+    created = False
+    for html_file, pdf_file, error in results:
+        if error is None:
+            print(f"✅ Created: {pdf_file.name}")
+            created = True
+        else:
+            print(f"❌ Error converting {html_file.name}: {error}")
+    return created
+
+def _render_all(render, html_files, initializer=None):
+    """Render every file, in parallel when there is more than one core; True if any PDF was created"""
+    if not html_files:
+        print("❌ No HTML files to convert")
+        return False
+    
+    workers = min(len(html_files), os.cpu_count() or 1)
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers, initializer=initializer) as executor:
+            results = list(executor.map(render, html_files))
+    else:
+        if initializer is not None:
+            initializer()
+        results = [render(html_file) for html_file in html_files]
+    return _report(results)
+
+def convert_with_weasyprint(html_files):
+    """Convert HTML to PDF using WeasyPrint (recommended)"""
+    if not _HAS_WEASY:
         print("❌ WeasyPrint not installed. Install with: pip install weasyprint")
         return False
+    
+    # The render processes import WeasyPrint themselves; this process never needs it
+    print("🔄 Converting HTML files to PDF using WeasyPrint...")
+    return _render_all(_render_weasyprint, html_files, initializer=_init_weasyprint)
 
-def convert_with_pdfkit():
-    """Convert HTML to PDF using pdfkit (requires wkhtmltopdf)"""
-    try:
-        import pdfkit
-        
-        html_files = [
-            'state_farm_auto_policy.html',
-            'allstate_home_policy.html', 
-            'progressive_commercial_auto.html'
-        ]
-        
-        print("🔄 Converting HTML files to PDF using pdfkit...")
-        
-        # Configure pdfkit options for better output
-        options = {
-            'page-size': 'A4',
-            'margin-top': '0.75in',
-            'margin-right': '0.75in',
-            'margin-bottom': '0.75in',
-            'margin-left': '0.75in',
-            'encoding': "UTF-8",
-            'no-outline': None
-        }
-        
-        for html_file in html_files:
-            if os.path.exists(html_file):
-                pdf_file = html_file.replace('.html', '.pdf')
-                try:
-                    pdfkit.from_file(html_file, pdf_file, options=options)
-                    print(f"✅ Created: {pdf_file}")
-                except Exception as e:
-                    print(f"❌ Error converting {html_file}: {e}")
-            else:
-                print(f"❌ File not found: {html_file}")
-                
-        return True
-        
-    except ImportError:
-        print("❌ pdfkit not installed. Install with: pip install pdfkit")
-        print("   Also need wkhtmltopdf: https://wkhtmltopdf.org/downloads.html")
+def convert_with_wkhtmltopdf(html_files):
+    """Convert HTML to PDF by running wkhtmltopdf on every file in parallel"""
+    if _WKHTMLTOPDF is None:
+        print("❌ wkhtmltopdf not found. Install it from: https://wkhtmltopdf.org/downloads.html")
+        return False
+    
+    if not html_files:
+        print("❌ No HTML files to convert")
         return False
+    
+    print("🔄 Converting HTML files to PDF using wkhtmltopdf...")
+    return _report(asyncio.run(_render_wkhtmltopdf(html_files)))
 
-def print_manual_instructions():
+def print_manual_instructions(html_files):
     """Print manual conversion instructions"""
     print("\n📋 MANUAL CONVERSION INSTRUCTIONS:")
     print("=" * 50)
@@ -103,35 +149,43 @@ def print_manual_instructions():
     print("• https://smallpdf.com/html-to-pdf/")
     print()
     print("HTML files ready for conversion:")
-    for html_file in ['state_farm_auto_policy.html', 'allstate_home_policy.html', 'progressive_commercial_auto.html']:
-        if os.path.exists(html_file):
-            print(f"✅ {html_file}")
+    found = {html_file.name for html_file in html_files}
+    for name in HTML_FILES:
+        if name in found:
+            print(f"✅ {name}")
         else:
-            print(f"❌ {html_file} (not found)")
+            print(f"❌ {name} (not found)")
 
 def main():
     print("🚀 InsuraIQ PDF Generator")
     print("=" * 30)
     
-    # Change to the examples directory
-    examples_dir = Path(__file__).parent
-    os.chdir(examples_dir)
-    print(f"📁 Working directory: {os.getcwd()}")
+    # Work on explicit paths so the script runs from any directory
+    examples_dir = Path(__file__).resolve().parent
+    print(f"📁 Examples directory: {examples_dir}")
+    
+    html_files = []
+    for name in HTML_FILES:
+        html_file = examples_dir / name
+        if html_file.is_file():
+            html_files.append(html_file)
+        else:
+            print(f"❌ File not found: {name}")
     
     # Try different conversion methods
     success = False
     
     # Try WeasyPrint first (better CSS support)
     if not success:
-        success = convert_with_weasyprint()
+        success = convert_with_weasyprint(html_files)
     
-    # Try pdfkit as fallback
+    # Try wkhtmltopdf as fallback
     if not success:
-        success = convert_with_pdfkit()
+        success = convert_with_wkhtmltopdf(html_files)
     
     # If both fail, show manual instructions
     if not success:
-        print_manual_instructions()
+        print_manual_instructions(html_files)
     else:
         print("\n🎉 PDF conversion complete!")
         print("\nYou can now test PDF import in InsuraIQ:")